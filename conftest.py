@@ -0,0 +1,45 @@
+"""Shared pytest fixtures for the Wolfy tests"""
+
+import numpy as np
+import pytest
+
+from wolfy_mesh_concert import MusicTheme, WolfyOrchestrator
+
+NUM_NODES = 1500
+
+
+@pytest.fixture
+def run_show():
+    """run_show(engine, beats, **kwargs): a seeded show stepped beat by beat,
+    returned with each beat's wave depth"""
+    def run(engine="python", beats=16, **kwargs):
+        kwargs.setdefault("seed", 7)
+        wolfy = WolfyOrchestrator(kwargs.pop("num_nodes", NUM_NODES), propagation_engine=engine, **kwargs)
+        depths = []
+        for beat in range(beats):
+            wolfy.simulation_time_ms = beat * 500.0
+            wolfy.synchronize_beat(MusicTheme.BLADE_RUNNER)
+            if beat and beat % wolfy.config.rotation_period_beats == 0:
+                wolfy.rotate_leadership()
+            depths.append(wolfy.last_wave_depth)
+        return wolfy, depths
+    return run
+
+
+@pytest.fixture
+def assert_same_show():
+    """assert_same_show(a, b): two orchestrators are at the same point of the same show"""
+    def check(a, b):
+        assert a.beat_count == b.beat_count
+        assert a.simulation_time_ms == b.simulation_time_ms
+        assert a.gateways == b.gateways
+        assert a.conductor_id == b.conductor_id
+        np.testing.assert_array_equal(a.nodes.participation_score, b.nodes.participation_score)
+        np.testing.assert_array_equal(a.nodes.battery, b.nodes.battery)
+        np.testing.assert_array_equal(a.nodes.light_handle, b.nodes.light_handle)
+        assert len(a.participation_history) == len(b.participation_history)
+        for beat in range(len(a.participation_history)):
+            np.testing.assert_array_equal(a.participation_history.participants(beat),
+                                          b.participation_history.participants(beat))
+        assert a.metrics.as_dict() == b.metrics.as_dict()
+    return check
@@ -6,7 +6,8 @@ The complete experience: simulation + visualization + narration
 
 import sys
 import time
-from wolfy_mesh_concert import WolfyOrchestrator, MusicTheme
+from typing import Optional
+from wolfy_mesh_concert import ShowConfig, WolfyOrchestrator, concert_theme_schedule
 from wolfy_visualizer import WolfyVisualizer
 from ryan_gosling_narration import RyanGoslingNarrator
 
@@ -46,7 +47,8 @@ def run_full_concert_experience(
     num_nodes: int = 17000,
     duration_seconds: float = 60.0,
     bpm: float = 120.0,
-    enable_narration: bool = True
+    enable_narration: bool = True,
+    config: Optional[ShowConfig] = None
 ):
     """
     Run the complete Wolfy concert experience:
@@ -68,7 +70,7 @@ def run_full_concert_experience(
     
     # Initialize Wolfy
     print_section_header("🐺 WOLFY INITIALIZATION 🐺")
-    wolfy = WolfyOrchestrator(num_nodes=num_nodes)
+    wolfy = WolfyOrchestrator(num_nodes=num_nodes, config=config)
     
     # Run the concert with live narration
     print_section_header("🎭 CONCERT IN PROGRESS 🎭")
@@ -80,26 +82,7 @@ def run_full_concert_experience(
     beat_interval_ms = (60.0 / bpm) * 1000.0
     total_beats = int((duration_seconds * 1000.0) / beat_interval_ms)
     
-    # Musical structure
-    themes = [
-        (MusicTheme.BLADE_RUNNER, 16),
-        (MusicTheme.PETER_WOLF_BIRD, 8),
-        (MusicTheme.PETER_WOLF_DUCK, 8),
-        (MusicTheme.BLADE_RUNNER, 8),
-        (MusicTheme.PETER_WOLF_CAT, 8),
-        (MusicTheme.PETER_WOLF_WOLF, 12),
-        (MusicTheme.BLADE_RUNNER, 8),
-        (MusicTheme.PETER_WOLF_HUNTERS, 8),
-        (MusicTheme.BLADE_RUNNER, 16),
-    ]
-    
-    theme_schedule = []
-    for theme, beats in themes:
-        theme_schedule.extend([theme] * beats)
-    
-    while len(theme_schedule) < total_beats:
-        theme_schedule.append(MusicTheme.BLADE_RUNNER)
-    theme_schedule = theme_schedule[:total_beats]
+    theme_schedule = concert_theme_schedule(total_beats)
     
     # Run simulation with narration
     wolfy._log_event("concert_start", "🐺 Wolfy's mesh concert begins!", {
@@ -122,7 +105,7 @@ def run_full_concert_experience(
         participating = wolfy.synchronize_beat(current_theme)
         
         # Periodic leadership rotation
-        if beat_num % 16 == 0 and beat_num > 0:
+        if beat_num % wolfy.config.rotation_period_beats == 0 and beat_num > 0:
             wolfy.rotate_leadership()
         
         # Ryan Gosling narration at key moments
@@ -139,7 +122,7 @@ def run_full_concert_experience(
     
     wolfy._log_event("concert_end", "🐺 Concert complete! What a show!", {
         "total_beats": total_beats,
-        "final_participation": len(wolfy.participation_history[-1]) if wolfy.participation_history else 0
+        "final_participation": wolfy.participation_history.count(-1) if wolfy.participation_history else 0
     })
     
     print(f"\n✨ CONCERT COMPLETE ✨\n")
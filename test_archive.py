@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY ARCHIVE TESTS 🧪
+Columnar per-beat show archive, written chunk by chunk and read back by range
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_archive import ConcertArchive
+from wolfy_mesh_concert import MusicTheme, WolfyOrchestrator
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_archive_reads_back_every_beat(tmp_path, compress):
+    path = str(tmp_path / "show")
+    themes = [MusicTheme.BLADE_RUNNER, MusicTheme.PETER_WOLF_DUCK]
+    wolfy = WolfyOrchestrator(1500, seed=2, propagation_engine="frontier")
+    wolfy.open_archive(path, chunk_beats=4, compress=compress)
+    beats = []
+    for beat in range(10):
+        wolfy.simulation_time_ms = beat * 500.0
+        wolfy.synchronize_beat(themes[beat % 2])
+        participants, depths = wolfy.last_wave
+        order = np.argsort(participants)
+        beats.append((participants[order], depths[order], wolfy.last_wave_depth,
+                      wolfy.nodes.battery.astype(np.float32)))
+    wolfy.close()
+
+    archive = ConcertArchive(path)
+    assert archive.num_beats == 10 and archive.num_nodes == 1500
+    assert archive.chunks == [[0, 4], [4, 8], [8, 10]]
+    np.testing.assert_array_equal(archive.read("beat"), np.arange(1, 11))
+    np.testing.assert_array_equal(archive.read("time_ms"), np.arange(10) * 500.0)
+    assert archive.theme_names() == [themes[beat % 2].value for beat in range(10)]
+    np.testing.assert_array_equal(archive.read("wave_depth"), [b[2] for b in beats])
+    np.testing.assert_array_equal(archive.read("participant_count"), [len(b[0]) for b in beats])
+
+    # A range across chunk boundaries opens only the chunks it overlaps
+    participants = archive.read("participants", 3, 9)
+    depths = archive.read("depth", 3, 9)
+    battery = archive.read("battery", 3, 9)
+    assert len(participants) == len(depths) == battery.shape[0] == 6
+    for i, beat in enumerate(range(3, 9)):
+        np.testing.assert_array_equal(participants[i], beats[beat][0])
+        np.testing.assert_array_equal(depths[i], beats[beat][1])
+        np.testing.assert_array_equal(battery[i], beats[beat][3])
+    assert archive.read("battery", 12).shape == (0, 1500)
+
+    assert len(list(archive.events("beat"))) == 10
+    with pytest.raises(KeyError):
+        archive.read("mood")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY AUDIO TESTS 🧪
+Offline tone mixing, spatial rendering and WAV output
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from wolfy_audio import (AudioScore, SpatialMixer, SpatialScore, _tone_samples, render_blocks,
+                         synthesize, write_spatial_wav, write_wav)
+from wolfy_mesh_concert import TonePattern
+
+RATE = 8000
+BEEP = TonePattern(440.0, 50.0, 0.8, 'sine')
+BUZZ = TonePattern(220.0, 30.0, 0.5, 'square')
+
+
+def brute_force_mix(cues, hop_delay_ms, level=0.5):
+    """One voice per node: (start_ms, tone, depths) cues mixed sample by sample"""
+    gain = level / max(len(depths) for _, _, depths in cues)
+    out = np.zeros(RATE)
+    for start_ms, tone, depths in cues:
+        samples = _tone_samples(tone, RATE)
+        for depth in depths:
+            onset = int(round((start_ms + depth * hop_delay_ms) * RATE / 1000.0))
+            out[onset:onset + len(samples)] += gain * samples
+    return out
+
+
+def test_score_groups_participants_by_depth():
+    score = AudioScore(hop_delay_ms=4.0)
+    score.add(100.0, BEEP, np.array([0, 2, 2, 1, 2]))
+    np.testing.assert_array_equal(score.cues[0].voices, [1, 1, 3])
+    assert score.duration_ms == 100.0 + 2 * 4.0 + 50.0
+    assert len(score) == 1
+
+
+@pytest.mark.parametrize("block_size", [333, RATE])
+def test_mix_matches_one_voice_per_node(block_size):
+    cues = [(0.0, BEEP, [0, 1, 1, 2, 3]), (40.0, BUZZ, [0, 0, 1]), (120.0, BEEP, [0, 2, 2, 2])]
+    score = AudioScore(hop_delay_ms=5.0)
+    for start_ms, tone, depths in cues:
+        score.add(start_ms, tone, np.array(depths))
+    mixed = np.concatenate(list(render_blocks(score, RATE, block_size)))
+    assert len(mixed) == int(np.ceil(score.duration_ms * RATE / 1000.0))
+    expected = brute_force_mix(cues, 5.0)
+    np.testing.assert_allclose(mixed, expected[:len(mixed)], atol=1e-5)
+    assert not expected[len(mixed):].any()
+
+
+def test_wav_holds_the_whole_score(tmp_path):
+    score = AudioScore()
+    score.add(0.0, BEEP, np.zeros(10, dtype=np.int64))
+    score.add(500.0, BUZZ, np.array([0, 1, 2]))
+    path = str(tmp_path / "show.wav")
+    stats = write_wav(score, path, sample_rate=RATE, block_size=1000)
+    with wave.open(path, 'rb') as wav:
+        assert (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (1, 2, RATE)
+        frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+    assert len(frames) == int(np.ceil(score.duration_ms * RATE / 1000.0))
+    assert stats["audio_seconds"] == pytest.approx(len(frames) / RATE)
+    # The loudest beat (all ten voices together) is mixed to half scale
+    assert np.abs(frames).max() == pytest.approx(0.5 * 0.8 * 32767, rel=0.01)
+
+
+def test_unknown_waveform_is_rejected():
+    t = np.arange(100) / RATE
+    assert np.abs(synthesize('triangle', 100.0, t)).max() <= 1.0
+    with pytest.raises(ValueError):
+        synthesize('sawtooth', 100.0, t)
+
+
+def test_listener_hears_each_node_late_and_quieter_with_distance():
+    # One node 34.3 m from the first listener (0.1 s of flight) and 4 m
+    # from the second, reached at hop 2 with 5 ms per hop
+    positions = np.array([[0.0, 0.0], [100.0, 100.0]])
+    mixer = SpatialMixer(positions, np.full(2, 5.0), sample_rate=RATE)
+    score = SpatialScore()
+    score.add(0.0, BEEP, np.array([0]), np.array([2]))
+    listeners = [[34.3, 0.0], [0.0, 4.0]]
+    mixed = np.concatenate(list(mixer.render_blocks(score, listeners, level=None)), axis=1)
+
+    tone = _tone_samples(BEEP, RATE)
+    for channel, distance in enumerate([34.3, 4.0]):
+        # The delay falls between two samples; each gets its share of the gain
+        delay = distance / 343.0 * RATE + 2 * 5.0 * RATE / 1000.0
+        tap, frac = int(delay), delay - int(delay)
+        heard = np.zeros(mixed.shape[1] + 1)
+        heard[tap:tap + len(tone)] += (1.0 - frac) * tone / distance
+        heard[tap + 1:tap + 1 + len(tone)] += frac * tone / distance
+        np.testing.assert_allclose(mixed[channel], heard[:mixed.shape[1]], atol=1e-5)
+    assert mixed.shape[1] >= int(34.3 / 343.0 * RATE + 80) + len(tone)
+
+@pytest.mark.parametrize("block_size", [250, RATE])
+def test_spatial_mix_does_not_depend_on_block_size(block_size):
+    rng = np.random.default_rng(5)
+    positions = rng.uniform(0, 60, (200, 2))
+    mixer = SpatialMixer(positions, rng.uniform(3.0, 8.0, 200), sample_rate=RATE)
+    score = SpatialScore()
+    for beat, tone in enumerate([BEEP, BUZZ, BEEP]):
+        ids = rng.choice(200, 50, replace=False)
+        score.add(beat * 150.0, tone, ids, rng.integers(0, 6, 50))
+    listeners = [[0.0, 0.0], [30.0, 30.0], [59.0, 10.0]]
+    reference = np.concatenate(list(mixer.render_blocks(score, listeners, block_size=4 * RATE)), axis=1)
+    mixed = np.concatenate(list(mixer.render_blocks(score, listeners, block_size=block_size)), axis=1)
+    np.testing.assert_allclose(mixed, reference, atol=1e-6)
+    # With level the loudest moment for any listener stays within it
+    assert np.abs(mixed).max() <= 0.5
+
+
+def test_spatial_wav_has_a_channel_per_listener(tmp_path):
+    mixer = SpatialMixer(np.array([[0.0, 0.0], [10.0, 0.0]]), np.full(2, 5.0), sample_rate=RATE)
+    score = SpatialScore()
+    score.add(0.0, BEEP, np.array([0, 1]), np.array([0, 1]))
+    path = str(tmp_path / "spatial.wav")
+    stats = write_spatial_wav(mixer, score, [[1.0, 0.0], [40.0, 0.0]], path, block_size=500)
+    with wave.open(path, 'rb') as wav:
+        assert wav.getnchannels() == 2 and wav.getframerate() == RATE
+        frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2').reshape(-1, 2)
+    assert stats["audio_seconds"] == pytest.approx(len(frames) / RATE)
+    near, far = stats["rms"]
+    assert near > far > 0
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY CHECKPOINT TESTS 🧪
+Saving, loading and resuming a show
+"""
+
+import pytest
+
+from wolfy_mesh_concert import WolfyOrchestrator
+
+
+@pytest.mark.parametrize("engine", WolfyOrchestrator.PROPAGATION_ENGINES)
+def test_checkpoint_resume_matches_uninterrupted_show(tmp_path, engine, assert_same_show):
+    straight = WolfyOrchestrator(1500, seed=3, propagation_engine=engine)
+    straight.simulate_concert(duration_seconds=12.0)
+
+    path = str(tmp_path / "show.ckpt")
+    interrupted = WolfyOrchestrator(1500, seed=3, propagation_engine=engine)
+    interrupted.simulate_concert(duration_seconds=12.0, checkpoint_path=path, checkpoint_every=8)
+    resumed = WolfyOrchestrator.load(path)
+    assert resumed.beat_count == 16
+    resumed.resume_concert()
+    assert_same_show(straight, resumed)
+
+
+def test_checkpoint_round_trip_keeps_state(tmp_path, run_show, assert_same_show):
+    wolfy, _ = run_show("frontier", beats=8)
+    path = str(tmp_path / "show.ckpt")
+    wolfy.save(path)
+    loaded = WolfyOrchestrator.load(path)
+    assert_same_show(wolfy, loaded)
+    assert loaded.last_wave_depth == wolfy.last_wave_depth
+    assert loaded.config == wolfy.config
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY CROWD TESTS 🧪
+Seeded crowd generation and layout registration
+"""
+
+import functools
+
+import numpy as np
+import pytest
+
+import wolfy_crowd
+from wolfy_crowd import LAYOUTS, cluster_layout, generate_crowd, layout_name, register_layout
+from wolfy_mesh_concert import WolfyOrchestrator
+from wolfy_venue_cache import VenueCache
+
+
+@pytest.mark.parametrize("layout", sorted(LAYOUTS))
+def test_same_seed_gives_the_same_crowd(layout):
+    crowd = generate_crowd(2000, (120, 80), seed=11, layout=layout)
+    again = generate_crowd(2000, (120, 80), seed=11, layout=layout)
+    other = generate_crowd(2000, (120, 80), seed=12, layout=layout)
+    for field in ("positions", "consent_strobe", "leadership_score"):
+        np.testing.assert_array_equal(getattr(crowd, field), getattr(again, field))
+        assert not np.array_equal(getattr(crowd, field), getattr(other, field))
+    assert crowd.positions.shape == (2000, 2)
+    assert (crowd.positions >= 0).all() and (crowd.positions <= (120, 80)).all()
+
+
+def test_traits_do_not_depend_on_the_layout():
+    clusters = generate_crowd(1000, (200, 200), seed=3, layout="clusters")
+    seated = generate_crowd(1000, (200, 200), seed=3, layout="seated")
+    np.testing.assert_array_equal(clusters.consent_strobe, seated.consent_strobe)
+    np.testing.assert_array_equal(clusters.leadership_score, seated.leadership_score)
+    with pytest.raises(ValueError):
+        generate_crowd(1000, (200, 200), seed=3, layout="mosh_pit")
+
+
+def test_unregistered_callable_layouts_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(wolfy_crowd, "LAYOUTS", dict(wolfy_crowd.LAYOUTS))
+    cache = VenueCache(str(tmp_path))
+    layout = functools.partial(cluster_layout)
+    assert layout_name(layout) is None
+    WolfyOrchestrator(1500, seed=5, venue_cache=cache, crowd_layout=layout)
+    assert cache.stats["hits"] == cache.stats["misses"] == 0
+
+    register_layout("test_partial_clusters", layout)
+    assert layout_name(layout) == "test_partial_clusters"
+    WolfyOrchestrator(1500, seed=5, venue_cache=cache, crowd_layout=layout)
+    WolfyOrchestrator(1500, seed=5, venue_cache=cache, crowd_layout=layout)
+    assert cache.stats["misses"] == 1 and cache.stats["hits"] == 1
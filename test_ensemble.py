@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY ENSEMBLE TESTS 🧪
+Seeded shows on one shared venue, serial and pooled
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_ensemble import SUMMARY_METRICS, SharedVenue, build_venue, run_ensemble
+from wolfy_mesh_concert import WolfyOrchestrator
+
+SHOW = dict(num_nodes=800, arena_size=(80, 80), venue_seed=1, duration_seconds=6.0)
+
+
+def test_shared_venue_attaches_the_same_mesh():
+    positions, mesh = build_venue(800, (80, 80), venue_seed=1)
+    with SharedVenue(positions, mesh) as shared:
+        shm, shared_positions, shared_mesh = SharedVenue.attach(shared.spec)
+        np.testing.assert_array_equal(shared_positions, positions)
+        np.testing.assert_array_equal(shared_mesh.indptr, mesh.indptr)
+        np.testing.assert_array_equal(shared_mesh.indices, mesh.indices)
+        np.testing.assert_array_equal(shared_mesh.weights, mesh.weights)
+        del shared_positions, shared_mesh
+        shm.close()
+
+
+def test_each_run_is_the_seeded_show_on_the_venue():
+    result = run_ensemble([3, 8], max_workers=1, **SHOW)
+    positions, mesh = build_venue(800, (80, 80), venue_seed=1)
+    for row, seed in zip(result.coverage, result.seeds):
+        wolfy = WolfyOrchestrator(800, (80, 80), seed=seed, venue=(positions, mesh))
+        wolfy.simulate_concert(6.0)
+        np.testing.assert_array_equal(row, wolfy.participation_history.active_counts() / 800)
+    # Runs share the venue but not the audience
+    assert result.statistics[0]["conductor"] != result.statistics[1]["conductor"]
+
+
+def test_pooled_ensemble_matches_serial_ensemble():
+    serial = run_ensemble([3, 8, 11], max_workers=1, **SHOW)
+    pooled = run_ensemble([3, 8, 11], max_workers=2, **SHOW)
+    assert pooled.seeds == serial.seeds == [3, 8, 11]
+    np.testing.assert_array_equal(pooled.coverage, serial.coverage)
+    assert pooled.summary() == serial.summary()
+
+    summary = serial.summary(quantiles=(50,))
+    assert set(summary) == set(SUMMARY_METRICS)
+    rates = serial.values(SUMMARY_METRICS["participation_rate"])
+    assert summary["participation_rate"]["mean"] == pytest.approx(rates.mean())
+    band = serial.coverage_band(quantiles=(50,))
+    np.testing.assert_allclose(band["mean"], serial.coverage.mean(axis=0))
+    np.testing.assert_allclose(band["p50"], np.median(serial.coverage, axis=0))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY EVENT SINK TESTS 🧪
+Background event log writer and compressed show logs
+"""
+
+import gzip
+import json
+
+import pytest
+
+from wolfy_event_sink import EventSink, read_event_stream
+from wolfy_mesh_concert import MusicTheme, WolfyOrchestrator
+
+
+def test_event_sink_flush_and_close(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    sink = EventSink(path)
+    for i in range(5):
+        sink.emit({"type": "beat", "i": i})
+    sink.flush(wait=True)
+    assert [e["i"] for e in read_event_stream(path)] == list(range(5))
+    sink.close()
+    with pytest.raises(ValueError):
+        sink.emit({"type": "late"})
+    with pytest.raises(ValueError):
+        sink.flush()
+    sink.close()  # closing twice is harmless
+
+
+def test_event_sink_write_error_surfaces_without_hanging(tmp_path):
+    sink = EventSink(str(tmp_path / "events.jsonl"))
+    sink._file.close()
+    sink.emit({"type": "beat"})
+    with pytest.raises(IOError):
+        sink.flush(wait=True)
+    sink.close()
+
+
+def test_compressed_event_log_closes_the_show(tmp_path):
+    path = str(tmp_path / "events.jsonl.gz")
+    with WolfyOrchestrator(1500, seed=1, event_log_path=path) as wolfy:
+        wolfy.synchronize_beat(MusicTheme.BLADE_RUNNER)
+        total = wolfy.event_sink.total_events
+        wolfy.export_event_log(str(tmp_path / "log.json"))
+        with pytest.raises(RuntimeError):
+            wolfy.synchronize_beat(MusicTheme.BLADE_RUNNER)
+    with gzip.open(path, 'rt') as f:
+        assert len([json.loads(line) for line in f]) == total
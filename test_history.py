@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY HISTORY TESTS 🧪
+Participation history encoding, keyframes and spilling
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_history import ParticipationHistory
+
+
+@pytest.mark.parametrize("spill", [False, True])
+def test_history_round_trips_through_arrays(tmp_path, spill):
+    rng = np.random.default_rng(0)
+    num_nodes = 500
+    history = ParticipationHistory(num_nodes, keyframe_interval=4)
+    scores = np.zeros(num_nodes)
+    for beat in range(11):
+        # Alternate sparse (id array) and dense (bitset) beats, uniform and mixed deltas
+        ids = rng.choice(num_nodes, 10 if beat % 2 else 400, replace=False)
+        scores[ids] += 1.0 if beat % 3 else rng.random(len(ids))
+        history.record(ids, scores)
+
+    spill_path = str(tmp_path / "history.bin") if spill else None
+    restored = ParticipationHistory.from_arrays(history.to_arrays(), 4, spill_path)
+    assert len(restored) == len(history)
+    for beat in range(len(history)):
+        np.testing.assert_array_equal(restored.participants(beat), history.participants(beat))
+        np.testing.assert_array_equal(restored.scores_at(beat), history.scores_at(beat))
+    restored.close()
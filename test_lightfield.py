@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY LIGHT FIELD TESTS 🧪
+Whole-crowd brightness against the per-node light patterns
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_lightfield import LightField
+
+
+@pytest.fixture
+def lit_show(run_show):
+    wolfy, _ = run_show("frontier", beats=6)
+    return wolfy
+
+
+def test_brightness_matches_each_nodes_pattern(lit_show):
+    nodes = lit_show.nodes
+    field = lit_show.light_field()
+    times = LightField.frame_times(0.0, 1000.0, 30)
+    assert len(times) == 30 and times[-1] == pytest.approx(1000.0 - 1000.0 / 30)
+
+    brightness = field.brightness(times)
+    rgb = field.rgb(times)
+    assert brightness.shape == (30, len(nodes)) and rgb.shape == (30, len(nodes), 3)
+    dark = nodes.light_handle < 0
+    assert dark.any() and not dark.all()
+    assert (brightness[:, dark] == 0).all()
+    for node in np.flatnonzero(~dark)[::50]:
+        pattern = nodes.light_table.lookup(int(nodes.light_handle[node]))
+        expected = [pattern.get_brightness_at(t) for t in times]
+        np.testing.assert_allclose(brightness[:, node], expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(rgb[:, node], np.outer(expected, pattern.color) / 255.0,
+                                   rtol=1e-5, atol=1e-6)
+
+
+def test_light_field_keeps_the_lights_it_was_given(lit_show):
+    field = lit_show.light_field()
+    before = field.brightness(np.array([250.0]))
+    lit_show.nodes.light_handle[:] = -1
+    np.testing.assert_array_equal(field.brightness(np.array([250.0])), before)
+
+
+def test_chunks_cover_the_whole_range(lit_show):
+    field = lit_show.light_field()
+    times = LightField.frame_times(200.0, 2200.0, 24)
+    frame_bytes = len(field) * 4 * 3
+    chunks = list(field.iter_chunks(200.0, 2200.0, 24, rgb=True, max_bytes=5 * frame_bytes))
+    assert [len(t) for t, _ in chunks] == [5] * 9 + [3]
+    np.testing.assert_array_equal(np.concatenate([t for t, _ in chunks]), times)
+    np.testing.assert_array_equal(np.concatenate([v for _, v in chunks]), field.rgb(times))
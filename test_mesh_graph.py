@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY MESH GRAPH TESTS 🧪
+Proximity mesh construction against a brute-force reference
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_mesh_graph import build_proximity_mesh
+
+
+def test_proximity_mesh_matches_brute_force():
+    rng = np.random.default_rng(1)
+    positions = rng.random((400, 2)) * 60.0
+    max_distance = 8.0
+    mesh = build_proximity_mesh(positions, max_distance, cell_size=10.0, backend='grid', chunk_pairs=1000)
+
+    distance = np.linalg.norm(positions[:, None] - positions[None, :], axis=-1)
+    within = (distance <= max_distance) & ~np.eye(len(positions), dtype=bool)
+    assert mesh.num_edges == int(within.sum()) // 2
+    for node in range(len(positions)):
+        expected = np.flatnonzero(within[node])
+        neighbors = mesh.neighbors(node)
+        order = np.argsort(neighbors)
+        np.testing.assert_array_equal(neighbors[order], expected)
+        np.testing.assert_allclose(mesh.signal_strengths(node)[order],
+                                   1.0 - distance[node, expected] / max_distance)
+
+
+def test_proximity_mesh_rejects_cells_smaller_than_the_range():
+    with pytest.raises(ValueError):
+        build_proximity_mesh(np.zeros((4, 2)), 8.0, cell_size=4.0)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY METRICS TESTS 🧪
+Histogram buckets, percentiles and timing labels of ShowMetrics
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from wolfy_mesh_concert import WolfyOrchestrator
+from wolfy_metrics import ShowMetrics
+
+
+def beat(participants, depths, arrivals=None, gateways=(0,), serving=None, time_ms=0.0,
+         latency_ms=5.0, num_nodes=10):
+    """The orchestrator attributes record_beat reads, for a hand-made beat"""
+    if serving is None:
+        serving = np.full(num_nodes, min(gateways))
+    return SimpleNamespace(
+        gateway_assignment=lambda: np.asarray(serving, dtype=np.int64),
+        last_wave=(np.asarray(participants, dtype=np.int64), np.asarray(depths, dtype=np.int16)),
+        last_arrival_ms=None if arrivals is None else np.asarray(arrivals, dtype=np.float64),
+        nodes=SimpleNamespace(latency_ms=np.full(num_nodes, latency_ms)),
+        simulation_time_ms=time_ms, gateways=set(gateways))
+
+
+def prometheus_samples(metrics: ShowMetrics) -> dict:
+    return dict(line.rsplit(" ", 1) for line in metrics.to_prometheus().splitlines()
+                if not line.startswith("#"))
+
+
+def test_hop_estimates_land_in_their_own_le_bucket():
+    metrics = ShowMetrics(10)
+    # Hop estimates are depth x 5 ms: 0, 5, 5, 10, 10, 10
+    metrics.record_beat(beat([0, 1, 2, 3, 4, 5], [0, 1, 1, 2, 2, 2]))
+    samples = prometheus_samples(metrics)
+    assert samples['wolfy_time_to_reach_ms_bucket{le="1"}'] == "1"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="2"}'] == "1"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="5"}'] == "3"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="10"}'] == "6"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="+Inf"}'] == "6"
+    assert float(samples["wolfy_time_to_reach_ms_sum"]) == 40.0
+
+
+def test_le_1000_counts_values_at_the_edge_but_not_past_it():
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat([0, 1, 2], [0, 1, 2], arrivals=[999.5, 1000.0, 1500.0]))
+    samples = prometheus_samples(metrics)
+    assert samples['wolfy_time_to_reach_ms_bucket{le="500"}'] == "0"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="1000"}'] == "2"
+    assert samples['wolfy_time_to_reach_ms_bucket{le="+Inf"}'] == "3"
+
+
+def test_reach_percentiles_are_not_biased_up_a_bin():
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat(range(6), [0, 1, 1, 2, 2, 2]))
+    assert metrics.reach_percentiles() == {"p50": 5.0, "p90": 10.0, "p99": 10.0}
+
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat(range(5), [0] * 5, arrivals=[25.0, 25.0, 25.0, 40.0, 40.0]))
+    assert metrics.reach_percentiles((0.5,)) == {"p50": 25.0}
+    # Times between bin edges round up to the next edge
+    metrics.record_beat(beat([0], [0], arrivals=[24.2]))
+    assert metrics.reach_percentiles((0.1,)) == {"p10": 25.0}
+
+
+def test_timing_label_says_how_times_were_obtained():
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat([0, 1], [0, 1], arrivals=[0.0, 7.5]))
+    assert metrics.as_dict()["timing"] == "simulated"
+    assert "(simulated message arrival)" in metrics.to_prometheus()
+
+    metrics.record_beat(beat([0, 1], [0, 1]))
+    assert metrics.as_dict()["timing"] == "mixed"
+
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat([0, 1], [0, 1]))
+    assert metrics.as_dict()["timing"] == "hop_estimate"
+    assert metrics.to_prometheus().count("(estimated as hop count x node latency)") == 2
+
+
+def test_skew_and_coverage_follow_the_beat():
+    metrics = ShowMetrics(10)
+    metrics.record_beat(beat([0, 1, 2, 3], [0, 1, 1, 3]))
+    metrics.record_beat(beat([0, 1], [0, 1], time_ms=500.0))
+    stats = metrics.as_dict()
+    assert stats["coverage"] == pytest.approx({"last": 0.2, "mean": 0.3, "min": 0.2, "max": 0.4})
+    assert stats["sync_skew_ms"] == {"last": 5.0, "mean": 10.0, "max": 15.0}
+    assert stats["wave_depth_histogram"] == [2, 3, 0, 1]
+
+
+def test_gateway_load_counts_participants_per_serving_gateway():
+    metrics = ShowMetrics(10)
+    # Gateways 0 and 5 serve their halves; node 9 is cut off from both
+    serving = [0, 0, 0, 0, 0, 5, 5, 5, 5, -1]
+    metrics.record_beat(beat([0, 1, 2, 3, 5, 9], [0, 1, 1, 2, 0, 3], gateways=(0, 5), serving=serving))
+    load = metrics.as_dict()["gateway_load"]
+    assert load["participants_served_mean"] == 2.5
+    assert load["participants_served_max"] == 4
+    assert load["participants_unserved"] == 1
+
+    metrics.record_beat(beat([5, 6], [0, 1], gateways=(0, 5), serving=serving))
+    load = metrics.as_dict()["gateway_load"]
+    assert (load["participants_served_mean"], load["participants_served_max"]) == (1.0, 2)
+    assert load["participants_served_max_ever"] == 4
+    assert load["distinct_gateways"] == 2 and load["max_beats_as_gateway"] == 2
+
+
+def test_gateway_assignment_follows_the_gateway_bfs():
+    wolfy = WolfyOrchestrator(1500, seed=4)
+    roots = wolfy.gateway_assignment()
+    hops = wolfy.gateway_hop_distance()
+    assert set(roots[roots >= 0].tolist()) <= wolfy.gateways
+    assert np.array_equal(roots >= 0, hops >= 0)
+    for gateway in wolfy.gateways:
+        assert roots[gateway] == gateway
+    # Every node below a gateway shares its BFS parent's gateway
+    _, depth, parent = wolfy.wave_layers(sorted(wolfy.gateways))
+    children = np.flatnonzero(depth > 0)
+    assert np.array_equal(roots[children], roots[parent[children]])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY PROPAGATION TESTS 🧪
+Beat propagation engines and the cached wave layering
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_mesh_concert import MusicTheme, ShowConfig, WolfyOrchestrator
+from wolfy_mesh_graph import MeshGraph
+
+
+def grid_venue(rows, cols):
+    """A rows x cols lattice with equal links, so the first message a node
+    gets always comes along a fewest-hops path"""
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    positions = np.argwhere(ids >= 0).astype(float)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return positions, MeshGraph.from_edges(rows * cols, src, dst, np.ones(len(src)))
+
+
+def grid_show(venue, engine, **kwargs):
+    positions, _ = venue
+    wolfy = WolfyOrchestrator(len(positions), arena_size=(20, 20), seed=4, venue=venue,
+                              propagation_engine=engine, **kwargs)
+    # Equal latencies keep the event engine's arrival order in step with the hop count
+    wolfy.nodes.latency_ms[:] = 5.0
+    wolfy.nodes.leadership_score[:] = np.random.default_rng(0).uniform(0, 0.6, len(positions))
+    return wolfy
+
+
+def test_frontier_engine_matches_python_engine(run_show, assert_same_show):
+    for mode in WolfyOrchestrator.PROPAGATION_MODES:
+        python, python_depths = run_show("python", beats=24, propagation_mode=mode)
+        frontier, frontier_depths = run_show("frontier", beats=24, propagation_mode=mode)
+        assert python_depths == frontier_depths
+        np.testing.assert_array_equal(python.last_wave[0], frontier.last_wave[0])
+        np.testing.assert_array_equal(python.last_wave[1], frontier.last_wave[1])
+        assert_same_show(python, frontier)
+
+
+def test_wave_cache_counts_only_beats_the_layering_produced(run_show, monkeypatch):
+    decision_passes = []
+    layered = WolfyOrchestrator._propagate_layered
+
+    def counting(self, *args):
+        decision_passes.append(self.beat_count)
+        return layered(self, *args)
+
+    monkeypatch.setattr(WolfyOrchestrator, "_propagate_layered", counting)
+    wolfy, _ = run_show("frontier", beats=40)
+    stats = wolfy.wave_cache_stats
+    assert stats["fast_path_beats"] > 0 and stats["fallback_beats"] > 0
+    assert stats["fast_path_beats"] + stats["fallback_beats"] == 40
+    # A hit is a beat an already built layering produced, never a fallback
+    assert stats["hits"] <= stats["fast_path_beats"]
+    assert stats["hits"] >= stats["fast_path_beats"] - stats["misses"]
+    # Fallbacks the relays' energy threshold predicts skip the decision pass
+    assert len(decision_passes) == stats["fast_path_beats"]
+
+
+@pytest.mark.parametrize("max_depth", [6, 40])
+@pytest.mark.parametrize("mode", WolfyOrchestrator.PROPAGATION_MODES)
+def test_every_engine_reports_the_same_wave(mode, max_depth):
+    venue = grid_venue(20, 20)
+    shows = [grid_show(venue, engine, propagation_mode=mode,
+                       config=ShowConfig(num_gateways=3, max_depth=max_depth))
+             for engine in WolfyOrchestrator.PROPAGATION_ENGINES]
+    # 800 ms beats run through a whole energy swing: full, thinning and dying waves
+    for beat in range(16):
+        waves = []
+        for wolfy in shows:
+            wolfy.simulation_time_ms = beat * 800.0
+            wolfy.synchronize_beat(MusicTheme.BLADE_RUNNER)
+            participants, depths = wolfy.last_wave
+            order = np.argsort(participants)
+            waves.append((wolfy.last_wave_depth, participants[order].tolist(), depths[order].tolist()))
+        assert waves[0] == waves[1] == waves[2]
+        assert 1 <= waves[0][0] <= max_depth
+
+
+@pytest.mark.parametrize("engine", WolfyOrchestrator.PROPAGATION_ENGINES)
+def test_wave_depth_counts_nodes_that_declined(engine):
+    # 0 - 1 - 2 - 3 - 4, led from 0: node 2 gets the beat at hop 2 but its
+    # threshold (0.3 + 0.4 * 1.0) is not below the energy at t=0 (0.7)
+    venue = grid_venue(1, 5)
+    wolfy = grid_show(venue, engine, config=ShowConfig(num_gateways=1))
+    wolfy.conductor_id = 0
+    wolfy.nodes.leadership_score[:] = 0.0
+    wolfy.nodes.leadership_score[2] = 1.0
+    wolfy.synchronize_beat(MusicTheme.BLADE_RUNNER)
+    participants, depths = wolfy.last_wave
+    assert sorted(zip(participants.tolist(), depths.tolist())) == [(0, 0), (1, 1)]
+    assert wolfy.last_wave_depth == 3
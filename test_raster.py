@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY RASTER TESTS 🧪
+Density raster splatting and tiled full-crowd renders
+"""
+
+import numpy as np
+import pytest
+
+from wolfy_raster import DensityRaster, iter_tiles, render_crowd
+
+
+def test_points_land_in_their_pixel():
+    raster = DensityRaster((0.0, 0.0, 10.0, 5.0), 0.5)
+    assert (raster.width, raster.height) == (20, 10)
+    raster.add_points(np.array([[0.2, 0.2], [9.9, 4.9], [9.8, 4.6], [12.0, 1.0]]),
+                      np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.5, 0.0], [1.0, 1.0, 1.0]]))
+    # Row 0 is the bottom of the window; points outside it are dropped
+    np.testing.assert_array_equal(raster.image[0, 0], [1.0, 0.0, 0.0])
+    np.testing.assert_array_equal(raster.image[9, 19], [0.0, 1.5, 0.0])
+    assert raster.image.sum() == pytest.approx(2.5)
+
+
+def test_glow_keeps_a_lone_point_at_full_brightness():
+    raster = DensityRaster((0.0, 0.0, 20.0, 20.0), 1.0)
+    raster.add_points(np.array([[10.5, 10.5]]), np.array([[1.0, 1.0, 1.0]]), glow_sigma_px=2.0)
+    assert raster.image[10, 10, 0] == pytest.approx(1.0, rel=0.02)
+    assert raster.image[10, 12, 0] == pytest.approx(np.exp(-0.5), rel=0.02)
+    assert raster.image[..., 0].sum() == pytest.approx(2 * np.pi * 4.0, rel=0.02)
+
+
+def test_segments_ink_every_pixel_they_cross():
+    raster = DensityRaster((0.0, 0.0, 10.0, 4.0), 1.0)
+    raster.add_segments(np.array([[0.5, 1.5]]), np.array([[9.5, 1.5]]), (1.0, 0.0, 0.0))
+    inked = raster.image[..., 0] > 0
+    assert inked[1].all() and not inked[[0, 2, 3]].any()
+    assert raster.image[..., 1:].max() == 0.0
+
+
+def test_tiles_cover_the_window_once():
+    bounds = (-3.0, 2.0, 50.0, 31.0)
+    covered = np.zeros((29, 53), dtype=int)
+    for row, col, (x0, y0, x1, y1) in iter_tiles(bounds, 1.0, 16):
+        assert x1 - x0 <= 16 and y1 - y0 <= 16
+        covered[int(y0 - 2):int(y1 - 2), int(x0 + 3):int(x1 + 3)] += 1
+    assert (covered == 1).all()
+    assert row == 1 and col == 3
+
+
+def test_tiled_render_matches_a_single_render():
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(0, 64, (400, 2))
+    src, dst = rng.integers(0, 400, (2, 300))
+    edges = (src, dst, rng.uniform(0.3, 1.0, 300))
+    bounds = (0.0, 0.0, 64.0, 64.0)
+    kwargs = dict(edges=edges, glow_sigma_px=0.0, max_link_samples=None)
+    whole = render_crowd(bounds, 0.5, positions, (0.2, 0.4, 1.0), **kwargs).image
+
+    stitched = np.zeros_like(whole)
+    for _, _, tile in iter_tiles(bounds, 0.5, 32):
+        part = render_crowd(tile, 0.5, positions, (0.2, 0.4, 1.0), **kwargs).image
+        row, col = int(tile[1] / 0.5), int(tile[0] / 0.5)
+        stitched[row:row + part.shape[0], col:col + part.shape[1]] = part
+    np.testing.assert_allclose(stitched, whole, rtol=1e-6)
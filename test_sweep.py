@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY SWEEP TESTS 🧪
+Config grids, random draws, Pareto ranking and sweeps over shared venues
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from wolfy_ensemble import build_venue
+from wolfy_mesh_concert import ShowConfig, WolfyOrchestrator
+from wolfy_sweep import _pareto, grid_configs, random_configs, run_sweep
+
+
+def test_grid_skips_invalid_combinations():
+    configs = grid_configs(num_gateways=[5, 10], max_depth=[0, 4, 8])
+    assert [(c.num_gateways, c.max_depth) for c in configs] == [(5, 4), (5, 8), (10, 4), (10, 8)]
+    assert all(c.min_signal == ShowConfig().min_signal for c in configs)
+
+
+def test_random_configs_are_seeded_and_in_range():
+    ranges = dict(num_gateways=(1, 40), min_signal=(0.1, 0.6), max_depth=[4, 8, 12])
+    configs = random_configs(20, seed=3, **ranges)
+    assert configs == random_configs(20, seed=3, **ranges)
+    assert configs != random_configs(20, seed=4, **ranges)
+    assert len(configs) == 20
+    for config in configs:
+        assert isinstance(config.num_gateways, int) and 1 <= config.num_gateways <= 40
+        assert 0.1 <= config.min_signal <= 0.6 and config.max_depth in (4, 8, 12)
+
+
+def test_pareto_keeps_only_undominated_rows():
+    coverage = np.array([0.9, 0.9, 0.8, 0.95, 0.7])
+    latency = np.array([40.0, 50.0, 30.0, 60.0, 30.0])
+    np.testing.assert_array_equal(_pareto(coverage, latency), [True, False, True, True, False])
+
+
+def test_sweep_builds_one_venue_per_topology(tmp_path):
+    configs = grid_configs(max_connection_distance=[6.0, 9.0], max_depth=[3, 10])
+    result = run_sweep(configs, num_nodes=800, arena_size=(80, 80), venue_seed=2,
+                       duration_seconds=4.0, max_workers=1)
+    assert result.venues_built == 2
+    assert [(row["max_connection_distance"], row["max_depth"]) for row in result.rows] == \
+        [(c.max_connection_distance, c.max_depth) for c in configs]
+
+    # Each row is the show that config gives on its own venue
+    config = configs[3]
+    positions, mesh = build_venue(800, (80, 80), 2, config=config)
+    wolfy = WolfyOrchestrator(800, (80, 80), seed=0, venue=(positions, mesh),
+                              propagation_engine="frontier", config=config)
+    wolfy.simulate_concert(4.0)
+    stats = wolfy.get_statistics()
+    assert result.rows[3]["coverage"] == pytest.approx(stats["metrics"]["coverage"]["mean"])
+    assert result.rows[3]["reach_p90_ms"] == pytest.approx(stats["metrics"]["time_to_reach_ms"]["p90"])
+
+    ranked = result.ranked()
+    keys = [(-row["coverage"], row["reach_p90_ms"]) for row in ranked]
+    assert keys == sorted(keys)
+    assert ranked[0]["pareto"]
+
+    path = str(tmp_path / "sweep.csv")
+    result.to_csv(path)
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row["rank"]) for row in rows] == [1, 2, 3, 4]
+    assert "max_depth" in result.table().splitlines()[0]
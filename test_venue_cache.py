@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY VENUE CACHE TESTS 🧪
+Generated venues cached on disk by their generation parameters
+"""
+
+import numpy as np
+
+from wolfy_mesh_concert import ShowConfig, WolfyOrchestrator
+from wolfy_venue_cache import VenueCache
+
+
+def test_venue_cache_hit_returns_the_same_venue(tmp_path):
+    cache = VenueCache(str(tmp_path))
+    first = WolfyOrchestrator(1500, seed=5, venue_cache=cache)
+    second = WolfyOrchestrator(1500, seed=5, venue_cache=cache)
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+    np.testing.assert_array_equal(first.nodes.positions, second.nodes.positions)
+    np.testing.assert_array_equal(first.mesh.indptr, second.mesh.indptr)
+    np.testing.assert_array_equal(first.mesh.indices, second.mesh.indices)
+    np.testing.assert_array_equal(first.mesh.weights, second.mesh.weights)
+
+
+def test_venue_cache_key_follows_venue_params():
+    base = WolfyOrchestrator(1500, seed=5)
+    keys = {VenueCache.key(base.venue_params())}
+    for kwargs in ({"seed": 6}, {"seed": 5, "crowd_layout": "floor"},
+                   {"seed": 5, "arena_size": (150, 150)}):
+        keys.add(VenueCache.key(WolfyOrchestrator(1500, **kwargs).venue_params()))
+    assert len(keys) == 4
+    # Knobs that leave the mesh alone must not split the cache
+    tuned = WolfyOrchestrator(1500, seed=5, config=ShowConfig(num_gateways=10))
+    assert VenueCache.key(tuned.venue_params()) == VenueCache.key(base.venue_params())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+🧪 WOLFY VISUALIZER TESTS 🧪
+Beat-by-beat animation frames
+"""
+
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from wolfy_visualizer import WolfyVisualizer
+
+
+@pytest.fixture
+def visualizer(run_show):
+    wolfy, _ = run_show("frontier", beats=6, num_nodes=400, arena_size=(60, 60))
+    return WolfyVisualizer(wolfy)
+
+
+def test_png_frames_fade_the_same_from_any_start(tmp_path, visualizer):
+    written = visualizer.create_beat_animation(str(tmp_path / "wave.png"), trail_beats=2, dpi=30)
+    assert written == [str(tmp_path / f"wave_{beat:04d}.png") for beat in range(6)]
+    assert all(os.path.getsize(frame) for frame in written)
+
+    # A run of frames replays the trail first, so it matches the full pass
+    tail = visualizer._save_beat_frames(str(tmp_path / "tail"), 3, 6, 2, 30)
+    assert len(tail) == 3
+    for full, part in zip(written[3:], tail):
+        np.testing.assert_array_equal(plt.imread(full), plt.imread(part))
+
+
+def test_pooled_frames_match_serial_frames(tmp_path, visualizer):
+    serial = visualizer.create_beat_animation(str(tmp_path / "serial.png"), trail_beats=2, dpi=30)
+    pooled = visualizer.create_beat_animation(str(tmp_path / "pooled.png"), trail_beats=2, dpi=30,
+                                              max_workers=2)
+    assert len(pooled) == len(serial) == 6
+    for a, b in zip(serial, pooled):
+        np.testing.assert_array_equal(plt.imread(a), plt.imread(b))
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+🗄️ WOLFY CONCERT ARCHIVE 🗄️
+Columnar, chunked per-beat record of a show for post-show analytics
+"""
+
+import json
+import os
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from wolfy_event_sink import EventSink, read_event_stream
+
+# Column name -> (kind, dtype)
+#   scalar: one value per beat
+#   ragged: a variable-length array per beat (participants and their depth)
+#   dense:  one value per node per beat
+COLUMNS = {
+    "beat": ("scalar", "int32"),
+    "time_ms": ("scalar", "float64"),
+    "theme": ("scalar", "uint8"),
+    "participant_count": ("scalar", "int32"),
+    "wave_depth": ("scalar", "int16"),
+    "participants": ("ragged", "int32"),
+    "depth": ("ragged", "int16"),
+    "battery": ("dense", "float32"),
+    "state": ("dense", "uint8"),
+}
+
+MANIFEST = "manifest.json"
+EVENTS = "events.jsonl.gz"
+
+
+def _chunk_file(path: str, column: str, chunk: int, compressed: bool) -> str:
+    return os.path.join(path, f"{column}.{chunk:05d}.{'npz' if compressed else 'npy'}")
+
+
+class ConcertArchiveWriter:
+    """Appends beats to an on-disk columnar archive, one chunk at a time.
+
+    Every ``chunk_beats`` beats each column is written to its own plain
+    ``.npy`` file, which readers memory-map, and the manifest is rewritten,
+    so a crashed show still leaves a readable archive. ``compress=True``
+    writes ``np.savez_compressed`` chunks instead: several times smaller on
+    disk, but they cannot be memory-mapped, so every read decompresses whole
+    chunks. Events stream to a gzipped JSONL file.
+    """
+
+    def __init__(self, path: str, num_nodes: int, chunk_beats: int = 32, compress: bool = False):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.num_nodes = num_nodes
+        self.chunk_beats = chunk_beats
+        self.compress = compress
+        self.num_beats = 0
+        self.chunks: List[List[int]] = []
+        self.themes: Dict[str, int] = {}
+        self.events = EventSink(os.path.join(path, EVENTS))
+        self._pending: Dict[str, list] = {name: [] for name in COLUMNS}
+
+    def record_beat(self, wolfy) -> None:
+        """Capture the beat the orchestrator just synchronized"""
+        participants, depths = wolfy.last_wave
+        order = np.argsort(participants, kind='stable')
+        theme = wolfy.current_theme.value
+        pending = self._pending
+        pending["beat"].append(wolfy.beat_count)
+        pending["time_ms"].append(wolfy.simulation_time_ms)
+        pending["theme"].append(self.themes.setdefault(theme, len(self.themes)))
+        pending["participant_count"].append(len(participants))
+        pending["wave_depth"].append(wolfy.last_wave_depth)
+        pending["participants"].append(participants[order].astype(np.int32))
+        pending["depth"].append(depths[order].astype(np.int16))
+        pending["battery"].append(wolfy.nodes.battery.astype(np.float32))
+        pending["state"].append(wolfy.nodes.state.copy())
+        self.num_beats += 1
+        if len(pending["beat"]) >= self.chunk_beats:
+            self._write_chunk()
+
+    def record_event(self, event: Dict) -> None:
+        self.events.emit(event)
+
+    def _write_chunk(self) -> None:
+        pending = self._pending
+        if not pending["beat"]:
+            return
+        chunk = len(self.chunks)
+        for name, (kind, dtype) in COLUMNS.items():
+            values = pending[name]
+            if kind == "ragged":
+                offsets = np.zeros(len(values) + 1, dtype=np.int64)
+                np.cumsum([len(v) for v in values], out=offsets[1:])
+                arrays = {"values": np.concatenate(values).astype(dtype), "offsets": offsets}
+            else:
+                arrays = {"data": np.asarray(values, dtype=dtype)}
+            target = _chunk_file(self.path, name, chunk, self.compress)
+            if self.compress:
+                np.savez_compressed(target, **arrays)
+            elif kind == "ragged":
+                np.save(target, arrays["values"])
+                np.save(target[:-4] + ".offsets.npy", arrays["offsets"])
+            else:
+                np.save(target, arrays["data"])
+            values.clear()
+
+        start = self.chunks[-1][1] if self.chunks else 0
+        self.chunks.append([start, self.num_beats])
+        self._write_manifest()
+        self.events.flush()
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "num_nodes": self.num_nodes,
+            "num_beats": self.chunks[-1][1] if self.chunks else 0,
+            "compressed": self.compress,
+            "chunks": self.chunks,
+            "columns": {name: list(spec) for name, spec in COLUMNS.items()},
+            "themes": self.themes,
+        }
+        tmp = os.path.join(self.path, MANIFEST + ".tmp")
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, MANIFEST))
+
+    def close(self) -> None:
+        """Write the final partial chunk and close the event stream"""
+        self._write_chunk()
+        self._write_manifest()
+        self.events.close()
+
+
+class ConcertArchive:
+    """Reads columns of a ConcertArchiveWriter archive for a beat range.
+
+    Only the chunk files overlapping the requested beats of the requested
+    column are opened. Uncompressed chunks (the default) are memory-mapped;
+    compressed ones are decompressed in full on every read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            manifest = json.load(f)
+        self.num_nodes: int = manifest["num_nodes"]
+        self.num_beats: int = manifest["num_beats"]
+        self.compressed: bool = manifest["compressed"]
+        self.chunks: List[List[int]] = manifest["chunks"]
+        self.columns: Dict[str, str] = {name: spec[0] for name, spec in manifest["columns"].items()}
+        self.themes: List[str] = sorted(manifest["themes"], key=manifest["themes"].get)
+
+    def _load_chunk(self, column: str, chunk: int) -> Dict[str, np.ndarray]:
+        target = _chunk_file(self.path, column, chunk, self.compressed)
+        if self.compressed:
+            with np.load(target) as npz:
+                return {key: npz[key] for key in npz.files}
+        if self.columns[column] == "ragged":
+            return {"values": np.load(target, mmap_mode='r'),
+                    "offsets": np.load(target[:-4] + ".offsets.npy")}
+        return {"data": np.load(target, mmap_mode='r')}
+
+    def read(self, column: str, start: int = 0, stop: Optional[int] = None):
+        """Values of one column for beats [start, stop) (archive order, 0-based).
+
+        Scalar columns return a 1-D array, dense columns a (beats x nodes)
+        array, ragged columns a list with one array per beat.
+        """
+        if column not in self.columns:
+            raise KeyError(f"unknown archive column: {column!r}")
+        stop = self.num_beats if stop is None else min(stop, self.num_beats)
+        kind = self.columns[column]
+        parts = []
+        for chunk, (first, last) in enumerate(self.chunks):
+            if last <= start or first >= stop:
+                continue
+            lo, hi = max(start, first) - first, min(stop, last) - first
+            arrays = self._load_chunk(column, chunk)
+            if kind == "ragged":
+                values, offsets = arrays["values"], arrays["offsets"]
+                parts.extend(np.asarray(values[offsets[i]:offsets[i + 1]]) for i in range(lo, hi))
+            else:
+                parts.append(np.asarray(arrays["data"][lo:hi]))
+        if kind == "ragged":
+            return parts
+        if not parts:
+            shape = (0, self.num_nodes) if kind == "dense" else (0,)
+            return np.empty(shape, dtype=COLUMNS[column][1])
+        return np.concatenate(parts)
+
+    def theme_names(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Theme value of each beat in the range"""
+        return [self.themes[code] for code in self.read("theme", start, stop)]
+
+    def events(self, event_type: Optional[str] = None) -> Iterator[Dict]:
+        """Stream the archived events, optionally only one type"""
+        for event in read_event_stream(os.path.join(self.path, EVENTS)):
+            if event_type is None or event["type"] == event_type:
+                yield event
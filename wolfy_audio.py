@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+🔊 WOLFY AUDIO 🔊
+Offline synthesis of the crowd's per-beat tones into a WAV file
+"""
+
+import time
+import wave
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from wolfy_mesh_concert import MusicEngine, MusicTheme, TonePattern
+
+# Linear fade in/out on every voice so tone edges don't click
+FADE_MS = 5.0
+
+SPEED_OF_SOUND = 343.0  # m/s
+
+
+def _archived_beats(archive) -> Iterator[Tuple[float, TonePattern, np.ndarray, np.ndarray]]:
+    """(time_ms, tone, participants, depths) of every beat in a ConcertArchive"""
+    columns = [archive.read(name) for name in ("beat", "time_ms", "participants", "depth")]
+    for (beat, time_ms, participants, depths), theme in zip(zip(*columns), archive.theme_names()):
+        tone = MusicEngine.get_tone_for_theme(MusicTheme(theme), int(beat))
+        yield float(time_ms), tone, participants, depths
+
+
+@dataclass(frozen=True)
+class ToneCue:
+    """One beat's tone: every participant plays it, delayed by its hop depth"""
+    start_ms: float
+    tone: TonePattern
+    voices: np.ndarray  # voices[d] = number of nodes playing at hop depth d
+
+
+class AudioScore:
+    """Per-beat tones of a show, with participants grouped into voices.
+
+    Every participant of a beat plays the same tone, offset only by how many
+    hops the wave took to reach it, so a beat is stored as one voice count
+    per depth instead of one voice per node. hop_delay_ms is the time a hop
+    adds (the nodes' default latency).
+    """
+
+    def __init__(self, hop_delay_ms: float = 5.0):
+        self.hop_delay_ms = hop_delay_ms
+        self.cues: List[ToneCue] = []
+
+    def add(self, start_ms: float, tone: TonePattern, depths: np.ndarray) -> None:
+        """Add a beat whose participants were reached at the given hop depths"""
+        voices = np.bincount(np.asarray(depths, dtype=np.int64), minlength=0)
+        self.cues.append(ToneCue(start_ms, tone, voices))
+
+    def record_beat(self, wolfy) -> None:
+        """Capture the beat the orchestrator just synchronized"""
+        _, depths = wolfy.last_wave
+        tone = MusicEngine.get_tone_for_theme(wolfy.current_theme, wolfy.beat_count)
+        self.add(wolfy.simulation_time_ms, tone, depths)
+
+    @classmethod
+    def from_archive(cls, archive, hop_delay_ms: float = 5.0) -> "AudioScore":
+        """Rebuild the score of a show recorded with WolfyOrchestrator.open_archive"""
+        score = cls(hop_delay_ms)
+        for time_ms, tone, _, depths in _archived_beats(archive):
+            score.add(time_ms, tone, depths)
+        return score
+
+    def cue_end_ms(self, cue: ToneCue) -> float:
+        return cue.start_ms + max(len(cue.voices) - 1, 0) * self.hop_delay_ms + cue.tone.duration_ms
+
+    @property
+    def duration_ms(self) -> float:
+        return max((self.cue_end_ms(cue) for cue in self.cues), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self.cues)
+
+
+def synthesize(waveform: str, frequency: float, t: np.ndarray) -> np.ndarray:
+    """Unit-amplitude sine, square or triangle wave at times t (seconds)"""
+    if waveform == 'sine':
+        return np.sin(2 * np.pi * frequency * t)
+    cycle = (frequency * t) % 1.0
+    if waveform == 'square':
+        return np.where(cycle < 0.5, 1.0, -1.0)
+    if waveform == 'triangle':
+        return 4.0 * np.abs(cycle - 0.5) - 1.0
+    raise ValueError(f"unknown waveform: {waveform!r}")
+
+
+def _tone_samples(tone: TonePattern, sample_rate: int) -> np.ndarray:
+    """One voice of a tone, volume applied and edges faded"""
+    count = max(1, int(round(tone.duration_ms * sample_rate / 1000.0)))
+    samples = synthesize(tone.waveform, tone.frequency, np.arange(count) / sample_rate) * tone.volume
+    fade = min(count // 2, int(FADE_MS * sample_rate / 1000.0))
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade, endpoint=False)
+        samples[:fade] *= ramp
+        samples[count - fade:] *= ramp[::-1]
+    return samples.astype(np.float32)
+
+
+def render_blocks(score: AudioScore, sample_rate: int = 44100, block_size: int = 44100,
+                  level: float = 0.5) -> Iterator[np.ndarray]:
+    """Mix the score into float32 mono blocks of block_size samples.
+
+    Each cue's tone is synthesized once and added at each depth's onset,
+    scaled by that depth's voice count, so the cost follows the number of
+    beats and depths rather than the crowd size. The loudest single beat is
+    mixed to ``level``, leaving headroom for overlapping tones.
+    """
+    cues = sorted(score.cues, key=lambda cue: cue.start_ms)
+    peak_voices = max((int(cue.voices.sum()) for cue in cues), default=0)
+    gain = level / peak_voices if peak_voices else 0.0
+    total = int(np.ceil(score.duration_ms * sample_rate / 1000.0))
+    hop = score.hop_delay_ms * sample_rate / 1000.0
+
+    # (onset samples per depth, weights, tone samples) of cues still sounding
+    active = []
+    next_cue = 0
+    for block_start in range(0, total, block_size):
+        block_end = min(block_start + block_size, total)
+        while next_cue < len(cues) and cues[next_cue].start_ms * sample_rate / 1000.0 < block_end:
+            cue = cues[next_cue]
+            next_cue += 1
+            depths = np.flatnonzero(cue.voices)
+            if not len(depths):
+                continue
+            onsets = np.round(cue.start_ms * sample_rate / 1000.0 + depths * hop).astype(np.int64)
+            active.append((onsets, cue.voices[depths] * gain, _tone_samples(cue.tone, sample_rate)))
+
+        block = np.zeros(block_end - block_start, dtype=np.float32)
+        for onsets, weights, samples in active:
+            for onset, weight in zip(onsets.tolist(), weights.tolist()):
+                lo, hi = max(onset, block_start), min(onset + len(samples), block_end)
+                if lo < hi:
+                    block[lo - block_start:hi - block_start] += np.float32(weight) * samples[lo - onset:hi - onset]
+        active = [voice for voice in active if voice[0][-1] + len(voice[2]) > block_end]
+        yield block
+
+
+def write_wav(score: AudioScore, filename: str = "wolfy_concert.wav", sample_rate: int = 44100,
+              block_size: int = 44100, level: float = 0.5) -> Dict[str, float]:
+    """Stream the mixed score to a 16-bit mono WAV file, one block at a time"""
+    print(f"🔊 Rendering audio ({len(score)} beats, {score.duration_ms / 1000.0:.1f}s)...")
+    start = time.perf_counter()
+    samples = 0
+    with wave.open(filename, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        for block in render_blocks(score, sample_rate, block_size, level):
+            out.writeframes((np.clip(block, -1.0, 1.0) * 32767).astype('<i2').tobytes())
+            samples += len(block)
+    elapsed = time.perf_counter() - start
+    seconds = samples / sample_rate
+    print(f"   ✓ Audio saved to {filename} ({seconds:.1f}s of audio in {elapsed:.2f}s, "
+          f"{seconds / max(elapsed, 1e-9):.0f}x real time)")
+    return {"audio_seconds": seconds, "render_seconds": elapsed}
+
+
+@dataclass(frozen=True)
+class SpatialCue:
+    """One beat's tone and exactly which nodes played it, at which hop depth"""
+    start_ms: float
+    tone: TonePattern
+    participants: np.ndarray
+    depths: np.ndarray
+
+
+class SpatialScore:
+    """Per-beat tones that keep the participating node ids, for SpatialMixer"""
+
+    def __init__(self):
+        self.cues: List[SpatialCue] = []
+
+    def add(self, start_ms: float, tone: TonePattern, participants: np.ndarray, depths: np.ndarray) -> None:
+        self.cues.append(SpatialCue(start_ms, tone, np.asarray(participants, dtype=np.int64),
+                                    np.asarray(depths, dtype=np.int64)))
+
+    def record_beat(self, wolfy) -> None:
+        """Capture the beat the orchestrator just synchronized"""
+        participants, depths = wolfy.last_wave
+        tone = MusicEngine.get_tone_for_theme(wolfy.current_theme, wolfy.beat_count)
+        self.add(wolfy.simulation_time_ms, tone, participants, depths)
+
+    @classmethod
+    def from_archive(cls, archive) -> "SpatialScore":
+        """Rebuild the score of a show recorded with WolfyOrchestrator.open_archive"""
+        score = cls()
+        for time_ms, tone, participants, depths in _archived_beats(archive):
+            score.add(time_ms, tone, participants, depths)
+        return score
+
+    def __len__(self) -> int:
+        return len(self.cues)
+
+
+class SpatialMixer:
+    """What listeners at given (x, y) positions hear from every participating node.
+
+    A node's sound reaches a listener after its mesh delay (hop depth times
+    the node's latency_ms) plus distance / speed of sound, attenuated by
+    1 / distance (clamped at min_distance). All participants of a beat play
+    the same tone, so per beat and listener the crowd is one impulse
+    response: each node's gain split linearly between the two samples around
+    its fractional delay. The tone is then convolved with every listener's
+    response in a single batched FFT, so cost grows with listeners x
+    participants for the responses, not with samples x sources.
+    """
+
+    def __init__(self, positions: np.ndarray, latency_ms: np.ndarray, sample_rate: int = 44100,
+                 speed_of_sound: float = SPEED_OF_SOUND, min_distance: float = 1.0):
+        self.positions = np.asarray(positions, dtype=np.float64)
+        self.latency_ms = np.asarray(latency_ms, dtype=np.float64)
+        self.sample_rate = sample_rate
+        self.speed_of_sound = speed_of_sound
+        self.min_distance = min_distance
+
+    @classmethod
+    def from_orchestrator(cls, wolfy, **kwargs) -> "SpatialMixer":
+        return cls(wolfy.nodes.positions, wolfy.nodes.latency_ms, **kwargs)
+
+    def _delays_and_gains(self, cue: SpatialCue, listeners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(listeners x participants) delay in samples and gain"""
+        sources = self.positions[cue.participants]
+        distance = np.hypot(listeners[:, None, 0] - sources[None, :, 0],
+                            listeners[:, None, 1] - sources[None, :, 1])
+        delay_s = distance / self.speed_of_sound + cue.depths * self.latency_ms[cue.participants] / 1000.0
+        return delay_s * self.sample_rate, 1.0 / np.maximum(distance, self.min_distance)
+
+    def impulse_responses(self, cue: SpatialCue, listeners: np.ndarray) -> Tuple[int, np.ndarray]:
+        """(first sample offset, listeners x taps) response of the crowd for one beat"""
+        delay, gain = self._delays_and_gains(cue, listeners)
+        base = int(np.floor(delay.min()))
+        delay -= base
+        tap = np.floor(delay).astype(np.int64)
+        frac = delay - tap
+        taps = int(tap.max()) + 2
+        flat = (np.arange(len(listeners))[:, None] * taps + tap).ravel()
+        size = len(listeners) * taps
+        response = (np.bincount(flat, (gain * (1.0 - frac)).ravel(), minlength=size) +
+                    np.bincount(flat + 1, (gain * frac).ravel(), minlength=size))
+        return base, response.reshape(len(listeners), taps)
+
+    def _peak_gain(self, score: SpatialScore, listeners: np.ndarray) -> float:
+        """Upper bound of any listener's amplitude over the show"""
+        peak = 0.0
+        for cue in score.cues:
+            if len(cue.participants):
+                _, gain = self._delays_and_gains(cue, listeners)
+                peak = max(peak, float(gain.sum(axis=1).max()) * cue.tone.volume)
+        return peak
+
+    def render_blocks(self, score: SpatialScore, listeners, block_size: int = 44100,
+                      level: Optional[float] = 0.5) -> Iterator[np.ndarray]:
+        """Mix the show for every listener into (listeners x block_size) float32 blocks.
+
+        Beats are overlap-added into a rolling buffer and blocks are emitted
+        once no later beat can reach them. With ``level`` the loudest
+        possible moment for any listener is scaled to it (one shared scale,
+        so listeners stay comparable); with None gains are relative to a
+        source at 1 m.
+        """
+        listeners = np.asarray(listeners, dtype=np.float64).reshape(-1, 2)
+        cues = sorted((cue for cue in score.cues if len(cue.participants)), key=lambda cue: cue.start_ms)
+        scale = 1.0
+        if level is not None:
+            peak = self._peak_gain(score, listeners)
+            scale = level / peak if peak else 0.0
+
+        mix = np.zeros((len(listeners), 0), dtype=np.float64)
+        origin, end, next_cue = 0, 0, 0
+        while next_cue < len(cues) or origin < end:
+            block_end = origin + block_size
+            while next_cue < len(cues) and cues[next_cue].start_ms * self.sample_rate / 1000.0 < block_end:
+                cue = cues[next_cue]
+                next_cue += 1
+                base, response = self.impulse_responses(cue, listeners)
+                tone = _tone_samples(cue.tone, self.sample_rate)
+                length = response.shape[1] + len(tone) - 1
+                n = 1 << (length - 1).bit_length()
+                wet = np.fft.irfft(np.fft.rfft(response, n) * np.fft.rfft(tone, n), n)[:, :length]
+                
+                onset = int(round(cue.start_ms * self.sample_rate / 1000.0)) + base - origin
+                if onset + length > mix.shape[1]:
+                    mix = np.pad(mix, ((0, 0), (0, onset + length - mix.shape[1])))
+                mix[:, onset:onset + length] += wet * scale
+                end = max(end, origin + onset + length)
+            if next_cue >= len(cues):
+                block_end = min(block_end, end)
+            
+            width = block_end - origin
+            block = np.zeros((len(listeners), width), dtype=np.float32)
+            ready = min(width, mix.shape[1])
+            block[:, :ready] = mix[:, :ready]
+            mix = mix[:, ready:]
+            origin = block_end
+            yield block
+
+
+def write_spatial_wav(mixer: SpatialMixer, score: SpatialScore, listeners,
+                      filename: str = "wolfy_spatial.wav", block_size: int = 44100,
+                      level: Optional[float] = 0.5) -> Dict[str, object]:
+    """Stream a 16-bit WAV with one channel per listener position"""
+    listeners = np.asarray(listeners, dtype=np.float64).reshape(-1, 2)
+    print(f"🎧 Rendering spatial audio ({len(score)} beats, {len(listeners)} listeners)...")
+    start = time.perf_counter()
+    samples = 0
+    energy = np.zeros(len(listeners))
+    with wave.open(filename, 'wb') as out:
+        out.setnchannels(len(listeners))
+        out.setsampwidth(2)
+        out.setframerate(mixer.sample_rate)
+        for block in mixer.render_blocks(score, listeners, block_size, level):
+            energy += np.square(block, dtype=np.float64).sum(axis=1)
+            out.writeframes((np.clip(block.T, -1.0, 1.0) * 32767).astype('<i2').tobytes())
+            samples += block.shape[1]
+    elapsed = time.perf_counter() - start
+    seconds = samples / mixer.sample_rate
+    print(f"   ✓ Spatial audio saved to {filename} ({seconds:.1f}s x {len(listeners)} channels "
+          f"in {elapsed:.2f}s, {seconds / max(elapsed, 1e-9):.0f}x real time)")
+    return {"audio_seconds": seconds, "render_seconds": elapsed,
+            "rms": np.sqrt(energy / max(samples, 1)).tolist()}
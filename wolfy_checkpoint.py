@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+💾 WOLFY CHECKPOINT 💾
+Single-file binary snapshots of a show: a JSON header plus raw,
+memory-mappable arrays
+"""
+
+import json
+import os
+import struct
+from typing import Dict, Tuple
+
+import numpy as np
+
+MAGIC = b"WOLFYCK1"
+ALIGN = 64  # every array starts on a 64-byte boundary
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+
+def save_checkpoint(path: str, header: Dict, arrays: Dict[str, np.ndarray]) -> int:
+    """Write header (JSON-serializable) and arrays to path; returns bytes written.
+
+    Layout: MAGIC, little-endian u64 header length, JSON header, then each
+    array's raw C-order bytes at the offset the header records. The file is
+    written next to path and renamed into place, so a crash mid-save never
+    leaves a torn checkpoint.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    table, offset = {}, 0
+    for name, array in arrays.items():
+        table[name] = [array.dtype.str, list(array.shape), offset]
+        offset = _aligned(offset + array.nbytes)
+    blob = json.dumps(dict(header, arrays=table)).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(blob))
+
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC + struct.pack('<Q', len(blob)) + blob)
+        for name, array in arrays.items():
+            f.seek(data_start + table[name][2])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp, path)
+    return data_start + offset
+
+
+def load_checkpoint(path: str) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """(header, arrays) of a checkpoint.
+
+    Arrays are copy-on-write memory maps: pages are read from disk on first
+    touch, and writes stay private to this process.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Wolfy checkpoint")
+        (length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(length))
+    data_start = _aligned(len(MAGIC) + 8 + length)
+
+    arrays = {}
+    for name, (dtype, shape, offset) in header.pop("arrays").items():
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(path, dtype=dtype, mode='c', offset=data_start + offset,
+                                     shape=tuple(shape))
+    return header, arrays
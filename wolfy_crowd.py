@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+👥 WOLFY CROWD GENERATOR 👥
+Seeded, vectorized placement of the audience and their traits
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# A layout places n nodes in an arena: (rng, n, (width, height)) -> (n x 2) meters
+Layout = Callable[[np.random.Generator, int, Tuple[float, float]], np.ndarray]
+
+
+def cluster_layout(rng: np.random.Generator, num_nodes: int, arena_size: Tuple[float, float],
+                   num_clusters: int = 20, spread: float = 15.0) -> np.ndarray:
+    """Sections of fans gathered around random centers (the original venue)"""
+    width, height = arena_size
+    centers = np.column_stack([rng.uniform(10, width - 10, num_clusters),
+                               rng.uniform(10, height - 10, num_clusters)])
+    positions = centers[rng.integers(0, num_clusters, num_nodes)] + rng.normal(0, spread, (num_nodes, 2))
+    return np.clip(positions, 0, arena_size)
+
+
+def seated_layout(rng: np.random.Generator, num_nodes: int, arena_size: Tuple[float, float],
+                  jitter: float = 0.15) -> np.ndarray:
+    """Rows of seats filling the arena front to back, one node per seat"""
+    width, height = arena_size
+    cols = max(1, int(np.ceil(np.sqrt(num_nodes * width / height))))
+    rows = -(-num_nodes // cols)
+    seat = np.arange(num_nodes)
+    # Row 0 is the front (the stage sits at y = height)
+    positions = np.column_stack([(seat % cols + 0.5) * width / cols,
+                                 height - (seat // cols + 0.5) * height / rows])
+    positions += rng.normal(0, jitter, (num_nodes, 2))
+    return np.clip(positions, 0, arena_size)
+
+
+def floor_layout(rng: np.random.Generator, num_nodes: int, arena_size: Tuple[float, float]) -> np.ndarray:
+    """General admission: packed against the stage, thinning toward the back"""
+    width, height = arena_size
+    x = rng.normal(width / 2, width / 4, num_nodes)
+    y = height - rng.exponential(height / 3, num_nodes)
+    return np.clip(np.column_stack([x, y]), 0, arena_size)
+
+
+LAYOUTS: Dict[str, Layout] = {
+    "clusters": cluster_layout,
+    "seated": seated_layout,
+    "floor": floor_layout,
+}
+
+
+@dataclass(frozen=True)
+class Crowd:
+    """Positions and traits of every node"""
+    positions: np.ndarray
+    consent_strobe: np.ndarray
+    leadership_score: np.ndarray
+
+
+def register_layout(name: str, layout: Layout) -> None:
+    """Make a custom layout available by name (and so cacheable and checkpointable)"""
+    if LAYOUTS.get(name, layout) is not layout:
+        raise ValueError(f"crowd layout {name!r} is already registered")
+    LAYOUTS[name] = layout
+
+
+def layout_name(layout: Union[str, Layout, None]) -> Optional[str]:
+    """Registered name of a layout, or None for an unregistered callable.
+
+    Only a name identifies a layout: two lambdas, closures or partials can
+    share a module and qualname yet place the crowd differently, so
+    unregistered callables never key a cache or a checkpoint.
+    """
+    if layout is None or isinstance(layout, str):
+        return layout
+    for name, registered in LAYOUTS.items():
+        if registered is layout:
+            return name
+    return None
+
+
+def _streams(seed: int) -> Tuple[np.random.Generator, np.random.Generator]:
+    # Positions and traits use independent streams, so traits can be drawn
+    # again without placing the crowd (e.g. around cached positions)
+    placement, traits = np.random.SeedSequence(seed).spawn(2)
+    return np.random.default_rng(placement), np.random.default_rng(traits)
+
+
+def crowd_positions(num_nodes: int, arena_size: Tuple[float, float], seed: int,
+                    layout: Union[str, Layout] = "clusters") -> np.ndarray:
+    """(n x 2) positions from a named layout or any Layout callable"""
+    if layout is None:
+        raise ValueError("a crowd layout is required to place the crowd")
+    if isinstance(layout, str):
+        if layout not in LAYOUTS:
+            raise ValueError(f"unknown crowd layout: {layout!r}")
+        layout = LAYOUTS[layout]
+    positions = layout(_streams(seed)[0], num_nodes, tuple(float(v) for v in arena_size))
+    return np.ascontiguousarray(positions, dtype=np.float64)
+
+
+def crowd_traits(num_nodes: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(consent_strobe, leadership_score) for every node"""
+    rng = _streams(seed)[1]
+    return rng.random(num_nodes) > 0.3, rng.random(num_nodes)
+
+
+def generate_crowd(num_nodes: int, arena_size: Tuple[float, float], seed: Optional[int] = None,
+                   layout: Union[str, Layout] = "clusters") -> Crowd:
+    """Place and characterize a whole crowd; the same seed gives the same crowd"""
+    if seed is None:
+        seed = fresh_seed()
+    consent_strobe, leadership_score = crowd_traits(num_nodes, seed)
+    return Crowd(crowd_positions(num_nodes, arena_size, seed, layout), consent_strobe, leadership_score)
+
+
+def fresh_seed() -> int:
+    """A random 64-bit seed, for shows that didn't ask for one"""
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
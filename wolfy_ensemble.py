@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+🎲 WOLFY ENSEMBLE 🎲
+Many seeded concerts on one venue, fanned out over a process pool
+"""
+
+import contextlib
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from wolfy_crowd import layout_name
+from wolfy_mesh_concert import ShowConfig, WolfyOrchestrator
+from wolfy_mesh_graph import MeshGraph
+from wolfy_shared import SharedArrays, pool_workers
+
+# Scalars pulled out of each run's get_statistics() for summaries
+SUMMARY_METRICS: Dict[str, Tuple[str, ...]] = {
+    "participation_rate": ("participation_rate",),
+    "avg_participation_score": ("avg_participation_score",),
+    "coverage_mean": ("metrics", "coverage", "mean"),
+    "coverage_min": ("metrics", "coverage", "min"),
+    "sync_skew_ms_mean": ("metrics", "sync_skew_ms", "mean"),
+    "sync_skew_ms_max": ("metrics", "sync_skew_ms", "max"),
+    "time_to_reach_ms_p50": ("metrics", "time_to_reach_ms", "p50"),
+    "time_to_reach_ms_p90": ("metrics", "time_to_reach_ms", "p90"),
+    "distinct_gateways": ("metrics", "gateway_load", "distinct_gateways"),
+    "battery_level": ("metrics", "battery_drain", "mean_level"),
+}
+
+
+class SharedVenue(SharedArrays):
+    """A venue's positions and CSR mesh in one shared memory block"""
+
+    def __init__(self, positions: np.ndarray, mesh: MeshGraph):
+        super().__init__({"positions": np.asarray(positions, dtype=np.float64),
+                          "indptr": mesh.indptr, "indices": mesh.indices, "weights": mesh.weights})
+
+    @staticmethod
+    def attach(spec) -> Tuple[SharedMemory, np.ndarray, MeshGraph]:
+        """(block, positions, mesh) views of a venue shared by another process"""
+        shm, views = SharedArrays.attach(spec)
+        return shm, views["positions"], MeshGraph(views["indptr"], views["indices"], views["weights"])
+
+
+@dataclass
+class EnsembleResult:
+    """Per-run statistics and coverage series of an ensemble, in seed order"""
+    seeds: List[int]
+    statistics: List[Dict]
+    coverage: np.ndarray  # runs x beats, fraction of the crowd taking part
+    run_seconds: np.ndarray
+    wall_seconds: float
+
+    def values(self, path: Sequence[str]) -> np.ndarray:
+        """One statistic across runs, by key path into get_statistics()"""
+        values = []
+        for stats in self.statistics:
+            for key in path:
+                stats = stats[key]
+            values.append(stats)
+        return np.asarray(values, dtype=np.float64)
+
+    def summary(self, quantiles: Sequence[float] = (5, 50, 95)) -> Dict[str, Dict[str, float]]:
+        """Mean, std and percentiles of every SUMMARY_METRICS entry"""
+        summary = {}
+        for name, path in SUMMARY_METRICS.items():
+            values = self.values(path)
+            summary[name] = dict({"mean": float(values.mean()), "std": float(values.std())},
+                                 **{f"p{q:g}": float(v) for q, v in zip(quantiles, np.percentile(values, quantiles))})
+        return summary
+
+    def coverage_band(self, quantiles: Sequence[float] = (5, 50, 95)) -> Dict[str, np.ndarray]:
+        """Per-beat coverage mean and percentiles across runs"""
+        band = {"mean": self.coverage.mean(axis=0)}
+        band.update({f"p{q:g}": row for q, row in zip(quantiles, np.percentile(self.coverage, quantiles, axis=0))})
+        return band
+
+
+# Venues this worker process has attached to, by shared memory block name
+_worker_venues: Dict[str, Tuple[SharedMemory, np.ndarray, MeshGraph]] = {}
+
+
+def _quiet(verbose: bool):
+    return contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+
+def _run_show(index: int, seed: int, positions: np.ndarray, mesh: MeshGraph, show_kwargs: Dict,
+              duration_seconds: float, bpm: float, verbose: bool) -> Dict:
+    start = time.perf_counter()
+    with _quiet(verbose):
+        wolfy = WolfyOrchestrator(len(positions), seed=seed, venue=(positions, mesh), **show_kwargs)
+        wolfy.simulate_concert(duration_seconds, bpm)
+    return {"index": index, "seed": seed, "statistics": wolfy.get_statistics(),
+            "coverage": wolfy.participation_history.active_counts() / wolfy.num_nodes,
+            "seconds": time.perf_counter() - start}
+
+
+def _run_shared_show(spec, index: int, seed: int, *args) -> Dict:
+    if spec[0] not in _worker_venues:
+        _worker_venues[spec[0]] = SharedVenue.attach(spec)
+    _, positions, mesh = _worker_venues[spec[0]]
+    return _run_show(index, seed, positions, mesh, *args)
+
+
+def build_venue(num_nodes: int, arena_size: Tuple[float, float], venue_seed: int,
+                crowd_layout="clusters", config: Optional[ShowConfig] = None, venue_cache=None,
+                verbose: bool = False) -> Tuple[np.ndarray, MeshGraph]:
+    """(positions, mesh) of a seeded venue, through the venue cache when one is given"""
+    with _quiet(verbose):
+        wolfy = WolfyOrchestrator(num_nodes, arena_size, seed=venue_seed, venue_cache=venue_cache,
+                                  crowd_layout=crowd_layout, config=config)
+    return wolfy.nodes.positions, wolfy.mesh
+
+
+def run_shows(venues: Dict[Hashable, Tuple[np.ndarray, MeshGraph]],
+              shows: Sequence[Tuple[Hashable, int, Dict]], duration_seconds: float = 60.0,
+              bpm: float = 120.0, workers: int = 1, verbose: bool = False,
+              on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+    """Run (venue key, seed, show kwargs) shows, in a process pool when workers > 1.
+
+    Every venue goes into shared memory once; workers attach to a venue the
+    first time one of its shows lands on them. Results (index, seed,
+    statistics, per-beat coverage, seconds) come back in show order, and
+    on_result sees each one as it finishes. Shows are independent, so the
+    pool only shortens wall time when it has spare cores; resolve workers
+    with pool_workers().
+    """
+    results: List[Optional[Dict]] = [None] * len(shows)
+
+    def collect(result: Dict) -> None:
+        results[result["index"]] = result
+        if on_result is not None:
+            on_result(result)
+
+    if workers == 1:
+        for index, (key, seed, show_kwargs) in enumerate(shows):
+            collect(_run_show(index, seed, *venues[key], show_kwargs, duration_seconds, bpm, verbose))
+        return results
+
+    with contextlib.ExitStack() as stack:
+        specs = {key: stack.enter_context(SharedVenue(*venues[key])).spec
+                 for key in {key for key, _, _ in shows}}
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        futures = [pool.submit(_run_shared_show, specs[key], index, seed, show_kwargs,
+                               duration_seconds, bpm, verbose)
+                   for index, (key, seed, show_kwargs) in enumerate(shows)]
+        for future in as_completed(futures):
+            collect(future.result())
+    return results
+
+
+def run_ensemble(seeds: Union[int, Iterable[int]], num_nodes: int = 17000,
+                 arena_size: Tuple[float, float] = (200, 200), venue_seed: int = 0,
+                 crowd_layout="clusters", duration_seconds: float = 60.0, bpm: float = 120.0,
+                 max_workers: Optional[int] = None, venue_cache=None, verbose: bool = False,
+                 **show_kwargs) -> EnsembleResult:
+    """Run one concert per seed on a single venue and collect the results.
+
+    The venue (positions and mesh) comes from venue_seed, through the venue
+    cache when one is given; each run's seed draws the audience traits
+    (strobe consent, leadership), so runs differ in who leads and who joins
+    but not in where anyone stands. Extra keyword arguments (e.g.
+    propagation_engine, config) go to every WolfyOrchestrator. seeds may be
+    a count, meaning seeds 0..n-1.
+    """
+    seeds = list(range(seeds)) if isinstance(seeds, int) else [int(s) for s in seeds]
+    workers = pool_workers(max_workers, len(seeds))
+    # Shows get the layout by name only: they never place the crowd, and custom
+    # callables need not pickle
+    show_kwargs = dict(show_kwargs, arena_size=arena_size, crowd_layout=layout_name(crowd_layout))
+
+    positions, mesh = build_venue(num_nodes, arena_size, venue_seed, crowd_layout,
+                                  show_kwargs.get("config"), venue_cache, verbose)
+    print(f"🎲 Ensemble: {len(seeds)} shows on venue {venue_seed} "
+          f"({num_nodes:,} nodes, {mesh.num_edges:,} links) across {workers} worker(s)")
+
+    done = []
+
+    def report(result: Dict) -> None:
+        done.append(result["index"])
+        print(f"   ✓ seed {result['seed']}: {result['coverage'].mean() * 100:.1f}% mean coverage "
+              f"in {result['seconds']:.1f}s ({len(done)}/{len(seeds)})")
+
+    start = time.perf_counter()
+    results = run_shows({venue_seed: (positions, mesh)}, [(venue_seed, seed, show_kwargs) for seed in seeds],
+                        duration_seconds, bpm, workers, verbose, report)
+    wall_seconds = time.perf_counter() - start
+
+    beats = max((len(r["coverage"]) for r in results), default=0)
+    coverage = np.zeros((len(results), beats))
+    for row, result in zip(coverage, results):
+        row[:len(result["coverage"])] = result["coverage"]
+    run_seconds = np.array([r["seconds"] for r in results])
+    print(f"   ✓ {len(seeds)} shows in {wall_seconds:.1f}s "
+          f"({len(seeds) / max(wall_seconds, 1e-9):.2f} shows/s)")
+    return EnsembleResult(seeds, [r["statistics"] for r in results], coverage, run_seconds, wall_seconds)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+📡 WOLFY EVENT SINK 📡
+Streams the concert event log to disk as JSON Lines
+"""
+
+import gzip
+import io
+import json
+import queue
+import threading
+from collections import deque
+from typing import Dict, Iterator, Optional
+
+# Writer-thread control messages
+_FLUSH = object()
+_CLOSE = object()
+
+
+def _open_text(path: str, mode: str, compression: Optional[str]):
+    """Open a (possibly compressed) text stream; mode is 'r' or 'w'"""
+    if compression is None:
+        return open(path, mode, encoding='utf-8')
+    if compression == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("the zstandard package is required for .zst event logs") from e
+        raw = open(path, mode + 'b')
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    raise ValueError(f"unknown compression: {compression!r}")
+
+
+def _compression_for(path: str) -> Optional[str]:
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return None
+
+
+class EventSink:
+    """Writes events as JSON Lines from a background thread.
+
+    ``emit`` only enqueues (blocking if the bounded queue is full, so a slow
+    disk applies back-pressure instead of growing memory). The last
+    ``ring_size`` events stay available in ``recent`` for live statistics.
+    Compression follows the file suffix (.gz or .zst) unless given.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None,
+                 queue_size: int = 10000, ring_size: int = 1000):
+        self.path = path
+        self.compression = compression if compression is not None else _compression_for(path)
+        self.recent: deque = deque(maxlen=ring_size)
+        self.total_events = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._file = _open_text(path, 'w', self.compression)
+        self._error: Optional[BaseException] = None
+        self.closed = False
+        self._thread = threading.Thread(target=self._run, name="wolfy-event-sink", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _CLOSE:
+                    self._file.close()
+                    return
+                if item is _FLUSH:
+                    self._file.flush()
+                elif isinstance(item, threading.Event):
+                    try:
+                        self._file.flush()
+                    finally:
+                        item.set()  # never leave flush(wait=True) hanging
+                else:
+                    self._file.write(json.dumps(item))
+                    self._file.write('\n')
+            except BaseException as e:  # surfaced on the caller's next flush/close
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def emit(self, event: Dict) -> None:
+        """Queue one event for writing"""
+        if self.closed:
+            raise ValueError(f"event sink for {self.path} is closed")
+        self.recent.append(event)
+        self.total_events += 1
+        self._queue.put(event)
+
+    def flush(self, wait: bool = False) -> None:
+        """Ask the writer to flush; with wait=True block until everything is on disk.
+
+        A write error from the writer thread is raised here (or by close).
+        """
+        if self.closed:
+            raise ValueError(f"event sink for {self.path} is closed")
+        if wait:
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+        else:
+            self._queue.put(_FLUSH)
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write out everything queued and close the file"""
+        self.closed = True
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise IOError(f"event sink failed writing {self.path}") from error
+
+    def read_events(self) -> Iterator[Dict]:
+        """Stream back every event written so far"""
+        if not self.closed:
+            if self.compression is not None:
+                raise ValueError("close the sink before reading back a compressed event log")
+            self.flush(wait=True)
+        return read_event_stream(self.path, self.compression)
+
+
+def read_event_stream(path: str, compression: Optional[str] = None) -> Iterator[Dict]:
+    """Iterate over the events in a JSON Lines event log"""
+    if compression is None:
+        compression = _compression_for(path)
+    with _open_text(path, 'r', compression) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_event_log_json(f, statistics: Dict, events) -> None:
+    """Write {"statistics": ..., "events": [...]} exactly like json.dump(indent=2),
+    streaming the events so they are never all held in memory"""
+    header = json.dumps({"statistics": statistics}, indent=2)
+    f.write(header[:-2] + ',\n  "events": [')
+    first = True
+    for event in events:
+        f.write('\n' if first else ',\n')
+        f.write('\n'.join('    ' + line for line in json.dumps(event, indent=2).split('\n')))
+        first = False
+    f.write('\n  ]\n}' if not first else ']\n}')
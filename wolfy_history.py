@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+📜 WOLFY PARTICIPATION HISTORY 📜
+Compact per-beat record of who took part and how their scores moved
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class ParticipationHistory:
+    """Per-beat participation, stored as bitsets or sorted id arrays.
+
+    Each beat keeps whichever is smaller of a packed bitset (n/8 bytes) or a
+    sorted int32 id array, plus the participants' score deltas since they
+    were last recorded (a single scalar when they all moved by the same
+    amount, which is the normal +1.0). Full score keyframes every
+    ``keyframe_interval`` beats bound the replay needed to rebuild a beat.
+
+    Behaves like the old ``List[Dict[int, float]]``: ``len()``, indexing and
+    iteration yield ``{node_id: participation_score}`` snapshots, built on
+    demand. With ``spill_path`` the array payloads are appended to that file
+    instead of being held in memory.
+    """
+
+    def __init__(self, num_nodes: int, initial_scores: Optional[np.ndarray] = None,
+                 keyframe_interval: int = 64, spill_path: Optional[str] = None):
+        self.num_nodes = num_nodes
+        self.keyframe_interval = keyframe_interval
+        if initial_scores is None:
+            initial_scores = np.zeros(num_nodes, dtype=np.float64)
+        self._base = np.array(initial_scores, dtype=np.float64)
+        self._last = self._base.copy()
+
+        self._counts: List[int] = []
+        self._members: List[object] = []  # stored bitset or id array
+        self._deltas: List[object] = []   # float scalar or stored float64 array
+        self._keyframes: Dict[int, object] = {}
+
+        self.spill_path = spill_path
+        self._spill = open(spill_path, 'w+b') if spill_path else None
+
+    # --- storage -----------------------------------------------------------
+
+    def _put(self, array: np.ndarray):
+        if self._spill is None:
+            return array
+        self._spill.seek(0, 2)
+        offset = self._spill.tell()
+        self._spill.write(array.tobytes())
+        return (offset, array.dtype.str, len(array))
+
+    def _get(self, ref) -> np.ndarray:
+        if isinstance(ref, np.ndarray):
+            return ref
+        offset, dtype, count = ref
+        if not self._spill.closed:
+            self._spill.flush()
+        return np.fromfile(self._spill.name, dtype=dtype, count=count, offset=offset)
+
+    # --- recording ---------------------------------------------------------
+
+    def record(self, node_ids, scores: np.ndarray) -> None:
+        """Append one beat: the participating node ids and the current score array"""
+        ids = np.unique(np.asarray(node_ids, dtype=np.int32))
+        beat = len(self._counts)
+
+        if len(ids) * 4 < (self.num_nodes + 7) // 8:
+            self._members.append(self._put(ids))
+        else:
+            mask = np.zeros(self.num_nodes, dtype=bool)
+            mask[ids] = True
+            self._members.append(self._put(np.packbits(mask)))
+        self._counts.append(len(ids))
+
+        delta = scores[ids] - self._last[ids]
+        self._last[ids] = scores[ids]
+        if len(delta) and np.all(delta == delta[0]):
+            self._deltas.append(float(delta[0]))
+        elif len(delta):
+            self._deltas.append(self._put(delta.astype(np.float64)))
+        else:
+            self._deltas.append(0.0)
+
+        if (beat + 1) % self.keyframe_interval == 0:
+            self._keyframes[beat] = self._put(self._last.copy())
+
+    # --- queries -----------------------------------------------------------
+
+    def participants(self, beat: int) -> np.ndarray:
+        """Sorted ids of the nodes that participated in a beat"""
+        beat = self._index(beat)
+        stored = self._get(self._members[beat])
+        if stored.dtype == np.uint8:
+            return np.flatnonzero(np.unpackbits(stored, count=self.num_nodes)).astype(np.int32)
+        return stored
+
+    def count(self, beat: int) -> int:
+        """Number of participants in a beat"""
+        return self._counts[self._index(beat)]
+
+    def active_counts(self) -> np.ndarray:
+        """Per-beat participant counts, without rebuilding any snapshot"""
+        return np.array(self._counts, dtype=np.int64)
+
+    def scores_at(self, beat: int) -> np.ndarray:
+        """Score of every node right after a beat was recorded"""
+        beat = self._index(beat)
+        start = -1
+        scores = self._base.copy()
+        for keyframe in self._keyframes:
+            if start < keyframe <= beat:
+                start = keyframe
+        if start >= 0:
+            scores = self._get(self._keyframes[start]).copy()
+
+        for b in range(start + 1, beat + 1):
+            ids = self.participants(b)
+            delta = self._deltas[b]
+            scores[ids] += delta if isinstance(delta, float) else self._get(delta)
+        return scores
+
+    def replay(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Yield (beat, participant ids, scores) for beats start..stop-1 in order.
+
+        Scores are rebuilt once at ``start`` and then advanced by each beat's
+        deltas, so a pass costs O(participants) per beat. The scores array is
+        updated in place between yields; copy it to keep a beat's values.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        scores = self.scores_at(start - 1) if start > 0 else self._base.copy()
+        for beat in range(start, stop):
+            ids = self.participants(beat)
+            delta = self._deltas[beat]
+            scores[ids] += delta if isinstance(delta, float) else self._get(delta)
+            yield beat, ids, scores
+
+    def snapshot(self, beat: int) -> Dict[int, float]:
+        """{node_id: participation_score} for a beat's participants"""
+        ids = self.participants(beat)
+        return dict(zip(ids.tolist(), self.scores_at(beat)[ids].tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in memory by the recorded beats"""
+        arrays = [ref for ref in self._members + self._deltas + list(self._keyframes.values())
+                  if isinstance(ref, np.ndarray)]
+        return sum(a.nbytes for a in arrays) + self._base.nbytes + self._last.nbytes
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Flat arrays holding the whole history (spilled payloads are read back)"""
+        members = [self._get(ref) for ref in self._members]
+        array_deltas = [self._get(ref) for ref in self._deltas if not isinstance(ref, float)]
+        keyframe_beats = sorted(self._keyframes)
+        return {
+            "base": self._base,
+            "last": self._last,
+            "counts": np.array(self._counts, dtype=np.int64),
+            # Bitset beats are stored as uint8, id beats as int32; keep both as raw bytes
+            "member_is_bitset": np.array([m.dtype == np.uint8 for m in members], dtype=bool),
+            "member_bytes": np.concatenate([m.view(np.uint8) for m in members] or [np.empty(0, np.uint8)]),
+            "member_offsets": np.cumsum([0] + [m.nbytes for m in members]).astype(np.int64),
+            # NaN marks a beat whose deltas live in delta_values
+            "delta_scalar": np.array([ref if isinstance(ref, float) else np.nan for ref in self._deltas]),
+            "delta_values": np.concatenate(array_deltas or [np.empty(0)]).astype(np.float64),
+            "keyframe_beats": np.array(keyframe_beats, dtype=np.int64),
+            "keyframes": (np.stack([self._get(self._keyframes[b]) for b in keyframe_beats])
+                          if keyframe_beats else np.empty((0, self.num_nodes))),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], keyframe_interval: int = 64,
+                    spill_path: Optional[str] = None) -> 'ParticipationHistory':
+        """Rebuild a history saved with to_arrays (in memory, or spilled to spill_path)"""
+        history = cls(len(arrays["base"]), arrays["base"], keyframe_interval, spill_path)
+        history._last = np.array(arrays["last"], dtype=np.float64)
+        history._counts = arrays["counts"].tolist()
+        offsets = arrays["member_offsets"]
+        for beat, is_bitset in enumerate(arrays["member_is_bitset"]):
+            raw = np.array(arrays["member_bytes"][offsets[beat]:offsets[beat + 1]])
+            history._members.append(history._put(raw if is_bitset else raw.view(np.int32)))
+        position = 0
+        for beat, scalar in enumerate(arrays["delta_scalar"].tolist()):
+            if np.isnan(scalar):
+                count = history._counts[beat]
+                history._deltas.append(history._put(np.array(arrays["delta_values"][position:position + count])))
+                position += count
+            else:
+                history._deltas.append(scalar)
+        for beat, scores in zip(arrays["keyframe_beats"].tolist(), arrays["keyframes"]):
+            history._keyframes[beat] = history._put(np.array(scores))
+        return history
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+
+    # --- list compatibility -------------------------------------------------
+
+    def _index(self, beat: int) -> int:
+        if beat < 0:
+            beat += len(self._counts)
+        if not 0 <= beat < len(self._counts):
+            raise IndexError(f"beat {beat} not recorded")
+        return beat
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __getitem__(self, beat: int) -> Dict[int, float]:
+        return self.snapshot(beat)
+
+    def __iter__(self) -> Iterator[Dict[int, float]]:
+        for beat in range(len(self)):
+            yield self.snapshot(beat)
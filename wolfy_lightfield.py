@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+💡 WOLFY LIGHT FIELD 💡
+Time-resolved brightness and color of every phone light in the crowd
+"""
+
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+class LightField:
+    """What the arena looks like over time, given each node's current light.
+
+    Light patterns are shared flyweights, so a frame needs one sine per
+    distinct pattern; node values are then gathered by pattern handle. The
+    handles are copied at construction, since lights change every beat.
+    Brightness matches ``LightPattern.get_brightness_at``; nodes without a
+    light are dark.
+    """
+
+    def __init__(self, light_handle: np.ndarray, light_table):
+        # Row 0 stands for "no light" (handle -1), so handle + 1 indexes the tables
+        self.rows = np.asarray(light_handle, dtype=np.int64) + 1
+        patterns = light_table.patterns
+        self.intensity = np.array([0.0] + [p.intensity for p in patterns], dtype=np.float64)
+        self.frequency = np.array([0.0] + [p.frequency for p in patterns], dtype=np.float64)
+        self.phase = np.array([0.0] + [p.phase for p in patterns], dtype=np.float64)
+        self.colors = np.array([(0, 0, 0)] + [p.color for p in patterns], dtype=np.float32) / 255.0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @staticmethod
+    def frame_times(start_ms: float, stop_ms: float, fps: float) -> np.ndarray:
+        """Sample times in [start_ms, stop_ms) at fps frames per second"""
+        frames = max(0, int(np.ceil((stop_ms - start_ms) * fps / 1000.0 - 1e-9)))
+        return start_ms + np.arange(frames) * (1000.0 / fps)
+
+    def pattern_brightness(self, times_ms: np.ndarray) -> np.ndarray:
+        """(frames x patterns + 1) brightness of each distinct pattern"""
+        t = np.asarray(times_ms, dtype=np.float64)[:, None]
+        wave = 0.5 + 0.5 * np.sin(2 * np.pi * self.frequency * t / 1000.0 + self.phase)
+        # Zero-frequency patterns are steady at full intensity
+        wave[:, self.frequency == 0] = 1.0
+        return (self.intensity * wave).astype(np.float32)
+
+    def brightness(self, times_ms: np.ndarray) -> np.ndarray:
+        """(frames x nodes) float32 brightness of every node"""
+        return np.take(self.pattern_brightness(times_ms), self.rows, axis=1)
+
+    def rgb(self, times_ms: np.ndarray) -> np.ndarray:
+        """(frames x nodes x 3) float32 light color scaled by brightness"""
+        return self.brightness(times_ms)[..., None] * self.colors[self.rows]
+
+    def iter_chunks(self, start_ms: float, stop_ms: float, fps: float, rgb: bool = False,
+                    max_bytes: int = 64 << 20) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield (times_ms, values) over [start_ms, stop_ms) in chunks of frames,
+        each chunk's values (brightness, or RGB with rgb=True) at most about
+        max_bytes"""
+        times = self.frame_times(start_ms, stop_ms, fps)
+        frame_bytes = max(1, len(self)) * 4 * (3 if rgb else 1)
+        step = max(1, max_bytes // frame_bytes)
+        evaluate = self.rgb if rgb else self.brightness
+        for first in range(0, len(times), step):
+            chunk = times[first:first + step]
+            yield chunk, evaluate(chunk)
@@ -8,13 +8,24 @@ audio-visual experience through mesh networking, AI, and pure Wolf-energy.
 import numpy as np
 import random
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import List, Set, Tuple, Dict, Optional
 from enum import Enum
 import json
-from collections import defaultdict
 import math
 
+from wolfy_archive import ConcertArchiveWriter
+from wolfy_checkpoint import load_checkpoint, save_checkpoint
+from wolfy_crowd import crowd_traits, fresh_seed, generate_crowd, layout_name
+from wolfy_event_sink import EventSink, write_event_log_json
+from wolfy_history import ParticipationHistory
+from wolfy_lightfield import LightField
+from wolfy_mesh_graph import MeshGraph, build_proximity_mesh
+from wolfy_metrics import ShowMetrics
+from wolfy_scheduler import propagate_events
+from wolfy_venue_cache import VenueCache
+
 
 class NodeState(Enum):
     """States a node can be in during the concert"""
@@ -35,14 +46,20 @@ class MusicTheme(Enum):
     PETER_WOLF_HUNTERS = "peter_wolf_hunters"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LightPattern:
-    """Represents a light pattern for a node"""
+    """Represents a light pattern for a node (immutable, shared between nodes)"""
+    __slots__ = ('color', 'intensity', 'frequency', 'phase')
+    
     color: Tuple[int, int, int]  # RGB
     intensity: float  # 0.0 to 1.0
     frequency: float  # Hz for flashing
     phase: float  # Phase offset in radians
     
+    def __reduce__(self):
+        # Frozen + __slots__ can't be restored attribute by attribute
+        return (LightPattern, (self.color, self.intensity, self.frequency, self.phase))
+    
     def get_brightness_at(self, time_ms: float) -> float:
         """Calculate brightness at given time"""
         if self.frequency == 0:
@@ -50,13 +67,18 @@ class LightPattern:
         return self.intensity * (0.5 + 0.5 * math.sin(2 * math.pi * self.frequency * time_ms / 1000.0 + self.phase))
 
 
-@dataclass
+@dataclass(frozen=True)
 class TonePattern:
-    """Represents a sound tone for a node"""
+    """Represents a sound tone for a node (immutable, shared between nodes)"""
+    __slots__ = ('frequency', 'duration_ms', 'volume', 'waveform')
+    
     frequency: float  # Hz
     duration_ms: float
     volume: float  # 0.0 to 1.0
     waveform: str  # 'sine', 'square', 'triangle'
+    
+    def __reduce__(self):
+        return (TonePattern, (self.frequency, self.duration_ms, self.volume, self.waveform))
 
 
 @dataclass
@@ -104,6 +126,199 @@ class AudienceNode:
         return energy_level > threshold and self.battery > 0.1
 
 
+class PatternTable:
+    """Shared table of light or tone patterns; nodes hold integer handles into it"""
+
+    def __init__(self):
+        self.patterns: List = []
+        self._handles: Dict[object, int] = {}
+
+    def intern(self, pattern) -> int:
+        """Return the handle of an equal pattern, adding it on first sight"""
+        handle = self._handles.get(pattern)
+        if handle is None:
+            handle = len(self.patterns)
+            self.patterns.append(pattern)
+            self._handles[pattern] = handle
+        return handle
+
+    def lookup(self, handle: int):
+        """Pattern for a handle, or None for -1 (no pattern)"""
+        return self.patterns[handle] if handle >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+# Node states are stored as small integer codes in the NodeStore
+NODE_STATES: List[NodeState] = list(NodeState)
+STATE_CODES: Dict[NodeState, int] = {state: code for code, state in enumerate(NODE_STATES)}
+
+
+class NodeStore:
+    """Columnar storage for the whole crowd - one contiguous array per field.
+
+    Indexing or iterating yields AudienceNodeView objects, so code written
+    against a List[AudienceNode] keeps working, while whole-crowd passes can
+    operate on the arrays directly.
+    """
+
+    def __init__(self, positions, consent_strobe=None, leadership_score=None,
+                 latency_ms: float = 5.0):
+        self.positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 2)
+        n = len(self.positions)
+
+        self.state = np.full(n, STATE_CODES[NodeState.IDLE], dtype=np.uint8)
+        self.battery = np.ones(n, dtype=np.float64)
+        if consent_strobe is None:
+            consent_strobe = np.random.random(n) > 0.3
+        self.consent_strobe = np.asarray(consent_strobe, dtype=bool)
+        self.latency_ms = np.full(n, latency_ms, dtype=np.float64)
+
+        # Networking
+        self.mesh = MeshGraph.empty(n)
+
+        # Performance - handles into shared pattern tables, -1 for none
+        self.light_table = PatternTable()
+        self.tone_table = PatternTable()
+        self.light_handle = np.full(n, -1, dtype=np.int32)
+        self.tone_handle = np.full(n, -1, dtype=np.int32)
+        self.participation_score = np.zeros(n, dtype=np.float64)
+
+        # AI decision making
+        if leadership_score is None:
+            leadership_score = np.random.random(n)
+        self.leadership_score = np.asarray(leadership_score, dtype=np.float64)
+        self.gateway_fitness = np.zeros(n, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, node_id: int) -> 'AudienceNodeView':
+        node_id = int(node_id)
+        if node_id < 0:
+            node_id += len(self)
+        if not 0 <= node_id < len(self):
+            raise IndexError(f"node id {node_id} out of range")
+        return AudienceNodeView(self, node_id)
+
+    def __iter__(self):
+        for node_id in range(len(self)):
+            yield AudienceNodeView(self, node_id)
+
+    def degree(self) -> np.ndarray:
+        """Number of mesh neighbors per node"""
+        return self.mesh.degree()
+
+    def state_mask(self, state: NodeState) -> np.ndarray:
+        """Boolean mask of nodes currently in the given state"""
+        return self.state == STATE_CODES[state]
+
+    def set_state(self, node_ids, state: NodeState) -> None:
+        """Set the state of one or more nodes"""
+        if not isinstance(node_ids, np.ndarray):
+            node_ids = np.fromiter(node_ids, dtype=np.int64)
+        self.state[node_ids] = STATE_CODES[state]
+
+    def update_gateway_fitness(self, node_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """AI: Vectorized AudienceNode.update_gateway_fitness (all nodes or a subset)"""
+        if node_ids is None:
+            node_ids = slice(None)
+        centrality = np.diff(self.mesh.indptr)[node_ids] / 50.0  # Assume max ~50 neighbors
+        state_penalty = np.where(self.state[node_ids] == STATE_CODES[NodeState.GATEWAY], 0.5, 1.0)
+        self.gateway_fitness[node_ids] = (centrality * 0.4 + self.battery[node_ids] * 0.3 +
+                                          self.leadership_score[node_ids] * 0.3) * state_penalty
+        return self.gateway_fitness
+
+    def participation_threshold(self, node_ids: np.ndarray) -> np.ndarray:
+        """Energy level each node needs to exceed before it joins in"""
+        return 0.3 + (self.leadership_score[node_ids] * 0.4)
+
+    def participation_mask(self, node_ids: np.ndarray, energy_level: float) -> np.ndarray:
+        """AI: Vectorized AudienceNode.make_participation_decision"""
+        threshold = self.participation_threshold(node_ids)
+        return (energy_level > threshold) & (self.battery[node_ids] > 0.1)
+
+
+def _store_field(name: str, cast=None):
+    """Property mapping a view attribute onto one element of a NodeStore array"""
+    def getter(self):
+        value = getattr(self._store, name)[self.id]
+        return cast(value) if cast is not None else value
+
+    def setter(self, value):
+        getattr(self._store, name)[self.id] = value
+
+    return property(getter, setter)
+
+
+class AudienceNodeView:
+    """AudienceNode-compatible view onto one row of a NodeStore"""
+
+    __slots__ = ('_store', 'id')
+
+    def __init__(self, store: NodeStore, node_id: int):
+        self._store = store
+        self.id = node_id
+
+    battery = _store_field('battery', float)
+    consent_strobe = _store_field('consent_strobe', bool)
+    latency_ms = _store_field('latency_ms', float)
+    participation_score = _store_field('participation_score', float)
+    leadership_score = _store_field('leadership_score', float)
+    gateway_fitness = _store_field('gateway_fitness', float)
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        x, y = self._store.positions[self.id]
+        return (float(x), float(y))
+
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        self._store.positions[self.id] = value
+
+    @property
+    def current_light(self) -> Optional[LightPattern]:
+        return self._store.light_table.lookup(self._store.light_handle[self.id])
+
+    @current_light.setter
+    def current_light(self, value: Optional[LightPattern]):
+        self._store.light_handle[self.id] = -1 if value is None else self._store.light_table.intern(value)
+
+    @property
+    def current_tone(self) -> Optional[TonePattern]:
+        return self._store.tone_table.lookup(self._store.tone_handle[self.id])
+
+    @current_tone.setter
+    def current_tone(self, value: Optional[TonePattern]):
+        self._store.tone_handle[self.id] = -1 if value is None else self._store.tone_table.intern(value)
+
+    @property
+    def state(self) -> NodeState:
+        return NODE_STATES[self._store.state[self.id]]
+
+    @state.setter
+    def state(self, value: NodeState):
+        self._store.state[self.id] = STATE_CODES[value]
+
+    @property
+    def neighbors(self) -> Set[int]:
+        return self._store.mesh.neighbor_set(self.id)
+
+    @property
+    def signal_strength(self) -> Dict[int, float]:
+        return self._store.mesh.signal_map(self.id)
+
+    def __repr__(self) -> str:
+        return (f"AudienceNodeView(id={self.id}, position={self.position}, "
+                f"state={self.state}, battery={self.battery:.4f})")
+
+    # Same AI logic as the standalone dataclass
+    calculate_distance = AudienceNode.calculate_distance
+    update_gateway_fitness = AudienceNode.update_gateway_fitness
+    make_participation_decision = AudienceNode.make_participation_decision
+
+
 class MusicEngine:
     """Generates musical patterns for different themes"""
     
@@ -123,30 +338,54 @@ class MusicEngine:
         MusicTheme.PETER_WOLF_HUNTERS: [(147, 500, 0.7), (165, 500, 0.7)],  # Drums - march
     }
     
+    THEME_COLORS = {
+        MusicTheme.BLADE_RUNNER: (0, 150, 255),  # Neon blue
+        MusicTheme.PETER_WOLF_BIRD: (255, 255, 100),  # Bright yellow
+        MusicTheme.PETER_WOLF_DUCK: (100, 200, 255),  # Duck blue
+        MusicTheme.PETER_WOLF_CAT: (200, 100, 255),  # Purple
+        MusicTheme.PETER_WOLF_WOLF: (255, 50, 50),  # Red
+        MusicTheme.PETER_WOLF_HUNTERS: (255, 150, 0),  # Orange
+    }
+    
+    # Patterns are immutable, so one instance per (theme, step/phase) is shared
+    # by every node; the caches are bounded so odd phase values can't grow them
+    PATTERN_CACHE_SIZE = 256
+    
     @staticmethod
     def get_tone_for_theme(theme: MusicTheme, beat_index: int) -> TonePattern:
         """Get the appropriate tone for a theme at a given beat"""
-        if theme == MusicTheme.BLADE_RUNNER:
-            pattern = MusicEngine.BLADE_RUNNER_MOTIF
-        else:
-            pattern = MusicEngine.PETER_AND_WOLF_THEMES.get(theme, [(440, 500, 0.5)])
-        
-        freq, dur, vol = pattern[beat_index % len(pattern)]
-        return TonePattern(frequency=freq, duration_ms=dur, volume=vol, waveform='sine')
+        return MusicEngine._tone_for_step(theme, beat_index % len(MusicEngine.get_motif(theme)))
     
     @staticmethod
     def get_light_for_theme(theme: MusicTheme, node_id: int, phase_offset: float) -> LightPattern:
         """Get the appropriate light pattern for a theme"""
-        theme_colors = {
-            MusicTheme.BLADE_RUNNER: (0, 150, 255),  # Neon blue
-            MusicTheme.PETER_WOLF_BIRD: (255, 255, 100),  # Bright yellow
-            MusicTheme.PETER_WOLF_DUCK: (100, 200, 255),  # Duck blue
-            MusicTheme.PETER_WOLF_CAT: (200, 100, 255),  # Purple
-            MusicTheme.PETER_WOLF_WOLF: (255, 50, 50),  # Red
-            MusicTheme.PETER_WOLF_HUNTERS: (255, 150, 0),  # Orange
-        }
-        
-        color = theme_colors.get(theme, (255, 255, 255))
+        return MusicEngine._light_for_phase(theme, phase_offset)
+    
+    @staticmethod
+    def get_beat_patterns(theme: MusicTheme, beat_index: int,
+                          wave_depth: int) -> Tuple[LightPattern, TonePattern]:
+        """Shared light and tone for a node reached at wave_depth on a given beat"""
+        phase_offset = wave_depth * 0.2  # Phase offset based on distance from conductor
+        return (MusicEngine.get_light_for_theme(theme, -1, phase_offset),
+                MusicEngine.get_tone_for_theme(theme, beat_index))
+    
+    @staticmethod
+    def get_motif(theme: MusicTheme) -> List[Tuple[float, float, float]]:
+        """(frequency, duration_ms, volume) steps making up a theme"""
+        if theme == MusicTheme.BLADE_RUNNER:
+            return MusicEngine.BLADE_RUNNER_MOTIF
+        return MusicEngine.PETER_AND_WOLF_THEMES.get(theme, [(440, 500, 0.5)])
+    
+    @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_SIZE)
+    def _tone_for_step(theme: MusicTheme, step: int) -> TonePattern:
+        freq, dur, vol = MusicEngine.get_motif(theme)[step]
+        return TonePattern(frequency=freq, duration_ms=dur, volume=vol, waveform='sine')
+    
+    @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_SIZE)
+    def _light_for_phase(theme: MusicTheme, phase_offset: float) -> LightPattern:
+        color = MusicEngine.THEME_COLORS.get(theme, (255, 255, 255))
         frequency = 2.0 if theme == MusicTheme.BLADE_RUNNER else 1.5
         
         return LightPattern(
@@ -155,108 +394,293 @@ class MusicEngine:
             frequency=frequency,
             phase=phase_offset
         )
+    
+    @staticmethod
+    def cache_info() -> Dict[str, object]:
+        """Hit/miss counters of the shared pattern caches"""
+        return {
+            "light": MusicEngine._light_for_phase.cache_info(),
+            "tone": MusicEngine._tone_for_step.cache_info(),
+        }
+
+
+class GatewayElection:
+    """AI: Gateway and conductor election over the NodeStore fitness array.
+
+    Fitness is only recomputed for nodes whose battery or state changed since
+    the previous election, and the winners come from a top-k partial
+    selection instead of sorting the whole crowd.
+    """
+    
+    def __init__(self, nodes: NodeStore, num_gateways: int = 25):
+        self.nodes = nodes
+        self.num_gateways = num_gateways
+        self.timings: List[Dict] = []
+        self._battery: Optional[np.ndarray] = None
+        self._state: Optional[np.ndarray] = None
+        self._mesh: Optional[MeshGraph] = None
+    
+    def _refresh_fitness(self, force_ids: Set[int]) -> int:
+        """Recompute fitness where inputs changed; returns how many were recomputed"""
+        store = self.nodes
+        if self._mesh is not store.mesh or self._battery is None:
+            store.update_gateway_fitness()
+            recomputed = len(store)
+        else:
+            dirty = (store.battery != self._battery) | (store.state != self._state)
+            dirty[np.fromiter(force_ids, dtype=np.int64, count=len(force_ids))] = True
+            changed = np.flatnonzero(dirty)
+            store.update_gateway_fitness(changed)
+            recomputed = len(changed)
+        
+        self._battery = store.battery.copy()
+        self._state = store.state.copy()
+        self._mesh = store.mesh
+        return recomputed
+    
+    def top_k(self, k: int) -> np.ndarray:
+        """Ids of the k fittest nodes, best first (ties go to the lower id)"""
+        fitness = self.nodes.gateway_fitness
+        k = min(k, len(fitness))
+        if k == 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-fitness, k - 1)[:k]
+        kth = fitness[candidates].min()
+        above = np.flatnonzero(fitness > kth)
+        ties = np.flatnonzero(fitness == kth)[:k - len(above)]
+        winners = np.concatenate([above, ties])
+        return winners[np.lexsort((winners, -fitness[winners]))]
+    
+    def elect(self, current_gateways: Set[int], rotation_penalty: float = 1.0) -> Tuple[Set[int], int]:
+        """Elect gateways and a conductor; current gateways' fitness is scaled by rotation_penalty"""
+        start = time.perf_counter()
+        # Penalized entries must be recomputed so the penalty never compounds
+        recomputed = self._refresh_fitness(current_gateways)
+        if rotation_penalty != 1.0:
+            fitness = self.nodes.gateway_fitness
+            fitness[self.nodes.state_mask(NodeState.GATEWAY)] *= rotation_penalty
+        
+        winners = self.top_k(self.num_gateways)
+        self.timings.append({
+            "nodes": len(self.nodes),
+            "recomputed": recomputed,
+            "duration_ms": (time.perf_counter() - start) * 1000.0,
+        })
+        return set(winners.tolist()), int(winners[0])
+    
+    def get_statistics(self) -> Dict:
+        """Election count and timing summary"""
+        durations = [t["duration_ms"] for t in self.timings]
+        return {
+            "elections": len(self.timings),
+            "mean_ms": sum(durations) / len(durations) if durations else 0.0,
+            "last_ms": durations[-1] if durations else 0.0,
+            "last_recomputed": self.timings[-1]["recomputed"] if self.timings else 0,
+        }
+
+
+# Musical structure: (theme, beats), padded with Blade Runner
+CONCERT_THEMES = [
+    (MusicTheme.BLADE_RUNNER, 16),
+    (MusicTheme.PETER_WOLF_BIRD, 8),
+    (MusicTheme.PETER_WOLF_DUCK, 8),
+    (MusicTheme.BLADE_RUNNER, 8),
+    (MusicTheme.PETER_WOLF_CAT, 8),
+    (MusicTheme.PETER_WOLF_WOLF, 12),
+    (MusicTheme.BLADE_RUNNER, 8),
+    (MusicTheme.PETER_WOLF_HUNTERS, 8),
+    (MusicTheme.BLADE_RUNNER, 16),
+]
+
+
+def concert_theme_schedule(total_beats: int) -> List[MusicTheme]:
+    """Theme of every beat of a concert"""
+    theme_schedule = []
+    for theme, beats in CONCERT_THEMES:
+        theme_schedule.extend([theme] * beats)
+    
+    # Pad or trim to match total beats
+    while len(theme_schedule) < total_beats:
+        theme_schedule.append(MusicTheme.BLADE_RUNNER)
+    return theme_schedule[:total_beats]
+
+
+@dataclass(frozen=True)
+class ShowConfig:
+    """Mesh and election knobs of a show"""
+    max_connection_distance: float = 8.0  # meters (Bluetooth/WiFi range in crowd)
+    mesh_cell_size: float = 10.0  # mesh build grid, widened to the connection distance; speed only
+    num_gateways: int = 25
+    min_signal: float = 0.3  # weaker links don't carry the beat
+    max_depth: int = 10  # hops a beat may travel
+    rotation_period_beats: int = 16
+    
+    # Fields that change the generated mesh; every other field can vary on a built venue
+    TOPOLOGY_FIELDS = ("max_connection_distance",)
+    
+    def __post_init__(self):
+        if self.max_connection_distance <= 0 or self.mesh_cell_size <= 0:
+            raise ValueError("max_connection_distance and mesh_cell_size must be positive")
+        if self.num_gateways < 1 or self.max_depth < 1 or self.rotation_period_beats < 1:
+            raise ValueError("num_gateways, max_depth and rotation_period_beats must be >= 1")
+    
+    def topology(self) -> Dict:
+        return {name: getattr(self, name) for name in self.TOPOLOGY_FIELDS}
 
 
 class WolfyOrchestrator:
     """🐺 The main AI orchestrator - Wolfy herself 🐺"""
     
-    def __init__(self, num_nodes: int = 17000, arena_size: Tuple[float, float] = (200, 200)):
+    # "event" delivers beat messages in time order with per-link latency
+    PROPAGATION_ENGINES = ("python", "frontier", "event")
+    # "conductor": the wave starts at the conductor only
+    # "gateways": every gateway seeds the wave at once (multi-source BFS)
+    PROPAGATION_MODES = ("conductor", "gateways")
+    
+    # Bump when venue generation changes, so cached venues stop matching
+    VENUE_GENERATOR_VERSION = 2
+    
+    def __init__(self, num_nodes: int = 17000, arena_size: Tuple[float, float] = (200, 200),
+                 propagation_engine: str = "python", propagation_mode: str = "conductor",
+                 event_log_path: Optional[str] = None, seed: Optional[int] = None,
+                 venue_cache=None, crowd_layout="clusters", venue=None,
+                 config: Optional[ShowConfig] = None, history_spill_path: Optional[str] = None,
+                 history_keyframe_interval: int = 64):
+        self._init_state(num_nodes, arena_size, propagation_engine, propagation_mode, event_log_path,
+                         seed, crowd_layout, config, history_spill_path, history_keyframe_interval)
+        
+        print("🐺 Wolfy awakening... Creating mesh network...")
+        # A seeded venue is reproducible, so it can come from (and go to) the venue cache
+        if isinstance(venue_cache, str):
+            venue_cache = VenueCache(venue_cache)
+        if venue_cache is not None and seed is None:
+            print("   ⚠️  Venue cache needs a seed; generating an unseeded venue")
+            venue_cache = None
+        if venue_cache is not None and layout_name(crowd_layout) is None:
+            print("   ⚠️  Venue cache needs a registered crowd layout (see register_layout); "
+                  "generating an uncached venue")
+            venue_cache = None
+        
+        # A prebuilt (positions, mesh) venue is used as is: the seed then only
+        # draws the audience's traits, so many shows can share one venue
+        start = time.perf_counter()
+        cached = venue is None and venue_cache is not None
+        if cached:
+            venue = venue_cache.get(self.venue_params())
+        if venue is not None:
+            positions, mesh = venue
+            self.nodes = self._node_store(positions)
+            self.nodes.mesh = mesh
+            print(f"   ✓ {'Venue cache hit' if cached else 'Shared venue'}: {self.num_nodes:,} nodes, "
+                  f"{mesh.num_edges:,} links loaded in {time.perf_counter() - start:.2f}s")
+        else:
+            self._initialize_nodes()
+            self._build_mesh_network()
+            if venue_cache is not None:
+                venue_cache.put(self.venue_params(), self.nodes.positions, self.mesh)
+                print(f"   ✓ Venue cache miss: generated in {time.perf_counter() - start:.2f}s and stored")
+            else:
+                print(f"   ✓ Venue generated in {time.perf_counter() - start:.2f}s")
+        self._select_initial_gateways()
+    
+    def _init_state(self, num_nodes: int, arena_size: Tuple[float, float], propagation_engine: str,
+                    propagation_mode: str, event_log_path: Optional[str], seed: Optional[int] = None,
+                    crowd_layout="clusters", config: Optional[ShowConfig] = None,
+                    history_spill_path: Optional[str] = None, history_keyframe_interval: int = 64):
+        """Configuration and empty show state, before any nodes exist"""
+        if propagation_engine not in self.PROPAGATION_ENGINES:
+            raise ValueError(f"unknown propagation engine: {propagation_engine!r}")
+        if propagation_mode not in self.PROPAGATION_MODES:
+            raise ValueError(f"unknown propagation mode: {propagation_mode!r}")
         self.num_nodes = num_nodes
         self.arena_size = arena_size
-        self.nodes: List[AudienceNode] = []
+        self.propagation_engine = propagation_engine
+        self.propagation_mode = propagation_mode
+        # Unseeded shows still get a recorded seed, so any run can be regenerated
+        self.seed = fresh_seed() if seed is None else seed
+        self.crowd_layout = crowd_layout
+        self.config = config or ShowConfig()
+        # BFS layerings keyed by (wave sources, mesh version), reset on rotation
+        self._wave_layers: Dict[Tuple[Tuple[int, ...], int], tuple] = {}
+        # Serving gateway per node, same keys, same lifetime
+        self._gateway_roots: Dict[Tuple[Tuple[int, ...], int], np.ndarray] = {}
+        # Energy every relay of a layering needs, keyed by (layering key, max_depth)
+        self._relay_thresholds: Dict[tuple, float] = {}
+        # misses: layerings built; hits: beats a previously built layering produced;
+        # fast_path_beats / fallback_beats: frontier beats with and without a layering
+        self.wave_cache_stats = {"hits": 0, "misses": 0, "fast_path_beats": 0, "fallback_beats": 0}
+        self.nodes: NodeStore = NodeStore(np.empty((0, 2)))
         self.gateways: Set[int] = set()
         self.conductor_id: Optional[int] = None
         self.current_theme = MusicTheme.BLADE_RUNNER
         self.beat_count = 0
         self.simulation_time_ms = 0.0
-        self.event_log: List[Dict] = []
-        self.participation_history: List[Dict[int, float]] = []
-        
-        print("🐺 Wolfy awakening... Creating mesh network...")
-        self._initialize_nodes()
-        self._build_mesh_network()
-        self._select_initial_gateways()
-        
+        # duration_seconds and bpm of the concert in progress, so a checkpoint can resume it
+        self.concert: Optional[Dict] = None
+        # With event_log_path, events stream to JSON Lines and only a ring
+        # buffer of recent ones stays in memory
+        self.event_sink = EventSink(event_log_path) if event_log_path else None
+        self.event_log = self.event_sink.recent if self.event_sink else []
+        self.event_counts: Dict[str, int] = {}
+        self.archive: Optional[ConcertArchiveWriter] = None
+        # With history_spill_path, per-beat payloads go to that file instead of memory
+        self.participation_history = ParticipationHistory(num_nodes, keyframe_interval=history_keyframe_interval,
+                                                          spill_path=history_spill_path)
+        self.last_wave: Tuple[np.ndarray, np.ndarray] = (np.empty(0, dtype=np.int64),
+                                                         np.empty(0, dtype=np.int16))
+        # ms after the beat each last_wave participant got the message ("event" engine only)
+        self.last_arrival_ms: Optional[np.ndarray] = None
+        self.last_wave_depth = 0
+        self.message_stats = {"messages": 0, "beats": 0}
+        self.metrics = ShowMetrics(num_nodes)
+    
     def _initialize_nodes(self):
         """Create all audience nodes with realistic spatial distribution"""
-        print(f"   Spawning {self.num_nodes} audience nodes...")
-        
-        # Create clusters (sections of the venue)
-        num_clusters = 20
-        cluster_centers = [
-            (random.uniform(10, self.arena_size[0] - 10),
-             random.uniform(10, self.arena_size[1] - 10))
-            for _ in range(num_clusters)
-        ]
-        
-        for i in range(self.num_nodes):
-            # Assign to a cluster with some randomness
-            cluster = random.choice(cluster_centers)
-            x = cluster[0] + random.gauss(0, 15)
-            y = cluster[1] + random.gauss(0, 15)
-            
-            # Keep within arena bounds
-            x = max(0, min(self.arena_size[0], x))
-            y = max(0, min(self.arena_size[1], y))
-            
-            node = AudienceNode(id=i, position=(x, y))
-            self.nodes.append(node)
+        print(f"   Spawning {self.num_nodes} audience nodes "
+              f"({layout_name(self.crowd_layout) or 'custom'} layout, seed {self.seed})...")
+        crowd = generate_crowd(self.num_nodes, self.arena_size, self.seed, self.crowd_layout)
+        self.nodes = NodeStore(crowd.positions, crowd.consent_strobe, crowd.leadership_score)
+    
+    def _node_store(self, positions: np.ndarray) -> NodeStore:
+        """Nodes at given positions, with the traits this seed's generation would give them"""
+        consent_strobe, leadership_score = crowd_traits(len(positions), self.seed)
+        return NodeStore(positions, consent_strobe, leadership_score)
+    
+    def venue_params(self) -> Dict:
+        """Everything that determines the generated positions and mesh"""
+        return {"num_nodes": self.num_nodes, "arena_size": [float(v) for v in self.arena_size],
+                "seed": self.seed, "layout": layout_name(self.crowd_layout),
+                **self.config.topology(), "generator": self.VENUE_GENERATOR_VERSION}
     
     def _build_mesh_network(self):
         """Connect nearby nodes in a mesh network"""
         print("   Building mesh connections...")
-        max_connection_distance = 8.0  # meters (Bluetooth/WiFi range in crowd)
-        
-        # For efficiency with 17k nodes, use spatial hashing
-        grid_size = 10.0
-        spatial_grid = defaultdict(list)
+        max_connection_distance = self.config.max_connection_distance
         
-        for node in self.nodes:
-            grid_x = int(node.position[0] / grid_size)
-            grid_y = int(node.position[1] / grid_size)
-            spatial_grid[(grid_x, grid_y)].append(node)
+        # Spatial binning (or a KD-tree when scipy is available) keeps this near-linear
+        grid_size = max(self.config.mesh_cell_size, max_connection_distance)
+        start = time.perf_counter()
+        self.nodes.mesh = build_proximity_mesh(self.nodes.positions, max_connection_distance,
+                                               cell_size=grid_size)
+        build_time = time.perf_counter() - start
         
-        # Connect nodes within range
-        for node in self.nodes:
-            grid_x = int(node.position[0] / grid_size)
-            grid_y = int(node.position[1] / grid_size)
-            
-            # Check neighboring grid cells
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    cell = (grid_x + dx, grid_y + dy)
-                    for other in spatial_grid[cell]:
-                        if node.id >= other.id:
-                            continue
-                        
-                        distance = node.calculate_distance(other)
-                        if distance <= max_connection_distance:
-                            # Create bidirectional connection
-                            signal_strength = 1.0 - (distance / max_connection_distance)
-                            node.neighbors.add(other.id)
-                            other.neighbors.add(node.id)
-                            node.signal_strength[other.id] = signal_strength
-                            other.signal_strength[node.id] = signal_strength
-        
-        avg_neighbors = sum(len(n.neighbors) for n in self.nodes) / len(self.nodes)
-        print(f"   ✓ Mesh built: avg {avg_neighbors:.1f} neighbors per node")
-    
-    def _select_initial_gateways(self, num_gateways: int = 25):
+        avg_neighbors = self.nodes.degree().mean()
+        print(f"   ✓ Mesh built: avg {avg_neighbors:.1f} neighbors per node "
+              f"({self.mesh.num_edges:,} links in {build_time:.2f}s)")
+    
+    @property
+    def mesh(self) -> MeshGraph:
+        """CSR adjacency of the audience mesh"""
+        return self.nodes.mesh
+    
+    def _select_initial_gateways(self):
         """AI: Select initial gateway nodes for network coordination"""
         print("   AI selecting gateway nodes...")
         
-        for node in self.nodes:
-            node.update_gateway_fitness(self.nodes)
-        
-        # Select top fitness nodes as gateways
-        sorted_nodes = sorted(self.nodes, key=lambda n: n.gateway_fitness, reverse=True)
-        self.gateways = {n.id for n in sorted_nodes[:num_gateways]}
-        
-        for gw_id in self.gateways:
-            self.nodes[gw_id].state = NodeState.GATEWAY
-        
-        # Select one gateway as conductor
-        self.conductor_id = sorted_nodes[0].id
+        # Select top fitness nodes as gateways, the fittest one conducting
+        self.election = GatewayElection(self.nodes, self.config.num_gateways)
+        self.gateways, self.conductor_id = self.election.elect(set())
+        self.nodes.set_state(self.gateways, NodeState.GATEWAY)
         self.nodes[self.conductor_id].state = NodeState.CONDUCTOR
         
         print(f"   ✓ {len(self.gateways)} gateways selected, node {self.conductor_id} conducting")
@@ -265,62 +689,107 @@ class WolfyOrchestrator:
             "conductor": self.conductor_id
         })
     
+    def _ensure_event_log_open(self):
+        if self.event_sink is not None and self.event_sink.closed:
+            raise RuntimeError(f"the event log {self.event_sink.path} was closed (by close() or "
+                               f"exporting a compressed log); no more events can be logged")
+    
     def _log_event(self, event_type: str, message: str, data: Dict = None):
         """Log an event to the simulation log"""
-        self.event_log.append({
+        event = {
             "time_ms": self.simulation_time_ms,
             "beat": self.beat_count,
             "type": event_type,
             "message": message,
             "data": data or {}
-        })
+        }
+        self._ensure_event_log_open()
+        self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+        if self.event_sink is not None:
+            self.event_sink.emit(event)
+        else:
+            self.event_log.append(event)
+        if self.archive is not None:
+            self.archive.record_event(event)
     
     def rotate_leadership(self):
         """AI: Rotate gateway and conductor roles to balance load"""
-        # Update fitness scores
-        for node in self.nodes:
-            node.update_gateway_fitness(self.nodes)
-            # Penalize current gateways to encourage rotation
-            if node.state == NodeState.GATEWAY:
-                node.gateway_fitness *= 0.7
-        
-        # Select new gateways
-        sorted_nodes = sorted(self.nodes, key=lambda n: n.gateway_fitness, reverse=True)
-        new_gateways = {n.id for n in sorted_nodes[:25]}
+        # Update fitness scores, penalizing current gateways to encourage rotation
+        old_conductor = self.conductor_id
+        new_gateways, new_conductor = self.election.elect(self.gateways, rotation_penalty=0.7)
         
         # Reset old gateways
-        for old_gw in self.gateways:
-            if old_gw not in new_gateways:
-                self.nodes[old_gw].state = NodeState.IDLE
+        self.nodes.set_state(self.gateways - new_gateways, NodeState.IDLE)
         
         # Set new gateways
         self.gateways = new_gateways
-        for gw_id in self.gateways:
-            self.nodes[gw_id].state = NodeState.GATEWAY
+        self.nodes.set_state(self.gateways, NodeState.GATEWAY)
         
         # New conductor
-        old_conductor = self.conductor_id
-        self.conductor_id = sorted_nodes[0].id
+        self.conductor_id = new_conductor
         self.nodes[self.conductor_id].state = NodeState.CONDUCTOR
+        self.invalidate_wave_cache()
         
         self._log_event("leadership_rotation", 
                        f"Conductor passed from {old_conductor} to {self.conductor_id}",
-                       {"new_gateways": list(self.gateways)})
+                       {"new_gateways": list(self.gateways),
+                        "election_ms": self.election.timings[-1]["duration_ms"]})
     
-    def synchronize_beat(self, theme: MusicTheme):
-        """Synchronize a musical beat across the mesh network"""
-        self.current_theme = theme
-        self.beat_count += 1
-        
-        # Calculate which nodes participate this beat
-        # Start from conductor, propagate through gateways to neighbors
-        participating_nodes = set()
-        participation_wave = [self.conductor_id]
-        visited = {self.conductor_id}
+    def wave_sources(self) -> List[int]:
+        """Nodes that start each beat's wave"""
+        if self.propagation_mode == "gateways":
+            return sorted(self.gateways)
+        return [self.conductor_id]
+    
+    def gateway_hop_distance(self) -> np.ndarray:
+        """Hops over strong links from each node to its nearest gateway (-1 if unreachable)"""
+        return self.wave_layers(sorted(self.gateways))[1]
+    
+    def gateway_assignment(self) -> np.ndarray:
+        """Gateway serving each node: the root of its branch in the strong-link
+        BFS from all gateways, i.e. its nearest gateway by hops (-1 if unreachable)"""
+        gateways = sorted(self.gateways)
+        key = (tuple(gateways), self.mesh.version)
+        roots = self._gateway_roots.get(key)
+        if roots is None:
+            order, depth, parent = self.wave_layers(gateways)
+            roots = np.full(self.num_nodes, -1, dtype=np.int64)
+            # order runs layer by layer, so every parent is resolved before its children
+            cuts = np.flatnonzero(np.diff(depth[order])) + 1
+            for layer in np.split(order, cuts) if len(order) else []:
+                roots[layer] = layer if depth[layer[0]] == 0 else roots[parent[layer]]
+            self._gateway_roots[key] = roots
+        return roots
+    
+    def wave_layers(self, sources: List[int]):
+        """Cached BFS layering (order, depth, parent) of the strong-link mesh from sources"""
+        key = (tuple(sources), self.mesh.version)
+        layers = self._wave_layers.get(key)
+        if layers is None:
+            self.wave_cache_stats["misses"] += 1
+            layers = self.mesh.bfs_layers(sources, min_signal=self.config.min_signal)
+            self._wave_layers[key] = layers
+        return layers
+    
+    def invalidate_wave_cache(self):
+        """Drop cached layerings (leadership or topology changed)"""
+        self._wave_layers.clear()
+        self._gateway_roots.clear()
+        self._relay_thresholds.clear()
+    
+    def _propagate_python(self, theme: MusicTheme, energy_level: float,
+                          max_depth: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Reference engine: node-by-node BFS from the wave sources"""
+        # Start from conductor (or every gateway), propagate to neighbors
+        participating_nodes = []
+        participation_depths = []
+        participation_wave = self.wave_sources()
+        visited = set(participation_wave)
         
         # Simulate wave propagation with latency
         wave_depth = 0
-        max_depth = 10  # Limit propagation depth per beat
+        indptr, indices, weights = self.mesh.indptr, self.mesh.indices, self.mesh.weights
+        min_signal = self.config.min_signal
         
         while participation_wave and wave_depth < max_depth:
             next_wave = []
@@ -329,21 +798,22 @@ class WolfyOrchestrator:
                 node = self.nodes[node_id]
                 
                 # AI decision: should this node participate?
-                energy_level = 0.7 + 0.3 * math.sin(self.simulation_time_ms / 2000.0)
                 if node.make_participation_decision(energy_level):
-                    participating_nodes.add(node_id)
+                    participating_nodes.append(node_id)
+                    participation_depths.append(wave_depth)
                     node.participation_score += 1.0
                     
-                    # Set light and tone
-                    phase_offset = wave_depth * 0.2  # Phase offset based on distance from conductor
-                    node.current_light = MusicEngine.get_light_for_theme(theme, node_id, phase_offset)
-                    node.current_tone = MusicEngine.get_tone_for_theme(theme, self.beat_count)
+                    # Set light and tone (shared flyweight patterns)
+                    node.current_light, node.current_tone = MusicEngine.get_beat_patterns(
+                        theme, self.beat_count, wave_depth)
                     
                     # Propagate to neighbors
-                    for neighbor_id in node.neighbors:
+                    start, end = indptr[node_id], indptr[node_id + 1]
+                    for neighbor_id, strength in zip(indices[start:end].tolist(),
+                                                     weights[start:end].tolist()):
                         if neighbor_id not in visited:
                             # Consider signal strength for propagation
-                            if node.signal_strength.get(neighbor_id, 0) > 0.3:
+                            if strength > min_signal:
                                 next_wave.append(neighbor_id)
                                 visited.add(neighbor_id)
                     
@@ -353,56 +823,195 @@ class WolfyOrchestrator:
             participation_wave = next_wave
             wave_depth += 1
         
+        return (np.array(participating_nodes, dtype=np.int64),
+                np.array(participation_depths, dtype=np.int16), wave_depth)
+    
+    def _propagate_frontier(self, theme: MusicTheme, energy_level: float,
+                            max_depth: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Vectorized engine: each wave is a NumPy frontier over the CSR mesh"""
+        sources = self.wave_sources()
+        key = (tuple(sources), self.mesh.version)
+        cached = key in self._wave_layers
+        layers = self.wave_layers(sources)
+        # The layering only yields the wave when every relay joins; leadership is
+        # fixed for the show, so below the relays' threshold skip the decision pass
+        result = None
+        if energy_level > self._relay_threshold(key, layers, max_depth):
+            result = self._propagate_layered(theme, energy_level, max_depth, layers)
+        if result is not None:
+            self.wave_cache_stats["fast_path_beats"] += 1
+            if cached:
+                self.wave_cache_stats["hits"] += 1
+            return result
+        self.wave_cache_stats["fallback_beats"] += 1
+        
+        store, mesh = self.nodes, self.mesh
+        frontier = np.unique(np.asarray(sources, dtype=np.int64))
+        visited = np.zeros(len(store), dtype=bool)
+        visited[frontier] = True
+        
+        waves, depths = [], []
+        wave_depth = 0
+        while frontier.size and wave_depth < max_depth:
+            active = frontier[store.participation_mask(frontier, energy_level)]
+            waves.append(active)
+            depths.append(np.full(len(active), wave_depth, dtype=np.int16))
+            
+            store.participation_score[active] += 1.0
+            light, tone = MusicEngine.get_beat_patterns(theme, self.beat_count, wave_depth)
+            store.light_handle[active] = store.light_table.intern(light)
+            store.tone_handle[active] = store.tone_table.intern(tone)
+            store.battery[active] -= 0.0001
+            
+            # Strong links to nodes not yet reached form the next wave
+            slots = mesh.edge_slots(active)
+            candidates = mesh.indices[slots[mesh.weights[slots] > self.config.min_signal]]
+            frontier = np.unique(candidates[~visited[candidates]]).astype(np.int64)
+            visited[frontier] = True
+            wave_depth += 1
+        
+        if not waves:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int16), wave_depth
+        return np.concatenate(waves), np.concatenate(depths), wave_depth
+    
+    def _relay_threshold(self, key, layers, max_depth: int) -> float:
+        """Energy above which every relay of a layering (nodes short of its last
+        layer) is willing to join, battery permitting"""
+        threshold = self._relay_thresholds.get((key, max_depth))
+        if threshold is None:
+            order, depth, _ = layers
+            relays = order[:np.searchsorted(depth[order], max_depth - 1)]
+            threshold = float(self.nodes.participation_threshold(relays).max()) if len(relays) else -np.inf
+            self._relay_thresholds[(key, max_depth)] = threshold
+        return threshold
+    
+    def _propagate_layered(self, theme: MusicTheme, energy_level: float, max_depth: int,
+                           layers) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """Single vectorized pass over a precomputed BFS layering.
+
+        Exact whenever every node that would forward the wave participates,
+        since the gated BFS then reaches exactly the cached layers. Returns
+        None otherwise so the caller falls back to a full frontier BFS.
+        """
+        order, depth, _ = layers
+        store = self.nodes
+        reached = order[:np.searchsorted(depth[order], max_depth)]
+        reached_depth = depth[reached]
+        decisions = store.participation_mask(reached, energy_level)
+        if not decisions[reached_depth < max_depth - 1].all():
+            return None
+        
+        active = reached[decisions]
+        active_depth = reached_depth[decisions]
+        light_handles = np.empty(max_depth, dtype=np.int32)
+        for wave_depth in range(max_depth):
+            light, tone = MusicEngine.get_beat_patterns(theme, self.beat_count, wave_depth)
+            light_handles[wave_depth] = store.light_table.intern(light)
+        
+        store.participation_score[active] += 1.0
+        store.light_handle[active] = light_handles[active_depth]
+        store.tone_handle[active] = store.tone_table.intern(tone)
+        store.battery[active] -= 0.0001
+        
+        wave_depth = int(reached_depth[-1]) + 1 if reached.size else 0
+        return active, active_depth.astype(np.int16), wave_depth
+    
+    def _propagate_events(self, theme: MusicTheme, energy_level: float,
+                          max_depth: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Latency-accurate engine: discrete-event delivery of the beat message"""
+        store = self.nodes
+        participating, depths, arrivals, messages, wave_depth = propagate_events(
+            self.mesh, store.latency_ms, self.wave_sources(),
+            lambda node_ids: store.participation_mask(node_ids, energy_level), max_depth,
+            min_signal=self.config.min_signal)
+        self.last_arrival_ms = arrivals
+        self.message_stats["messages"] += messages
+        self.message_stats["beats"] += 1
+        
+        light_handles = np.empty(max_depth, dtype=np.int32)
+        for depth in range(max_depth):
+            light, tone = MusicEngine.get_beat_patterns(theme, self.beat_count, depth)
+            light_handles[depth] = store.light_table.intern(light)
+        store.participation_score[participating] += 1.0
+        store.light_handle[participating] = light_handles[depths]
+        store.tone_handle[participating] = store.tone_table.intern(tone)
+        store.battery[participating] -= 0.0001
+        return participating, depths, wave_depth
+    
+    def synchronize_beat(self, theme: MusicTheme):
+        """Synchronize a musical beat across the mesh network"""
+        self._ensure_event_log_open()
+        self.current_theme = theme
+        self.beat_count += 1
+        
+        # AI decision: energy is shared by every node this beat
+        energy_level = 0.7 + 0.3 * math.sin(self.simulation_time_ms / 2000.0)
+        max_depth = self.config.max_depth  # Limit propagation depth per beat
+        
+        # Every engine returns (participant ids, their hop depths, wave_depth).
+        # wave_depth is the number of hop layers the beat reached, sources
+        # being layer 0: one more than the deepest hop at which any node got
+        # the message, whether or not it joined in (at most max_depth)
+        
+        self.last_arrival_ms = None
+        if self.propagation_engine == "frontier":
+            participating, depths, wave_depth = self._propagate_frontier(theme, energy_level, max_depth)
+        elif self.propagation_engine == "event":
+            participating, depths, wave_depth = self._propagate_events(theme, energy_level, max_depth)
+        else:
+            participating, depths, wave_depth = self._propagate_python(theme, energy_level, max_depth)
+        # Who took part this beat and how many hops from the wave sources
+        self.last_wave = (participating, depths)
+        self.last_wave_depth = wave_depth
+        
         # Record participation for heatmap
-        participation_snapshot = {node_id: self.nodes[node_id].participation_score 
-                                 for node_id in participating_nodes}
-        self.participation_history.append(participation_snapshot)
+        self.participation_history.record(participating, self.nodes.participation_score)
+        self.metrics.record_beat(self)
         
         self._log_event("beat", f"{theme.value} beat #{self.beat_count}", {
-            "participating_nodes": len(participating_nodes),
+            "participating_nodes": len(participating),
             "wave_depth": wave_depth,
             "theme": theme.value
         })
+        if self.event_sink is not None:
+            self.event_sink.flush()
+        if self.archive is not None:
+            self.archive.record_beat(self)
         
-        return participating_nodes
+        return set(participating.tolist())
     
-    def simulate_concert(self, duration_seconds: float = 60.0, bpm: float = 120.0):
-        """Run the full concert simulation"""
+    def simulate_concert(self, duration_seconds: float = 60.0, bpm: float = 120.0,
+                         checkpoint_path: Optional[str] = None, checkpoint_every: int = 64):
+        """Run the full concert simulation.
+
+        Picks up after the beats already performed, so a show restored with
+        load() continues where it stopped (see resume_concert). With
+        checkpoint_path the show is saved there every checkpoint_every beats.
+        """
         beat_interval_ms = (60.0 / bpm) * 1000.0
         total_beats = int((duration_seconds * 1000.0) / beat_interval_ms)
+        first_beat = self.beat_count
+        self.concert = {"duration_seconds": duration_seconds, "bpm": bpm}
         
-        print(f"\n🎭 CONCERT BEGINNING 🎭")
-        print(f"   Duration: {duration_seconds}s at {bpm} BPM = {total_beats} beats")
-        print(f"   Themes: Blade Runner → Peter and the Wolf\n")
+        if first_beat == 0:
+            print(f"\n🎭 CONCERT BEGINNING 🎭")
+            print(f"   Duration: {duration_seconds}s at {bpm} BPM = {total_beats} beats")
+            print(f"   Themes: Blade Runner → Peter and the Wolf\n")
+            self._log_event("concert_start", "🐺 Wolfy's mesh concert begins!", {
+                "duration_s": duration_seconds,
+                "bpm": bpm
+            })
+        else:
+            print(f"\n🎭 CONCERT RESUMING at beat {first_beat}/{total_beats} 🎭\n")
+            self._log_event("concert_resume", f"🐺 Concert resumes at beat {first_beat}", {
+                "duration_s": duration_seconds,
+                "bpm": bpm
+            })
         
-        self._log_event("concert_start", "🐺 Wolfy's mesh concert begins!", {
-            "duration_s": duration_seconds,
-            "bpm": bpm
-        })
+        theme_schedule = concert_theme_schedule(total_beats)
         
-        # Musical structure
-        themes = [
-            (MusicTheme.BLADE_RUNNER, 16),
-            (MusicTheme.PETER_WOLF_BIRD, 8),
-            (MusicTheme.PETER_WOLF_DUCK, 8),
-            (MusicTheme.BLADE_RUNNER, 8),
-            (MusicTheme.PETER_WOLF_CAT, 8),
-            (MusicTheme.PETER_WOLF_WOLF, 12),
-            (MusicTheme.BLADE_RUNNER, 8),
-            (MusicTheme.PETER_WOLF_HUNTERS, 8),
-            (MusicTheme.BLADE_RUNNER, 16),
-        ]
-        
-        theme_schedule = []
-        for theme, beats in themes:
-            theme_schedule.extend([theme] * beats)
-        
-        # Pad or trim to match total beats
-        while len(theme_schedule) < total_beats:
-            theme_schedule.append(MusicTheme.BLADE_RUNNER)
-        theme_schedule = theme_schedule[:total_beats]
-        
-        for beat_num in range(total_beats):
+        concert_start = time.perf_counter()
+        for beat_num in range(first_beat, total_beats):
             self.simulation_time_ms = beat_num * beat_interval_ms
             current_theme = theme_schedule[beat_num]
             
@@ -410,7 +1019,7 @@ class WolfyOrchestrator:
             participating = self.synchronize_beat(current_theme)
             
             # Periodic leadership rotation
-            if beat_num % 16 == 0 and beat_num > 0:
+            if beat_num % self.config.rotation_period_beats == 0 and beat_num > 0:
                 self.rotate_leadership()
             
             # Progress indicator
@@ -418,18 +1027,32 @@ class WolfyOrchestrator:
                 progress = (beat_num / total_beats) * 100
                 print(f"   🎵 Beat {beat_num}/{total_beats} ({progress:.1f}%) - "
                       f"{current_theme.value} - {len(participating)} nodes active")
+            
+            if checkpoint_path and (beat_num + 1) % checkpoint_every == 0 and beat_num + 1 < total_beats:
+                self.save(checkpoint_path)
         
         self._log_event("concert_end", "🐺 Concert complete! What a show!", {
             "total_beats": total_beats,
-            "final_participation": len(self.participation_history[-1]) if self.participation_history else 0
+            "final_participation": self.participation_history.count(-1) if self.participation_history else 0
         })
         
-        print(f"\n✨ CONCERT COMPLETE ✨\n")
+        elapsed = time.perf_counter() - concert_start
+        print(f"\n✨ CONCERT COMPLETE ✨")
+        print(f"   {(total_beats - first_beat) / max(elapsed, 1e-9):.1f} beats/s "
+              f"({self.propagation_engine} engine)\n")
+    
+    def resume_concert(self, checkpoint_path: Optional[str] = None, checkpoint_every: int = 64):
+        """Finish the concert a checkpoint was taken during"""
+        if self.concert is None:
+            raise RuntimeError("no concert in progress to resume")
+        self.simulate_concert(checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every,
+                              **self.concert)
     
     def get_statistics(self) -> Dict:
         """Get concert statistics"""
-        total_participation = sum(n.participation_score for n in self.nodes)
-        active_nodes = sum(1 for n in self.nodes if n.participation_score > 0)
+        scores = self.nodes.participation_score
+        total_participation = float(scores.sum())
+        active_nodes = int(np.count_nonzero(scores > 0))
         avg_participation = total_participation / active_nodes if active_nodes > 0 else 0
         
         return {
@@ -437,19 +1060,195 @@ class WolfyOrchestrator:
             "active_nodes": active_nodes,
             "participation_rate": active_nodes / self.num_nodes,
             "avg_participation_score": avg_participation,
-            "total_events": len(self.event_log),
+            "total_events": sum(self.event_counts.values()),
             "beats_performed": self.beat_count,
             "gateways": list(self.gateways),
-            "conductor": self.conductor_id
+            "conductor": self.conductor_id,
+            "gateway_election": self.election.get_statistics(),
+            "propagation_mode": self.propagation_mode,
+            "config": asdict(self.config),
+            "wave_cache": dict(self.wave_cache_stats),
+            "beat_messages": dict(self.message_stats),
+            "metrics": self.metrics.as_dict(self.nodes.battery)
+        }
+    
+    def light_field(self) -> LightField:
+        """Whole-crowd brightness evaluator for the lights as they are now"""
+        return LightField(self.nodes.light_handle, self.nodes.light_table)
+    
+    def open_archive(self, path: str, chunk_beats: int = 32,
+                     compress: bool = False) -> ConcertArchiveWriter:
+        """Start recording every beat and event into a columnar archive directory.
+
+        Chunks are memory-mappable .npy files; compress=True trades that for
+        smaller compressed .npz chunks (see ConcertArchiveWriter).
+        """
+        self.archive = ConcertArchiveWriter(path, len(self.nodes), chunk_beats, compress)
+        return self.archive
+    
+    def close_archive(self):
+        """Finish the archive started by open_archive"""
+        if self.archive is not None:
+            self.archive.close()
+            print(f"🗄️  Concert archive written to {self.archive.path} "
+                  f"({self.archive.num_beats} beats)")
+            self.archive = None
+    
+    def close(self):
+        """End the show: finish the archive, write out queued events and close
+        the event log and any history spill file"""
+        self.close_archive()
+        if self.event_sink is not None and not self.event_sink.closed:
+            self.event_sink.close()
+        self.participation_history.close()
+    
+    def __enter__(self) -> "WolfyOrchestrator":
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    # Node columns saved verbatim in checkpoints
+    CHECKPOINT_NODE_FIELDS = ("positions", "state", "battery", "consent_strobe", "latency_ms",
+                              "light_handle", "tone_handle", "participation_score",
+                              "leadership_score", "gateway_fitness")
+    
+    def save(self, path: str) -> int:
+        """Checkpoint the whole show to one binary file; returns bytes written.
+
+        Nodes, mesh, leadership, clocks, participation history, metrics and
+        both RNG states go in as raw arrays plus a JSON header (see
+        wolfy_checkpoint). Streams already on disk (event sink, archive)
+        are not copied.
+        """
+        start = time.perf_counter()
+        store = self.nodes
+        arrays = {f"nodes.{name}": getattr(store, name) for name in self.CHECKPOINT_NODE_FIELDS}
+        arrays.update({"mesh.indptr": self.mesh.indptr, "mesh.indices": self.mesh.indices,
+                       "mesh.weights": self.mesh.weights,
+                       "last_wave.participants": self.last_wave[0], "last_wave.depths": self.last_wave[1]})
+        if self.last_arrival_ms is not None:
+            arrays["last_arrival_ms"] = self.last_arrival_ms
+        arrays.update({f"history.{k}": v for k, v in self.participation_history.to_arrays().items()})
+        metric_scalars, metric_arrays = self.metrics.state()
+        arrays.update({f"metrics.{k}": v for k, v in metric_arrays.items()})
+        
+        np_state = np.random.get_state()
+        arrays["rng.numpy_keys"] = np_state[1]
+        py_state = random.getstate()
+        header = {
+            "num_nodes": self.num_nodes,
+            "arena_size": list(self.arena_size),
+            "propagation_engine": self.propagation_engine,
+            "propagation_mode": self.propagation_mode,
+            "seed": self.seed,
+            "crowd_layout": layout_name(self.crowd_layout),
+            "config": asdict(self.config),
+            "gateways": sorted(self.gateways),
+            "conductor_id": self.conductor_id,
+            "current_theme": self.current_theme.value,
+            "beat_count": self.beat_count,
+            "last_wave_depth": self.last_wave_depth,
+            "simulation_time_ms": self.simulation_time_ms,
+            "concert": self.concert,
+            "light_patterns": [[list(p.color), p.intensity, p.frequency, p.phase]
+                               for p in store.light_table.patterns],
+            "tone_patterns": [[p.frequency, p.duration_ms, p.volume, p.waveform]
+                              for p in store.tone_table.patterns],
+            "event_counts": self.event_counts,
+            "event_log": list(self.event_log),
+            "wave_cache_stats": self.wave_cache_stats,
+            "message_stats": self.message_stats,
+            "history_keyframe_interval": self.participation_history.keyframe_interval,
+            "metrics": metric_scalars,
+            "rng": {"python": [py_state[0], list(py_state[1]), py_state[2]],
+                    "numpy": [np_state[0], int(np_state[2]), int(np_state[3]), float(np_state[4])]},
         }
+        size = save_checkpoint(path, header, arrays)
+        print(f"💾 Checkpoint saved to {path} ({size / 1e6:.1f} MB in "
+              f"{time.perf_counter() - start:.2f}s)")
+        return size
+    
+    @classmethod
+    def load(cls, path: str, event_log_path: Optional[str] = None,
+             history_spill_path: Optional[str] = None) -> "WolfyOrchestrator":
+        """Resume a show saved with save(), skipping node spawn and mesh build.
+
+        Arrays come back as copy-on-write memory maps, so cold start is
+        mostly disk reads. The global random and numpy.random states are
+        restored too, so the resumed show continues the same sequence.
+        With history_spill_path the saved history is rewritten to that file
+        and keeps spilling there; the keyframe interval is the saved one.
+        """
+        start = time.perf_counter()
+        header, arrays = load_checkpoint(path)
+        wolfy = cls.__new__(cls)
+        wolfy._init_state(header["num_nodes"], tuple(header["arena_size"]), header["propagation_engine"],
+                          header["propagation_mode"], event_log_path, header.get("seed"),
+                          header.get("crowd_layout", "clusters"), ShowConfig(**header["config"]),
+                          None, header["history_keyframe_interval"])
+        
+        store = NodeStore(np.empty((0, 2)))
+        for name in cls.CHECKPOINT_NODE_FIELDS:
+            setattr(store, name, arrays[f"nodes.{name}"])
+        store.mesh = MeshGraph(arrays["mesh.indptr"], arrays["mesh.indices"], arrays["mesh.weights"])
+        for color, intensity, frequency, phase in header["light_patterns"]:
+            store.light_table.intern(LightPattern(tuple(color), intensity, frequency, phase))
+        for frequency, duration_ms, volume, waveform in header["tone_patterns"]:
+            store.tone_table.intern(TonePattern(frequency, duration_ms, volume, waveform))
+        wolfy.nodes = store
+        
+        wolfy.election = GatewayElection(store, wolfy.config.num_gateways)
+        wolfy.gateways = set(header["gateways"])
+        wolfy.conductor_id = header["conductor_id"]
+        wolfy.current_theme = MusicTheme(header["current_theme"])
+        wolfy.beat_count = header["beat_count"]
+        wolfy.last_wave_depth = header.get("last_wave_depth", 0)
+        wolfy.simulation_time_ms = header["simulation_time_ms"]
+        wolfy.concert = header.get("concert")
+        wolfy.event_counts = header["event_counts"]
+        wolfy.event_log.extend(header["event_log"])
+        wolfy.wave_cache_stats = header["wave_cache_stats"]
+        wolfy.message_stats = header["message_stats"]
+        wolfy.last_wave = (np.array(arrays["last_wave.participants"]), np.array(arrays["last_wave.depths"]))
+        if "last_arrival_ms" in arrays:
+            wolfy.last_arrival_ms = np.array(arrays["last_arrival_ms"])
+        wolfy.participation_history = ParticipationHistory.from_arrays(
+            {k[len("history."):]: v for k, v in arrays.items() if k.startswith("history.")},
+            header["history_keyframe_interval"], history_spill_path)
+        wolfy.metrics = ShowMetrics.from_state(
+            header["metrics"], {k[len("metrics."):]: v for k, v in arrays.items() if k.startswith("metrics.")})
+        
+        py_version, py_internal, py_gauss = header["rng"]["python"]
+        random.setstate((py_version, tuple(py_internal), py_gauss))
+        kind, pos, has_gauss, cached_gaussian = header["rng"]["numpy"]
+        np.random.set_state((kind, np.array(arrays["rng.numpy_keys"]), pos, has_gauss, cached_gaussian))
+        
+        print(f"🐺 Wolfy resumed from {path}: {wolfy.num_nodes:,} nodes, beat {wolfy.beat_count} "
+              f"({time.perf_counter() - start:.2f}s)")
+        return wolfy
+    
+    def export_metrics(self, filename: str = "wolfy_metrics.prom"):
+        """Write the show metrics in Prometheus text format"""
+        with open(filename, 'w') as f:
+            f.write(self.metrics.to_prometheus(self.nodes.battery))
+        print(f"📈 Metrics exported to {filename}")
     
     def export_event_log(self, filename: str = "wolfy_concert_log.json"):
-        """Export the event log to a file"""
+        """Export the event log to a file (closes a compressed .gz/.zst event stream)"""
         with open(filename, 'w') as f:
-            json.dump({
-                "statistics": self.get_statistics(),
-                "events": self.event_log
-            }, f, indent=2)
+            if self.event_sink is None:
+                json.dump({
+                    "statistics": self.get_statistics(),
+                    "events": self.event_log
+                }, f, indent=2)
+            else:
+                # Same file format, rebuilt from the stream one event at a time.
+                # A compressed stream can only be read back once closed, which
+                # ends event logging for this show
+                if self.event_sink.compression is not None and not self.event_sink.closed:
+                    self.event_sink.close()
+                write_event_log_json(f, self.get_statistics(), self.event_sink.read_events())
         print(f"📝 Event log exported to {filename}")
 
 
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+🕸️ WOLFY MESH GRAPH 🕸️
+Compressed-sparse-row adjacency for the audience mesh network
+"""
+
+import itertools
+from collections.abc import Mapping, Set as AbstractSet
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+_mesh_versions = itertools.count()
+
+
+class MeshGraph:
+    """Undirected mesh stored in CSR form.
+
+    Row ``i`` of the graph holds the neighbors of node ``i`` in
+    ``indices[indptr[i]:indptr[i + 1]]`` (sorted ascending) and the matching
+    signal strengths in ``weights``. Every edge is stored in both directions,
+    so the arrays line up with ``scipy.sparse.csr_matrix``.
+
+    Meshes are treated as immutable: a topology change means a new MeshGraph,
+    and every instance gets a unique ``version`` that caches can key on.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)
+        self.version = next(_mesh_versions)
+
+    @classmethod
+    def empty(cls, num_nodes: int) -> 'MeshGraph':
+        """A mesh with no connections"""
+        return cls(np.zeros(num_nodes + 1, dtype=np.int64),
+                   np.empty(0, dtype=np.int32),
+                   np.empty(0, dtype=np.float32))
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, src, dst, weights) -> 'MeshGraph':
+        """Build a symmetric CSR mesh from an undirected edge list (each pair once)"""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float32)
+
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        both = np.concatenate([weights, weights])
+
+        order = np.argsort(rows * max(num_nodes, 1) + cols)  # keys are unique
+        counts = np.bincount(rows, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, cols[order], both[order])
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected connections"""
+        return len(self.indices) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def degree(self) -> np.ndarray:
+        """Number of neighbors per node"""
+        return np.diff(self.indptr)
+
+    def neighbors(self, node_id: int) -> np.ndarray:
+        """Sorted neighbor ids of a node"""
+        return self.indices[self.indptr[node_id]:self.indptr[node_id + 1]]
+
+    def signal_strengths(self, node_id: int) -> np.ndarray:
+        """Signal strengths aligned with neighbors(node_id)"""
+        return self.weights[self.indptr[node_id]:self.indptr[node_id + 1]]
+
+    def edge_weight(self, node_id: int, other_id: int, default: Optional[float] = None):
+        """Signal strength of a single connection, or default if not connected"""
+        row = self.neighbors(node_id)
+        pos = np.searchsorted(row, other_id)
+        if pos < len(row) and row[pos] == other_id:
+            return float(self.weights[self.indptr[node_id] + pos])
+        return default
+
+    def edge_slots(self, node_ids: np.ndarray) -> np.ndarray:
+        """Positions in indices/weights of every edge leaving the given nodes"""
+        starts = self.indptr[node_ids]
+        counts = self.indptr[np.asarray(node_ids) + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+
+    def bfs_layers(self, sources, min_signal: float = 0.0, max_depth: Optional[int] = None):
+        """Multi-source BFS over links stronger than min_signal.
+
+        Returns ``(order, depth, parent)``: reached node ids in visiting order
+        (by depth, then id), hop count per node (-1 if unreached) and BFS-tree
+        parent per node (-1 for sources and unreached nodes). ``max_depth``
+        caps the number of layers, sources being layer 0.
+        """
+        depth = np.full(self.num_nodes, -1, dtype=np.int32)
+        parent = np.full(self.num_nodes, -1, dtype=np.int32)
+        frontier = np.unique(np.asarray(list(sources), dtype=np.int64))
+        depth[frontier] = 0
+        layers = [frontier]
+        hops = 0
+        while frontier.size and (max_depth is None or hops + 1 < max_depth):
+            counts = self.indptr[frontier + 1] - self.indptr[frontier]
+            src = np.repeat(frontier, counts)
+            slots = self.edge_slots(frontier)
+            strong = self.weights[slots] > min_signal
+            dst, src = self.indices[slots][strong], src[strong]
+            new = depth[dst] < 0
+            frontier, first = np.unique(dst[new], return_index=True)
+            frontier = frontier.astype(np.int64)
+            hops += 1
+            depth[frontier] = hops
+            parent[frontier] = src[new][first]
+            if frontier.size:
+                layers.append(frontier)
+        return np.concatenate(layers), depth, parent
+
+    def row_ids(self) -> np.ndarray:
+        """Source node of every stored (directed) edge"""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int32), self.degree())
+
+    def neighbor_set(self, node_id: int) -> 'NeighborSetView':
+        return NeighborSetView(self, node_id)
+
+    def signal_map(self, node_id: int) -> 'SignalStrengthView':
+        return SignalStrengthView(self, node_id)
+
+    def to_scipy(self):
+        """Return the mesh as a scipy.sparse.csr_matrix (requires scipy)"""
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError as e:
+            raise ImportError("scipy is required for MeshGraph.to_scipy()") from e
+        n = self.num_nodes
+        return csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+
+
+class NeighborSetView(AbstractSet):
+    """Read-only, set-like view of one node's neighbors"""
+
+    __slots__ = ('_graph', '_node_id')
+
+    def __init__(self, graph: MeshGraph, node_id: int):
+        self._graph = graph
+        self._node_id = node_id
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, other_id) -> bool:
+        return self._graph.edge_weight(self._node_id, other_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph.neighbors(self._node_id).tolist())
+
+    def __len__(self) -> int:
+        return int(self._graph.indptr[self._node_id + 1] - self._graph.indptr[self._node_id])
+
+    def __repr__(self) -> str:
+        return f"NeighborSetView({set(self)})"
+
+
+class SignalStrengthView(Mapping):
+    """Read-only, dict-like view of one node's {neighbor_id: signal_strength}"""
+
+    __slots__ = ('_graph', '_node_id')
+
+    def __init__(self, graph: MeshGraph, node_id: int):
+        self._graph = graph
+        self._node_id = node_id
+
+    def __getitem__(self, other_id) -> float:
+        strength = self._graph.edge_weight(self._node_id, other_id)
+        if strength is None:
+            raise KeyError(other_id)
+        return strength
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph.neighbors(self._node_id).tolist())
+
+    def __len__(self) -> int:
+        return int(self._graph.indptr[self._node_id + 1] - self._graph.indptr[self._node_id])
+
+    def __repr__(self) -> str:
+        return f"SignalStrengthView({dict(self)})"
+
+
+# Cells examined for each cell: itself plus half of its 8 neighbors, so
+# every pair of adjacent cells is visited exactly once
+_HALF_NEIGHBORHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _grid_pairs(positions: np.ndarray, max_distance: float, cell_size: float,
+                chunk_pairs: int):
+    """Pure-NumPy pair search: sort nodes by grid cell, then test cell blocks"""
+    cells = np.floor(positions / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    ny = int(cells[:, 1].max()) + 3  # padding so (cx, cy +/- 1) never wraps
+    keys = cells[:, 0] * ny + (cells[:, 1] + 1)
+
+    order = np.argsort(keys, kind='stable')
+    sorted_x = np.ascontiguousarray(positions[order, 0])
+    sorted_y = np.ascontiguousarray(positions[order, 1])
+    max_distance_sq = max_distance * max_distance
+    cell_keys, cell_start, cell_count = np.unique(keys[order], return_index=True,
+                                                  return_counts=True)
+
+    src_parts, dst_parts, dist_parts = [], [], []
+    for dx, dy in _HALF_NEIGHBORHOOD:
+        # Match every occupied cell against its (dx, dy) neighbor cell
+        target = cell_keys + dx * ny + dy
+        pos = np.searchsorted(cell_keys, target)
+        pos_clipped = np.minimum(pos, len(cell_keys) - 1)
+        hit = cell_keys[pos_clipped] == target
+        a_start, a_count = cell_start[hit], cell_count[hit]
+        b_start, b_count = cell_start[pos_clipped[hit]], cell_count[pos_clipped[hit]]
+        block_sizes = a_count * b_count
+
+        # Process cell pairs in chunks that cap the number of candidate pairs
+        bounds = np.cumsum(block_sizes)
+        first = 0
+        while first < len(block_sizes):
+            budget = (bounds[first - 1] if first else 0) + chunk_pairs
+            last = max(int(np.searchsorted(bounds, budget, side='right')), first + 1)
+            sizes = block_sizes[first:last]
+            block = np.repeat(np.arange(first, last, dtype=np.int32), sizes)
+            local = np.arange(int(sizes.sum()), dtype=np.int64)
+            local -= np.repeat(np.cumsum(sizes) - sizes, sizes)
+            row, col = np.divmod(local, b_count[block])
+            i = a_start[block] + row
+            j = b_start[block] + col
+            if dx == 0 and dy == 0:
+                keep = i < j
+                i, j = i[keep], j[keep]
+
+            ddx = sorted_x[i] - sorted_x[j]
+            ddy = sorted_y[i] - sorted_y[j]
+            distance_sq = ddx * ddx + ddy * ddy
+            close = distance_sq <= max_distance_sq
+            src_parts.append(order[i[close]])
+            dst_parts.append(order[j[close]])
+            dist_parts.append(np.sqrt(distance_sq[close]))
+            first = last
+
+    if not src_parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+    return np.concatenate(src_parts), np.concatenate(dst_parts), np.concatenate(dist_parts)
+
+
+def _kdtree_pairs(positions: np.ndarray, max_distance: float):
+    """Pair search through scipy's cKDTree.query_pairs"""
+    from scipy.spatial import cKDTree
+
+    pairs = cKDTree(positions).query_pairs(max_distance, output_type='ndarray')
+    src, dst = pairs[:, 0].astype(np.int64), pairs[:, 1].astype(np.int64)
+    delta = positions[src] - positions[dst]
+    distance = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+    return src, dst, distance
+
+
+def build_proximity_mesh(positions, max_distance: float, cell_size: Optional[float] = None,
+                         backend: str = 'auto', chunk_pairs: int = 4_000_000) -> MeshGraph:
+    """Connect every pair of nodes within max_distance meters of each other.
+
+    Signal strength falls off linearly with distance (1.0 touching, 0.0 at
+    max range). ``backend`` is 'grid' (pure NumPy cell-sorted blocks),
+    'kdtree' (scipy cKDTree) or 'auto' (kdtree when scipy is installed).
+    """
+    positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 2)
+    n = len(positions)
+    if cell_size is None:
+        cell_size = max_distance
+    if cell_size < max_distance:
+        raise ValueError(f"cell_size ({cell_size}) must be >= max_distance ({max_distance})")
+
+    if backend == 'auto':
+        try:
+            import scipy.spatial  # noqa: F401
+            backend = 'kdtree'
+        except ImportError:
+            backend = 'grid'
+
+    if n < 2:
+        return MeshGraph.empty(n)
+    if backend == 'kdtree':
+        src, dst, distance = _kdtree_pairs(positions, max_distance)
+    elif backend == 'grid':
+        src, dst, distance = _grid_pairs(positions, max_distance, cell_size, chunk_pairs)
+    else:
+        raise ValueError(f"unknown mesh backend: {backend!r}")
+
+    return MeshGraph.from_edges(n, src, dst, 1.0 - (distance / max_distance))
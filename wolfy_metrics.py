@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+📈 WOLFY SHOW METRICS 📈
+Running sync-skew, coverage and load numbers, kept up to date beat by beat
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Time-to-reach is binned at REACH_BIN_MS up to REACH_MAX_MS: bin i holds
+# ((i - 1) * REACH_BIN_MS, i * REACH_BIN_MS] (bin 0 the sources, at 0 ms)
+# and one more bin catches everything later. Prometheus le buckets are
+# cumulative counts up to a bin, so they count values <= their edge
+REACH_BIN_MS = 1.0
+REACH_MAX_MS = 1000.0
+PROMETHEUS_REACH_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class ShowMetrics:
+    """Aggregates the numbers shows are tuned against.
+
+    Every beat folds into fixed-size running state: coverage and skew sums
+    and extremes, a wave depth histogram, a binned time-to-reach histogram,
+    per-node gateway tenure and how many participants each gateway served
+    (every participant counts for its nearest gateway by strong-link hops,
+    the one whose branch of the gateways' BFS it sits in). Nothing is kept per beat, so a beat costs
+    one bincount over its participants and reports cost the same at beat 10
+    as at beat 10,000. Time-to-reach and sync skew are the simulated
+    message arrival times with the "event" engine, whose link delays follow
+    signal strength (and so distance). The other engines only know hop
+    depths, so there both are estimated as hop depth times the node's
+    latency; ``timing`` in as_dict() says which kind of beats went in.
+    """
+
+    def __init__(self, num_nodes: int, initial_battery: float = 1.0):
+        self.num_nodes = num_nodes
+        self.beats = 0
+        self.first_time_ms = None
+        self.last_time_ms = 0.0
+        self.initial_battery = initial_battery
+
+        self.coverage_last = 0.0
+        self.coverage_sum = 0.0
+        self.coverage_min = 1.0
+        self.coverage_max = 0.0
+
+        self.skew_last_ms = 0.0
+        self.skew_sum_ms = 0.0
+        self.skew_max_ms = 0.0
+
+        self.depth_counts = np.zeros(0, dtype=np.int64)
+        self.reach_counts = np.zeros(int(REACH_MAX_MS / REACH_BIN_MS) + 2, dtype=np.int64)
+        self.reach_sum_ms = 0.0
+        # Beats whose times came from hop counts rather than simulated arrivals
+        self.hop_estimated_beats = 0
+
+        self.gateway_beats = np.zeros(num_nodes, dtype=np.int64)
+        self.served_mean_last = 0.0
+        self.served_max_last = 0
+        self.served_max = 0
+        self.unserved_last = 0
+
+    def record_beat(self, wolfy) -> None:
+        """Fold in the beat the orchestrator just synchronized"""
+        participants, depths = wolfy.last_wave
+        arrivals = wolfy.last_arrival_ms
+        if arrivals is None:
+            arrivals = depths * wolfy.nodes.latency_ms[participants]
+            self.hop_estimated_beats += 1
+
+        self.beats += 1
+        if self.first_time_ms is None:
+            self.first_time_ms = wolfy.simulation_time_ms
+        self.last_time_ms = wolfy.simulation_time_ms
+
+        coverage = len(participants) / self.num_nodes if self.num_nodes else 0.0
+        self.coverage_last = coverage
+        self.coverage_sum += coverage
+        self.coverage_min = min(self.coverage_min, coverage)
+        self.coverage_max = max(self.coverage_max, coverage)
+
+        skew = float(arrivals.max() - arrivals.min()) if len(arrivals) else 0.0
+        self.skew_last_ms = skew
+        self.skew_sum_ms += skew
+        self.skew_max_ms = max(self.skew_max_ms, skew)
+
+        if len(depths):
+            counts = np.bincount(depths.astype(np.int64))
+            if len(counts) > len(self.depth_counts):
+                self.depth_counts = np.pad(self.depth_counts, (0, len(counts) - len(self.depth_counts)))
+            self.depth_counts[:len(counts)] += counts
+            bins = np.minimum(np.ceil(arrivals / REACH_BIN_MS).astype(np.int64), len(self.reach_counts) - 1)
+            self.reach_counts += np.bincount(bins, minlength=len(self.reach_counts))
+            self.reach_sum_ms += float(arrivals.sum())
+
+        gateways = list(wolfy.gateways)
+        self.gateway_beats[gateways] += 1
+        serving = wolfy.gateway_assignment()[participants] if gateways else np.full(len(participants), -1)
+        served = np.bincount(serving[serving >= 0], minlength=self.num_nodes)[gateways]
+        self.served_mean_last = float(served.mean()) if gateways else 0.0
+        self.served_max_last = int(served.max()) if gateways else 0
+        self.served_max = max(self.served_max, self.served_max_last)
+        self.unserved_last = int(np.count_nonzero(serving < 0))
+
+    def state(self) -> Tuple[Dict, Dict[str, np.ndarray]]:
+        """(scalars, arrays) that fully describe the running state, for checkpoints"""
+        scalars = {k: v for k, v in vars(self).items() if not isinstance(v, np.ndarray)}
+        arrays = {k: v for k, v in vars(self).items() if isinstance(v, np.ndarray)}
+        return scalars, arrays
+
+    @classmethod
+    def from_state(cls, scalars: Dict, arrays: Dict[str, np.ndarray]) -> "ShowMetrics":
+        metrics = cls(scalars["num_nodes"])
+        vars(metrics).update(scalars)
+        vars(metrics).update({k: np.array(v) for k, v in arrays.items()})
+        return metrics
+
+    def reach_percentiles(self, quantiles=(0.5, 0.9, 0.99)) -> Dict[str, float]:
+        """Time-to-reach percentiles over all beats, in ms rounded up to REACH_BIN_MS
+        (times past REACH_MAX_MS read as REACH_MAX_MS + REACH_BIN_MS)"""
+        total = int(self.reach_counts.sum())
+        if total == 0:
+            return {f"p{round(q * 100)}": 0.0 for q in quantiles}
+        cumulative = np.cumsum(self.reach_counts)
+        return {f"p{round(q * 100)}": float(np.searchsorted(cumulative, q * total) * REACH_BIN_MS)
+                for q in quantiles}
+
+    def timing(self) -> str:
+        """How the time metrics were obtained: "simulated", "hop_estimate" or "mixed" """
+        if self.hop_estimated_beats == 0:
+            return "simulated"
+        return "hop_estimate" if self.hop_estimated_beats == self.beats else "mixed"
+
+    def as_dict(self, battery: np.ndarray = None) -> Dict:
+        """Current values; pass the battery array to include drain rates"""
+        beats = max(self.beats, 1)
+        reached = int(self.reach_counts.sum())
+        served = self.gateway_beats[self.gateway_beats > 0]
+        metrics = {
+            "beats": self.beats,
+            "timing": self.timing(),
+            "coverage": {"last": self.coverage_last, "mean": self.coverage_sum / beats,
+                         "min": self.coverage_min if self.beats else 0.0, "max": self.coverage_max},
+            "wave_depth_histogram": self.depth_counts.tolist(),
+            "time_to_reach_ms": dict(self.reach_percentiles(),
+                                     mean=self.reach_sum_ms / reached if reached else 0.0),
+            "sync_skew_ms": {"last": self.skew_last_ms, "mean": self.skew_sum_ms / beats,
+                             "max": self.skew_max_ms},
+            "gateway_load": {"participants_served_mean": self.served_mean_last,
+                             "participants_served_max": self.served_max_last,
+                             "participants_served_max_ever": self.served_max,
+                             "participants_unserved": self.unserved_last,
+                             "distinct_gateways": int(len(served)),
+                             "max_beats_as_gateway": int(served.max()) if len(served) else 0},
+        }
+        if battery is not None:
+            drained = self.initial_battery - float(battery.mean())
+            elapsed_s = (self.last_time_ms - (self.first_time_ms or 0.0)) / 1000.0
+            metrics["battery_drain"] = {"mean_level": float(battery.mean()),
+                                        "per_beat": drained / beats,
+                                        "per_second": drained / elapsed_s if elapsed_s > 0 else 0.0}
+        return metrics
+
+    def to_prometheus(self, battery: np.ndarray = None, prefix: str = "wolfy_") -> str:
+        """Prometheus text exposition of as_dict()"""
+        metrics = self.as_dict(battery)
+        lines: List[str] = []
+        timing = {"simulated": "simulated message arrival",
+                  "hop_estimate": "estimated as hop count x node latency",
+                  "mixed": "partly estimated as hop count x node latency"}[metrics["timing"]]
+
+        def emit(name: str, kind: str, help_text: str, samples: List[Tuple[str, float]]):
+            lines.append(f"# HELP {prefix}{name} {help_text}")
+            lines.append(f"# TYPE {prefix}{name} {kind}")
+            lines.extend(f"{prefix}{name}{labels} {value}" for labels, value in samples)
+
+        emit("beats_total", "counter", "Beats synchronized", [("", metrics["beats"])])
+        emit("coverage_ratio", "gauge", "Fraction of the crowd taking part",
+             [(f'{{stat="{stat}"}}', value) for stat, value in metrics["coverage"].items()])
+        emit("sync_skew_ms", "gauge", f"Spread between the earliest and latest node of a beat ({timing})",
+             [(f'{{stat="{stat}"}}', value) for stat, value in metrics["sync_skew_ms"].items()])
+        emit("wave_depth_nodes_total", "counter", "Participations per hop depth",
+             [(f'{{depth="{depth}"}}', count) for depth, count in enumerate(metrics["wave_depth_histogram"])])
+
+        cumulative = np.cumsum(self.reach_counts)
+        buckets = [(f'{{le="{edge}"}}', int(cumulative[min(int(round(edge / REACH_BIN_MS)), len(cumulative) - 2)]))
+                   for edge in PROMETHEUS_REACH_BUCKETS]
+        buckets.append(('{le="+Inf"}', int(cumulative[-1])))
+        emit("time_to_reach_ms", "histogram", f"Time from the downbeat until a node gets the beat ({timing})",
+             [("_bucket" + labels, value) for labels, value in buckets] +
+             [("_sum", self.reach_sum_ms), ("_count", int(cumulative[-1]))])
+
+        emit("gateway_load", "gauge",
+             "Participants served per gateway (last beat, max_ever over the show) and rotation spread",
+             [(f'{{stat="{stat}"}}', value) for stat, value in metrics["gateway_load"].items()])
+        if "battery_drain" in metrics:
+            emit("battery_drain", "gauge", "Mean battery level and drain rate",
+                 [(f'{{stat="{stat}"}}', value) for stat, value in metrics["battery_drain"].items()])
+        return "\n".join(lines) + "\n"
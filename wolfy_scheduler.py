@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+⏱️ WOLFY MESSAGE SCHEDULER ⏱️
+Discrete-event propagation of beat messages with per-link latency
+"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from wolfy_mesh_graph import MeshGraph
+
+
+class BucketQueue:
+    """Priority queue of message arrivals, batched per timestamp bucket.
+
+    The heap orders bucket numbers (floor(time / bucket_ms)); each bucket
+    holds the NumPy arrays pushed into it, so one heap operation covers
+    every message landing in the same bucket. Exact arrival times are kept,
+    so ordering inside a bucket is exact as well.
+    """
+
+    def __init__(self, bucket_ms: float):
+        self.bucket_ms = bucket_ms
+        self._heap: List[int] = []
+        self._buckets: Dict[int, List[Tuple[np.ndarray, ...]]] = {}
+
+    def push(self, times: np.ndarray, *columns: np.ndarray) -> None:
+        """Queue messages arriving at times, with aligned payload columns"""
+        if not len(times):
+            return
+        keys = np.floor(times / self.bucket_ms).astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        sorted_columns = [times[order]] + [column[order] for column in columns]
+        cuts = (np.flatnonzero(np.diff(keys)) + 1).tolist()
+        for lo, hi in zip([0] + cuts, cuts + [len(keys)]):
+            key = int(keys[lo])
+            batch = tuple(column[lo:hi] for column in sorted_columns)
+            if key not in self._buckets:
+                self._buckets[key] = []
+                heapq.heappush(self._heap, key)
+            self._buckets[key].append(batch)
+
+    def pop(self) -> Tuple[np.ndarray, ...]:
+        """All messages of the earliest bucket, concatenated: (times, *columns)"""
+        key = heapq.heappop(self._heap)
+        batches = self._buckets.pop(key)
+        if len(batches) == 1:
+            return batches[0]
+        return tuple(np.concatenate(parts) for parts in zip(*batches))
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def link_latency_ms(mesh: MeshGraph, latency_ms: np.ndarray, src: np.ndarray,
+                    slots: np.ndarray) -> np.ndarray:
+    """Delivery time of each link leaving src.
+
+    A send costs the sender's latency_ms, and a link of signal strength s
+    (which falls off linearly with distance) needs 1 / s transmissions on
+    average, so weak, long links are proportionally slower.
+    """
+    return latency_ms[src] / np.maximum(mesh.weights[slots], 1e-3)
+
+
+def propagate_events(mesh: MeshGraph, latency_ms: np.ndarray, sources, decide,
+                     max_depth: int, min_signal: float = 0.3, bucket_ms: float = 0.5,
+                     start_ms: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, int]:
+    """Deliver one beat message from sources through the mesh in time order.
+
+    A node acts on the first message it receives: ``decide(node_ids)``
+    returns which of them participate, and only participants forward the
+    message over links stronger than min_signal, up to max_depth hops.
+    bucket_ms should stay below the smallest link latency, so a bucket never
+    feeds itself.
+
+    Returns ``(participants, depths, arrival_ms, events, layers)`` with
+    participants in arrival order, events the number of messages delivered
+    and layers one more than the deepest hop any node received the message
+    at, whether or not it took part.
+    """
+    reached = np.zeros(mesh.num_nodes, dtype=bool)
+    queue = BucketQueue(bucket_ms)
+    sources = np.unique(np.asarray(sources, dtype=np.int64))
+    queue.push(np.full(len(sources), start_ms), sources, np.zeros(len(sources), dtype=np.int64))
+
+    participants, depths, arrivals = [], [], []
+    events = layers = 0
+    while queue:
+        times, nodes, hops = queue.pop()
+        events += len(times)
+        # First arrival per node wins; later copies are dropped
+        order = np.lexsort((times, nodes))
+        nodes, times, hops = nodes[order], times[order], hops[order]
+        first = np.ones(len(nodes), dtype=bool)
+        first[1:] = nodes[1:] != nodes[:-1]
+        first &= ~reached[nodes]
+        nodes, times, hops = nodes[first], times[first], hops[first]
+        if not len(nodes):
+            continue
+        reached[nodes] = True
+        layers = max(layers, int(hops.max()) + 1)
+
+        active = decide(nodes)
+        nodes, times, hops = nodes[active], times[active], hops[active]
+        participants.append(nodes)
+        depths.append(hops)
+        arrivals.append(times)
+
+        forward = hops + 1 < max_depth
+        nodes, times, hops = nodes[forward], times[forward], hops[forward]
+        slots = mesh.edge_slots(nodes)
+        senders = np.repeat(np.arange(len(nodes)), mesh.indptr[nodes + 1] - mesh.indptr[nodes])
+        strong = mesh.weights[slots] > min_signal
+        slots, senders = slots[strong], senders[strong]
+        targets = mesh.indices[slots].astype(np.int64)
+        fresh = ~reached[targets]
+        slots, senders, targets = slots[fresh], senders[fresh], targets[fresh]
+        delay = link_latency_ms(mesh, latency_ms, nodes[senders], slots)
+        queue.push(times[senders] + delay, targets, hops[senders] + 1)
+
+    if not participants:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.astype(np.int16), np.empty(0), events, layers
+    return (np.concatenate(participants), np.concatenate(depths).astype(np.int16),
+            np.concatenate(arrivals), events, layers)
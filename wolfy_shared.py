@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+🧩 WOLFY SHARED MEMORY 🧩
+Arrays shared across worker processes, and how many workers a pool gets
+"""
+
+import os
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from wolfy_checkpoint import ALIGN
+
+
+def pool_workers(max_workers: Optional[int], tasks: int) -> int:
+    """Worker processes for tasks jobs: max_workers (default: every core), at most one per job"""
+    return min(max_workers or os.cpu_count() or 1, max(tasks, 1))
+
+
+class SharedArrays:
+    """Named arrays in one shared memory block.
+
+    Other processes attach by name from the small picklable ``spec`` and get
+    read-only views, so a pool of any size holds one copy of the data and
+    nothing big is pickled per task.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+        table, offset = {}, 0
+        for name, array in arrays.items():
+            table[name] = (array.dtype.str, array.shape, offset)
+            offset = -(-(offset + array.nbytes) // ALIGN) * ALIGN
+        self.nbytes = offset
+        self._shm = SharedMemory(create=True, size=max(offset, 1))
+        for name, array in arrays.items():
+            dtype, shape, start = table[name]
+            np.ndarray(shape, dtype, self._shm.buf, start)[...] = array
+        self.spec = (self._shm.name, table)
+
+    @staticmethod
+    def attach(spec) -> Tuple[SharedMemory, Dict[str, np.ndarray]]:
+        """(block, read-only views by name) of arrays shared by another process"""
+        name, table = spec
+        shm = SharedMemory(name=name)
+        views = {}
+        for key, (dtype, shape, start) in table.items():
+            views[key] = np.ndarray(shape, dtype, shm.buf, start)
+            views[key].flags.writeable = False
+        return shm, views
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
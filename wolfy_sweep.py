@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+🎛️ WOLFY PARAMETER SWEEP 🎛️
+Grid and random search over ShowConfig knobs, ranked by coverage and latency
+"""
+
+import csv
+import itertools
+import random
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from wolfy_crowd import layout_name
+from wolfy_ensemble import build_venue, run_shows
+from wolfy_mesh_concert import ShowConfig
+from wolfy_shared import pool_workers
+
+CONFIG_FIELDS = tuple(f.name for f in fields(ShowConfig))
+
+# Per-config results, averaged over seeds: name -> key path into get_statistics()
+RESULT_METRICS: Dict[str, Tuple[str, ...]] = {
+    "coverage": ("metrics", "coverage", "mean"),
+    "participation_rate": ("participation_rate",),
+    "reach_p50_ms": ("metrics", "time_to_reach_ms", "p50"),
+    "reach_p90_ms": ("metrics", "time_to_reach_ms", "p90"),
+    "skew_ms": ("metrics", "sync_skew_ms", "mean"),
+    "gateways_used": ("metrics", "gateway_load", "distinct_gateways"),
+}
+
+
+def _valid_config(base: ShowConfig, values: Dict) -> Optional[ShowConfig]:
+    try:
+        return ShowConfig(**dict(asdict(base), **values))
+    except ValueError:
+        return None
+
+
+def grid_configs(base: ShowConfig = ShowConfig(), **axes: Sequence) -> List[ShowConfig]:
+    """Every combination of the given values, e.g. num_gateways=[10, 25, 50].
+
+    Combinations ShowConfig rejects (e.g. max_depth=0) are left out.
+    """
+    names = list(axes)
+    configs = [_valid_config(base, dict(zip(names, combo))) for combo in itertools.product(*axes.values())]
+    skipped = sum(config is None for config in configs)
+    if skipped:
+        print(f"   ⚠️  Skipped {skipped} invalid grid combinations")
+    return [config for config in configs if config is not None]
+
+
+def random_configs(count: int, seed: int = 0, base: ShowConfig = ShowConfig(),
+                   **ranges) -> List[ShowConfig]:
+    """count random configs: a (low, high) tuple draws uniformly (integers
+    when both ends are ints, inclusive), a list draws one of its values.
+    Invalid draws are redrawn.
+    """
+    rng = random.Random(seed)
+
+    def draw(spec):
+        if isinstance(spec, tuple):
+            low, high = spec
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(spec)
+
+    configs: List[ShowConfig] = []
+    for _ in range(count * 100):
+        if len(configs) == count:
+            break
+        config = _valid_config(base, {name: draw(spec) for name, spec in ranges.items()})
+        if config is not None:
+            configs.append(config)
+    return configs
+
+
+def _pareto(coverage: np.ndarray, latency: np.ndarray) -> np.ndarray:
+    """Rows no other row beats on both coverage (higher) and latency (lower)"""
+    better_or_equal = (coverage[None, :] >= coverage[:, None]) & (latency[None, :] <= latency[:, None])
+    strictly = (coverage[None, :] > coverage[:, None]) | (latency[None, :] < latency[:, None])
+    return ~(better_or_equal & strictly).any(axis=1)
+
+
+@dataclass
+class SweepResult:
+    """One row per config: its knobs, seed-averaged RESULT_METRICS, and
+    whether it sits on the coverage/latency Pareto front
+    """
+    rows: List[Dict]
+    wall_seconds: float
+    venues_built: int
+
+    def ranked(self) -> List[Dict]:
+        """Best first: highest coverage, then lowest p90 time-to-reach"""
+        return sorted(self.rows, key=lambda row: (-row["coverage"], row["reach_p90_ms"]))
+
+    def table(self, limit: Optional[int] = 20) -> str:
+        """Ranked results as a fixed-width text table"""
+        columns = ["rank"] + [name for name in CONFIG_FIELDS
+                              if len({row[name] for row in self.rows}) > 1] + list(RESULT_METRICS) + ["pareto"]
+        rows = self.ranked()[:limit]
+        cells = [[str(rank)] + [f"{row[name]:.4g}" if isinstance(row[name], float) else str(row[name])
+                                for name in columns[1:]]
+                 for rank, row in enumerate(rows, 1)]
+        widths = [max(len(name), *(len(line[i]) for line in cells)) if cells else len(name)
+                  for i, name in enumerate(columns)]
+        lines = ["  ".join(name.rjust(width) for name, width in zip(columns, widths))]
+        lines += ["  ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in cells]
+        return "\n".join(lines)
+
+    def to_csv(self, filename: str = "wolfy_sweep.csv") -> None:
+        """Write every ranked row to a CSV file"""
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=["rank", *CONFIG_FIELDS, *RESULT_METRICS, "pareto", "seconds"])
+            writer.writeheader()
+            for rank, row in enumerate(self.ranked(), 1):
+                writer.writerow(dict(row, rank=rank))
+        print(f"🎛️  Sweep results written to {filename}")
+
+
+def run_sweep(configs: Sequence[ShowConfig], num_nodes: int = 17000,
+              arena_size: Tuple[float, float] = (200, 200), venue_seed: int = 0,
+              crowd_layout="clusters", seeds: int = 1, duration_seconds: float = 30.0,
+              bpm: float = 120.0, propagation_engine: str = "frontier",
+              max_workers: Optional[int] = None, venue_cache=None, verbose: bool = False,
+              **show_kwargs) -> SweepResult:
+    """Evaluate every config on the same venue over seeds 0..seeds-1.
+
+    Configs are grouped by ShowConfig.topology(): each distinct mesh is built
+    (or loaded from venue_cache) once and shared by every config that only
+    differs in non-topology knobs. All shows of all groups then go through
+    one process pool. Extra keyword arguments go to every WolfyOrchestrator.
+    """
+    start = time.perf_counter()
+    configs = list(configs)
+    venues, groups = {}, {}
+    for config in configs:
+        key = tuple(sorted(config.topology().items()))
+        if key not in venues:
+            venues[key] = build_venue(num_nodes, arena_size, venue_seed, crowd_layout, config,
+                                      venue_cache, verbose)
+            print(f"   ✓ Venue for {dict(key)}: {venues[key][1].num_edges:,} links")
+        groups[config] = key
+
+    shows = [(groups[config], seed, dict(show_kwargs, arena_size=arena_size, crowd_layout=layout_name(crowd_layout),
+                                         propagation_engine=propagation_engine, config=config))
+             for config in configs for seed in range(seeds)]
+    workers = pool_workers(max_workers, len(shows))
+    print(f"🎛️  Sweep: {len(configs)} configs x {seeds} seed(s) = {len(shows)} shows "
+          f"on {len(venues)} mesh(es) across {workers} worker(s)")
+
+    done = []
+
+    def report(result: Dict) -> None:
+        done.append(result["index"])
+        if len(done) % max(len(shows) // 10, 1) == 0 or len(done) == len(shows):
+            print(f"   🎵 {len(done)}/{len(shows)} shows ({time.perf_counter() - start:.1f}s)")
+
+    results = run_shows(venues, shows, duration_seconds, bpm, workers, verbose, report)
+
+    rows = []
+    for i, config in enumerate(configs):
+        runs = results[i * seeds:(i + 1) * seeds]
+        row = asdict(config)
+        for name, path in RESULT_METRICS.items():
+            values = []
+            for run in runs:
+                value = run["statistics"]
+                for key in path:
+                    value = value[key]
+                values.append(value)
+            row[name] = float(np.mean(values))
+        row["seconds"] = sum(run["seconds"] for run in runs)
+        rows.append(row)
+    front = _pareto(np.array([row["coverage"] for row in rows]), np.array([row["reach_p90_ms"] for row in rows]))
+    for row, on_front in zip(rows, front):
+        row["pareto"] = bool(on_front)
+
+    wall_seconds = time.perf_counter() - start
+    print(f"   ✓ Sweep complete: {len(shows)} shows in {wall_seconds:.1f}s "
+          f"({len(shows) / max(wall_seconds, 1e-9):.2f} shows/s)")
+    return SweepResult(rows, wall_seconds, len(venues))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+🏟️ WOLFY VENUE CACHE 🏟️
+On-disk, content-addressed cache of generated crowds and meshes
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from wolfy_checkpoint import load_checkpoint, save_checkpoint
+from wolfy_mesh_graph import MeshGraph
+
+SUFFIX = ".venue"
+
+
+class VenueCache:
+    """Generated venues (node positions + CSR mesh) keyed by the parameters
+    that produced them.
+
+    Each venue is one checkpoint-format file named by the SHA-256 of its
+    generation parameters, so identical parameters always hit the same
+    file. Hits refresh the file's mtime; after each store the least
+    recently used venues are evicted until the cache fits in max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 << 30):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(params: Dict) -> str:
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    def path(self, params: Dict) -> str:
+        return os.path.join(self.directory, self.key(params) + SUFFIX)
+
+    def get(self, params: Dict) -> Optional[Tuple[np.ndarray, MeshGraph]]:
+        """(positions, mesh) of a cached venue, or None"""
+        path = self.path(params)
+        try:
+            header, arrays = load_checkpoint(path)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+        if header.get("params") != params:
+            # Only a hash collision or a hand-edited file can get here
+            self.stats["misses"] += 1
+            return None
+        os.utime(path)
+        self.stats["hits"] += 1
+        return arrays["positions"], MeshGraph(arrays["mesh.indptr"], arrays["mesh.indices"],
+                                              arrays["mesh.weights"])
+
+    def put(self, params: Dict, positions: np.ndarray, mesh: MeshGraph) -> str:
+        """Store a venue, then evict down to max_bytes; returns its path"""
+        path = self.path(params)
+        save_checkpoint(path, {"params": params}, {
+            "positions": positions, "mesh.indptr": mesh.indptr,
+            "mesh.indices": mesh.indices, "mesh.weights": mesh.weights})
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Drop least recently used venues until the total fits max_bytes"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(self.directory, name)))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+            self.stats["evictions"] += 1
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(os.path.getsize(os.path.join(self.directory, name))
+                   for name in os.listdir(self.directory) if name.endswith(SUFFIX))
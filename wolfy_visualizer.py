@@ -7,9 +7,145 @@ Creates beautiful visual diagrams of the mesh network concert
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.patches import Circle, FancyBboxPatch
+from matplotlib.collections import LineCollection
+import matplotlib.colors as mcolors
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Iterator, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import json
+import pickle
+import time
+
+from wolfy_archive import ConcertArchive
+from wolfy_history import ParticipationHistory
+from wolfy_mesh_concert import NODE_STATES, STATE_CODES, MusicEngine, NodeState, NodeStore
+from wolfy_mesh_graph import MeshGraph
+from wolfy_raster import iter_tiles, render_crowd
+from wolfy_shared import SharedArrays, pool_workers
+
+
+@dataclass(frozen=True)
+class VisualizationSnapshot:
+    """Read-only stand-in for the orchestrator with just what the figures read.
+
+    Every figure sees the same instant of the show while the orchestrator
+    carries on. For worker processes, share() puts the node columns, mesh
+    and participation history in shared memory and returns a small
+    SharedSnapshotSpec to send to each task instead.
+    """
+    nodes: object
+    participation_history: object
+    gateways: frozenset
+    conductor_id: int
+    arena_size: Tuple[float, float]
+    current_theme: object
+    beat_count: int
+    event_counts: Dict[str, int]
+    statistics: Dict
+    
+    # The NodeStore columns the figures and beat frames read
+    NODE_FIELDS = ("positions", "state", "battery", "participation_score", "light_handle")
+    
+    @classmethod
+    def capture(cls, wolfy) -> "VisualizationSnapshot":
+        return cls(nodes=wolfy.nodes,
+                   participation_history=wolfy.participation_history,
+                   gateways=frozenset(wolfy.gateways),
+                   conductor_id=wolfy.conductor_id,
+                   arena_size=tuple(wolfy.arena_size),
+                   current_theme=wolfy.current_theme,
+                   beat_count=wolfy.beat_count,
+                   event_counts=dict(wolfy.event_counts),
+                   statistics=wolfy.get_statistics())
+    
+    @property
+    def mesh(self):
+        return self.nodes.mesh
+    
+    def get_statistics(self) -> Dict:
+        return self.statistics
+    
+    def share(self) -> Tuple[SharedArrays, "SharedSnapshotSpec"]:
+        """(shared block, spec) for render workers; close the block once they finish"""
+        arrays = {f"nodes.{name}": getattr(self.nodes, name) for name in self.NODE_FIELDS}
+        arrays.update({"mesh.indptr": self.mesh.indptr, "mesh.indices": self.mesh.indices,
+                       "mesh.weights": self.mesh.weights})
+        arrays.update({f"history.{name}": array
+                       for name, array in self.participation_history.to_arrays().items()})
+        block = SharedArrays(arrays)
+        spec = SharedSnapshotSpec(block=block.spec, light_table=self.nodes.light_table,
+                                  keyframe_interval=self.participation_history.keyframe_interval,
+                                  gateways=self.gateways, conductor_id=self.conductor_id,
+                                  arena_size=self.arena_size, current_theme=self.current_theme,
+                                  beat_count=self.beat_count, event_counts=self.event_counts,
+                                  statistics=self.statistics)
+        return block, spec
+
+
+@dataclass(frozen=True)
+class SharedSnapshotSpec:
+    """Picklable handle on a shared VisualizationSnapshot: the shared block's
+    spec, the small pieces that stay out of it, and the snapshot's scalars"""
+    block: tuple
+    light_table: object
+    keyframe_interval: int
+    gateways: frozenset
+    conductor_id: int
+    arena_size: Tuple[float, float]
+    current_theme: object
+    beat_count: int
+    event_counts: Dict[str, int]
+    statistics: Dict
+    
+    def attach(self) -> VisualizationSnapshot:
+        """Rebuild the snapshot in a worker, cached per shared block"""
+        name = self.block[0]
+        if name not in _worker_snapshots:
+            shm, views = SharedArrays.attach(self.block)
+            nodes = NodeStore(np.empty((0, 2)))
+            for field in VisualizationSnapshot.NODE_FIELDS:
+                setattr(nodes, field, views[f"nodes.{field}"])
+            nodes.mesh = MeshGraph(views["mesh.indptr"], views["mesh.indices"], views["mesh.weights"])
+            nodes.light_table = self.light_table
+            history = ParticipationHistory.from_arrays(
+                {key[len("history."):]: view for key, view in views.items() if key.startswith("history.")},
+                self.keyframe_interval)
+            snapshot = VisualizationSnapshot(
+                nodes=nodes, participation_history=history, gateways=self.gateways,
+                conductor_id=self.conductor_id, arena_size=self.arena_size,
+                current_theme=self.current_theme, beat_count=self.beat_count,
+                event_counts=self.event_counts, statistics=self.statistics)
+            _worker_snapshots[name] = (shm, snapshot)
+        return _worker_snapshots[name][1]
+
+
+# Snapshots this worker process has attached to, by shared memory block name
+_worker_snapshots: Dict[str, Tuple[object, VisualizationSnapshot]] = {}
+
+
+# The figures generate_all_visualizations renders, in order
+ALL_FIGURES = (
+    "create_network_snapshot",
+    "create_participation_heatmap",
+    "create_gateway_network_diagram",
+    "create_statistics_dashboard",
+)
+
+
+def _render_figure(spec: SharedSnapshotSpec, figure: str) -> Tuple[str, float]:
+    """Process-pool entry point: attach to the shared snapshot and draw one figure"""
+    plt.switch_backend('Agg')
+    start = time.perf_counter()
+    getattr(WolfyVisualizer(spec.attach()), figure)()
+    return figure, time.perf_counter() - start
+
+
+def _render_beat_frames(spec: SharedSnapshotSpec, stem: str, start: int, stop: int,
+                        trail_beats: int, dpi: int) -> List[str]:
+    """Process-pool entry point: attach to the shared snapshot and write one run of frames"""
+    plt.switch_backend('Agg')
+    return WolfyVisualizer(spec.attach())._save_beat_frames(stem, start, stop, trail_beats, dpi)
 
 
 class WolfyVisualizer:
@@ -21,62 +157,40 @@ class WolfyVisualizer:
         self.axes = None
         
     def create_network_snapshot(self, filename: str = "wolfy_network_snapshot.png", 
-                               sample_size: int = 500):
-        """Create a static snapshot of the mesh network"""
-        print(f"🎨 Creating network visualization (sampling {sample_size} nodes for clarity)...")
-        
-        # Sample nodes for visualization (17k is too many to see clearly)
-        sampled_indices = np.random.choice(len(self.wolfy.nodes), 
-                                          min(sample_size, len(self.wolfy.nodes)), 
-                                          replace=False)
-        sampled_nodes = [self.wolfy.nodes[i] for i in sampled_indices]
-        sampled_ids = {n.id for n in sampled_nodes}
+                               sample_size: Optional[int] = 500):
+        """Create a static snapshot of the mesh network (sample_size=None draws every node)"""
+        nodes = self.wolfy.nodes
+        if sample_size is None or sample_size >= len(nodes):
+            print(f"🎨 Creating network visualization (all {len(nodes):,} nodes)...")
+            sampled_ids = np.arange(len(nodes))
+        else:
+            print(f"🎨 Creating network visualization (sampling {sample_size} nodes for clarity)...")
+            # Sample nodes for visualization (17k is too many to see clearly)
+            sampled_ids = np.sort(np.random.choice(len(nodes), sample_size, replace=False))
         
         fig, ax = plt.subplots(figsize=(16, 12))
         fig.patch.set_facecolor('#0a0a0a')
         ax.set_facecolor('#0a0a0a')
         
-        # Draw connections first (so they're behind nodes)
+        # Draw connections first (so they're behind nodes) as a single collection
         print("   Drawing connections...")
-        for node in sampled_nodes:
-            for neighbor_id in node.neighbors:
-                if neighbor_id in sampled_ids:
-                    neighbor = self.wolfy.nodes[neighbor_id]
-                    signal_strength = node.signal_strength.get(neighbor_id, 0.5)
-                    ax.plot([node.position[0], neighbor.position[0]],
-                           [node.position[1], neighbor.position[1]],
-                           color='cyan', alpha=signal_strength * 0.15, 
-                           linewidth=0.3, zorder=1)
-        
-        # Draw nodes
+        src, dst, signal_strength = self._sampled_edges(sampled_ids)
+        segments = np.stack([nodes.positions[src], nodes.positions[dst]], axis=1)
+        edge_colors = np.tile(np.array(mcolors.to_rgba('cyan')), (len(src), 1))
+        # Each link used to be drawn once from each end; keep the same combined opacity
+        edge_colors[:, 3] = 1.0 - (1.0 - signal_strength * 0.15) ** 2
+        ax.add_collection(LineCollection(segments, colors=edge_colors, linewidths=0.3, zorder=1))
+        
+        # Draw nodes, one scatter per marker class
         print("   Drawing nodes...")
-        for node in sampled_nodes:
-            # Color based on state and participation
-            if node.state.value == "conductor":
-                color = '#FFD700'  # Gold
-                size = 120
-                marker = '*'
-            elif node.state.value == "gateway":
-                color = '#FF6B6B'  # Red
-                size = 60
-                marker = 'o'
-            else:
-                # Color based on participation
-                participation_normalized = min(node.participation_score / 20.0, 1.0)
-                color = plt.cm.plasma(participation_normalized)
-                size = 20 + participation_normalized * 30
-                marker = 'o'
-            
-            # Light effect
-            if node.current_light:
-                brightness = node.current_light.intensity
-                r, g, b = node.current_light.color
-                color = (r/255.0 * brightness, g/255.0 * brightness, b/255.0 * brightness)
-            
-            ax.scatter(node.position[0], node.position[1], 
-                      c=[color], s=size, marker=marker, 
-                      edgecolors='white', linewidths=0.5,
-                      alpha=0.8, zorder=2)
+        colors, sizes = self._node_style(sampled_ids)
+        conductor = nodes.state[sampled_ids] == STATE_CODES[NodeState.CONDUCTOR]
+        for mask, marker in ((~conductor, 'o'), (conductor, '*')):
+            if mask.any():
+                ax.scatter(nodes.positions[sampled_ids[mask], 0], nodes.positions[sampled_ids[mask], 1],
+                           c=colors[mask], s=sizes[mask], marker=marker,
+                           edgecolors='white', linewidths=0.5,
+                           alpha=0.8, zorder=2)
         
         # Add title and labels
         ax.set_xlim(-5, self.wolfy.arena_size[0] + 5)
@@ -88,7 +202,7 @@ class WolfyVisualizer:
         
         # Title with Wolf energy
         title = f"🐺 WOLFY'S MESH CONCERT 🐺\n"
-        title += f"Network Snapshot: {len(sampled_nodes)} of {len(self.wolfy.nodes):,} nodes\n"
+        title += f"Network Snapshot: {len(sampled_ids):,} of {len(self.wolfy.nodes):,} nodes\n"
         title += f"Theme: {self.wolfy.current_theme.value} | Beat: {self.wolfy.beat_count}"
         ax.set_title(title, color='white', fontsize=16, fontweight='bold', pad=20)
         
@@ -112,6 +226,105 @@ class WolfyVisualizer:
         print(f"   ✓ Network snapshot saved to {filename}")
         plt.close()
     
+    def _sampled_edges(self, node_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Each mesh link between two of the given nodes once: (src, dst, signal strength)"""
+        mesh = self.wolfy.mesh
+        keep = np.zeros(len(self.wolfy.nodes), dtype=bool)
+        keep[node_ids] = True
+        slots = mesh.edge_slots(node_ids)
+        src = np.repeat(node_ids, mesh.degree()[node_ids])
+        dst = mesh.indices[slots]
+        once = keep[dst] & (src < dst)
+        return src[once], dst[once], mesh.weights[slots][once]
+    
+    def _node_style(self, node_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized node colors (RGBA) and marker sizes, by state, participation and light"""
+        nodes = self.wolfy.nodes
+        state = nodes.state[node_ids]
+        participation_normalized = np.minimum(nodes.participation_score[node_ids] / 20.0, 1.0)
+        
+        # Color based on state and participation
+        colors = plt.cm.plasma(participation_normalized)
+        sizes = 20 + participation_normalized * 30
+        gateway = state == STATE_CODES[NodeState.GATEWAY]
+        conductor = state == STATE_CODES[NodeState.CONDUCTOR]
+        colors[gateway] = mcolors.to_rgba('#FF6B6B')  # Red
+        sizes[gateway] = 60
+        colors[conductor] = mcolors.to_rgba('#FFD700')  # Gold
+        sizes[conductor] = 120
+        
+        # Light effect: nodes showing a light take its color scaled by intensity
+        handles = nodes.light_handle[node_ids]
+        lit = handles >= 0
+        if lit.any():
+            table = nodes.light_table.patterns
+            light_rgb = np.array([[c / 255.0 * p.intensity for c in p.color] for p in table])
+            colors[lit, :3] = light_rgb[handles[lit]]
+            colors[lit, 3] = 1.0
+        return colors, sizes
+    
+    def create_density_raster(self, filename: str = "wolfy_density_raster.png",
+                              meters_per_pixel: float = 0.1, exposure: float = 1.5,
+                              tile_px: Optional[int] = None) -> List[str]:
+        """Render every node and link into an additive image buffer (no sampling).
+
+        Cost is O(nodes + edge pixels) rather than one matplotlib artist per
+        element. With tile_px the arena is split into tiles written as
+        ``<name>_r<row>_c<col>.png``; returns the files written.
+        """
+        nodes = self.wolfy.nodes
+        print(f"🌌 Creating density raster ({len(nodes):,} nodes, {meters_per_pixel} m/pixel)...")
+        bounds = (-5.0, -5.0, self.wolfy.arena_size[0] + 5.0, self.wolfy.arena_size[1] + 5.0)
+        edges = self._sampled_edges(np.arange(len(nodes)))
+        node_rgb = self._node_glow()
+        
+        if tile_px is None:
+            raster = render_crowd(bounds, meters_per_pixel, nodes.positions, node_rgb, edges)
+            height, width = raster.image.shape[:2]
+            fig, ax = plt.subplots(figsize=(width / 150 + 1, height / 150 + 1))
+            fig.patch.set_facecolor('#0a0a0a')
+            ax.imshow(raster.to_rgb(exposure), extent=raster.extent, origin='lower',
+                      interpolation='nearest')
+            ax.set_xlabel('X Position (meters)', color='white', fontsize=12)
+            ax.set_ylabel('Y Position (meters)', color='white', fontsize=12)
+            ax.tick_params(colors='white')
+            title = f"🐺 WOLFY'S MESH CONCERT 🐺\n"
+            title += f"Density Raster: all {len(nodes):,} nodes, {len(edges[0]):,} links\n"
+            title += f"Theme: {self.wolfy.current_theme.value} | Beat: {self.wolfy.beat_count}"
+            ax.set_title(title, color='white', fontsize=16, fontweight='bold', pad=20)
+            plt.tight_layout()
+            plt.savefig(filename, dpi=150, facecolor='#0a0a0a')
+            plt.close()
+            print(f"   ✓ Density raster saved to {filename}")
+            return [filename]
+        
+        # Tiles are written pixel-for-pixel without axes, ready to be stitched
+        stem, ext = filename.rsplit('.', 1) if '.' in filename else (filename, 'png')
+        written = []
+        for row, col, tile_bounds in iter_tiles(bounds, meters_per_pixel, tile_px):
+            raster = render_crowd(tile_bounds, meters_per_pixel, nodes.positions, node_rgb, edges)
+            tile_file = f"{stem}_r{row}_c{col}.{ext}"
+            plt.imsave(tile_file, raster.to_rgb(exposure), origin='lower')
+            written.append(tile_file)
+        print(f"   ✓ Density raster saved as {len(written)} tiles ({stem}_r*_c*.{ext})")
+        return written
+    
+    def _node_glow(self) -> np.ndarray:
+        """Additive RGB weight of every node: its light, else a dim theme color"""
+        nodes = self.wolfy.nodes
+        theme_rgb = np.array(MusicEngine.THEME_COLORS.get(self.wolfy.current_theme, (255, 255, 255))) / 255.0
+        glow = np.tile(theme_rgb * 0.15, (len(nodes), 1)).astype(np.float32)
+        
+        handles = nodes.light_handle
+        lit = handles >= 0
+        if lit.any():
+            table = nodes.light_table.patterns
+            light_rgb = np.array([[c / 255.0 * p.intensity for c in p.color] for p in table])
+            glow[lit] = light_rgb[handles[lit]]
+        glow[nodes.state == STATE_CODES[NodeState.GATEWAY]] = mcolors.to_rgb('#FF6B6B')
+        glow[nodes.state == STATE_CODES[NodeState.CONDUCTOR]] = np.array(mcolors.to_rgb('#FFD700')) * 4
+        return glow
+    
     def create_participation_heatmap(self, filename: str = "wolfy_heatmap.png"):
         """Create a heatmap showing node participation over time"""
         print("🔥 Creating participation heatmap...")
@@ -127,9 +340,9 @@ class WolfyVisualizer:
         ax1.set_facecolor('#0a0a0a')
         
         # Create 2D histogram of participation
-        x_coords = [n.position[0] for n in self.wolfy.nodes]
-        y_coords = [n.position[1] for n in self.wolfy.nodes]
-        participation = [n.participation_score for n in self.wolfy.nodes]
+        x_coords = self.wolfy.nodes.positions[:, 0]
+        y_coords = self.wolfy.nodes.positions[:, 1]
+        participation = self.wolfy.nodes.participation_score
         
         # Create heatmap
         heatmap, xedges, yedges = np.histogram2d(
@@ -156,8 +369,8 @@ class WolfyVisualizer:
         ax2.set_facecolor('#0a0a0a')
         
         # Calculate participation over time
-        time_points = list(range(len(self.wolfy.participation_history)))
-        active_counts = [len(snapshot) for snapshot in self.wolfy.participation_history]
+        active_counts = self.wolfy.participation_history.active_counts()
+        time_points = np.arange(len(active_counts))
         
         ax2.fill_between(time_points, active_counts, alpha=0.6, color='#FF6B6B')
         ax2.plot(time_points, active_counts, color='#FFD700', linewidth=2)
@@ -195,14 +408,15 @@ class WolfyVisualizer:
         gateway_nodes = [self.wolfy.nodes[gw_id] for gw_id in self.wolfy.gateways]
         
         # Draw all nodes as small dots
-        all_x = [n.position[0] for n in self.wolfy.nodes]
-        all_y = [n.position[1] for n in self.wolfy.nodes]
+        all_x = self.wolfy.nodes.positions[:, 0]
+        all_y = self.wolfy.nodes.positions[:, 1]
         ax.scatter(all_x, all_y, c='white', s=1, alpha=0.1, zorder=1)
         
         # Draw gateway connections
+        mesh = self.wolfy.mesh
         for i, gw1 in enumerate(gateway_nodes):
             for gw2 in gateway_nodes[i+1:]:
-                if gw2.id in gw1.neighbors:
+                if mesh.edge_weight(gw1.id, gw2.id) is not None:
                     ax.plot([gw1.position[0], gw2.position[0]],
                            [gw1.position[1], gw2.position[1]],
                            color='#FF6B6B', alpha=0.6, linewidth=2, zorder=2)
@@ -268,9 +482,8 @@ class WolfyVisualizer:
         ax2 = fig.add_subplot(gs[1, 0])
         ax2.set_facecolor('#0a0a0a')
         
-        state_counts = {}
-        for node in self.wolfy.nodes:
-            state_counts[node.state.value] = state_counts.get(node.state.value, 0) + 1
+        codes, counts = np.unique(self.wolfy.nodes.state, return_counts=True)
+        state_counts = {NODE_STATES[code].value: int(count) for code, count in zip(codes, counts)}
         
         colors = ['#FFD700', '#FF6B6B', '#00FFFF', '#FF00FF', '#808080']
         wedges, texts, autotexts = ax2.pie(state_counts.values(), 
@@ -291,7 +504,8 @@ class WolfyVisualizer:
         ax3 = fig.add_subplot(gs[1, 1])
         ax3.set_facecolor('#0a0a0a')
         
-        participation_scores = [n.participation_score for n in self.wolfy.nodes if n.participation_score > 0]
+        participation_scores = self.wolfy.nodes.participation_score
+        participation_scores = participation_scores[participation_scores > 0]
         ax3.hist(participation_scores, bins=30, color='#FF6B6B', alpha=0.7, edgecolor='white')
         ax3.set_xlabel('Participation Score', color='white')
         ax3.set_ylabel('Number of Nodes', color='white')
@@ -303,7 +517,7 @@ class WolfyVisualizer:
         ax4 = fig.add_subplot(gs[1, 2])
         ax4.set_facecolor('#0a0a0a')
         
-        battery_levels = [n.battery for n in self.wolfy.nodes]
+        battery_levels = self.wolfy.nodes.battery
         ax4.hist(battery_levels, bins=20, color='#00FF00', alpha=0.7, edgecolor='white')
         ax4.set_xlabel('Battery Level', color='white')
         ax4.set_ylabel('Number of Nodes', color='white')
@@ -315,7 +529,7 @@ class WolfyVisualizer:
         ax5 = fig.add_subplot(gs[2, 0])
         ax5.set_facecolor('#0a0a0a')
         
-        neighbor_counts = [len(n.neighbors) for n in self.wolfy.nodes]
+        neighbor_counts = self.wolfy.nodes.degree()
         ax5.hist(neighbor_counts, bins=30, color='#00FFFF', alpha=0.7, edgecolor='white')
         ax5.set_xlabel('Number of Neighbors', color='white')
         ax5.set_ylabel('Number of Nodes', color='white')
@@ -327,9 +541,7 @@ class WolfyVisualizer:
         ax6 = fig.add_subplot(gs[2, 1:])
         ax6.set_facecolor('#0a0a0a')
         
-        event_types = {}
-        for event in self.wolfy.event_log:
-            event_types[event['type']] = event_types.get(event['type'], 0) + 1
+        event_types = self.wolfy.event_counts
         
         if event_types:
             ax6.barh(list(event_types.keys()), list(event_types.values()), 
@@ -343,14 +555,185 @@ class WolfyVisualizer:
         print(f"   ✓ Statistics dashboard saved to {filename}")
         plt.close()
     
-    def generate_all_visualizations(self):
-        """Generate all visualizations at once"""
+    def create_battery_timeline(self, archive_path: str, filename: str = "wolfy_battery_timeline.png",
+                                start: int = 0, stop: int = None):
+        """Plot battery drain and participation for a beat range of a saved archive"""
+        print(f"🔋 Creating battery timeline from {archive_path}...")
+        
+        # Only the battery and participant_count chunks covering the range are read
+        archive = ConcertArchive(archive_path)
+        battery = archive.read("battery", start, stop)
+        counts = archive.read("participant_count", start, stop)
+        if len(counts) == 0:
+            print("   ⚠️  No archived beats in that range")
+            return
+        beats = np.arange(start, start + len(counts))
+        
+        fig, ax1 = plt.subplots(figsize=(14, 6))
+        fig.patch.set_facecolor('#0a0a0a')
+        ax1.set_facecolor('#0a0a0a')
+        
+        ax1.fill_between(beats, np.percentile(battery, 5, axis=1), np.percentile(battery, 95, axis=1),
+                         color='#00FF00', alpha=0.2)
+        ax1.plot(beats, battery.mean(axis=1), color='#00FF00', linewidth=2)
+        ax1.set_xlabel('Beat Number', color='white', fontsize=12)
+        ax1.set_ylabel('Battery Level (mean, 5-95%)', color='white', fontsize=12)
+        ax1.tick_params(colors='white')
+        ax1.grid(True, alpha=0.2, color='white')
+        
+        ax2 = ax1.twinx()
+        ax2.plot(beats, counts, color='#FFD700', linewidth=1.5, alpha=0.8)
+        ax2.set_ylabel('Active Nodes', color='#FFD700', fontsize=12)
+        ax2.tick_params(colors='white')
+        
+        ax1.set_title('🔋 Battery Drain vs Participation 🔋', color='white', fontsize=14, fontweight='bold')
+        plt.tight_layout()
+        plt.savefig(filename, dpi=150, facecolor='#0a0a0a')
+        print(f"   ✓ Battery timeline saved to {filename}")
+        plt.close()
+    
+    def create_beat_animation(self, filename: str = "wolfy_wave.gif", fps: int = 8,
+                              trail_beats: int = 4, dpi: int = 100,
+                              max_workers: Optional[int] = 1) -> List[str]:
+        """Animate the wave beat by beat from the recorded participation history.
+
+        One figure is kept alive and only the node colors change per frame:
+        participants light up and fade out over trail_beats beats. ``.gif``
+        and ``.mp4`` go through a matplotlib animation writer (mp4 needs
+        ffmpeg); a ``.png`` filename writes ``<name>_<beat>.png`` frames,
+        split across up to ``max_workers`` processes (None: every core).
+        Returns the files written.
+        """
+        history = self.wolfy.participation_history
+        print(f"🎬 Creating beat animation ({len(history)} beats, {len(self.wolfy.nodes):,} nodes)...")
+        if not history:
+            print("   ⚠️  No participation history to animate")
+            return []
+        
+        start = time.perf_counter()
+        stem, ext = filename.rsplit('.', 1) if '.' in filename else (filename, 'png')
+        ext = ext.lower()
+        if ext == 'mp4' and not animation.writers.is_available('ffmpeg'):
+            print("   ⚠️  ffmpeg not available, writing PNG frames instead")
+            ext = 'png'
+        
+        if ext == 'png':
+            workers = pool_workers(max_workers, len(history))
+            if workers > 1:
+                shared, spec = VisualizationSnapshot.capture(self.wolfy).share()
+                cuts = np.linspace(0, len(history), workers + 1).astype(int)
+                with shared, ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_render_beat_frames, spec, stem, int(a), int(b), trail_beats, dpi)
+                               for a, b in zip(cuts[:-1], cuts[1:]) if b > a]
+                    written = [frame for future in futures for frame in future.result()]
+            else:
+                written = self._save_beat_frames(stem, 0, len(history), trail_beats, dpi)
+            print(f"   ✓ {len(written)} frames saved as {stem}_*.png "
+                  f"({time.perf_counter() - start:.1f}s, {workers} worker(s))")
+            return written
+        
+        writer = animation.PillowWriter(fps=fps) if ext == 'gif' else animation.FFMpegWriter(fps=fps)
+        frames = self._beat_frames(0, len(history), trail_beats, dpi)
+        _, fig = next(frames)
+        with writer.saving(fig, filename, dpi):
+            writer.grab_frame()
+            for _ in frames:
+                writer.grab_frame()
+        print(f"   ✓ Beat animation saved to {filename} ({time.perf_counter() - start:.1f}s)")
+        return [filename]
+    
+    def _save_beat_frames(self, stem: str, start: int, stop: int, trail_beats: int, dpi: int) -> List[str]:
+        """Write beats start..stop-1 as numbered PNG frames"""
+        written = []
+        for beat, fig in self._beat_frames(start, stop, trail_beats, dpi):
+            frame_file = f"{stem}_{beat:04d}.png"
+            # Fast zlib level: frames are intermediates, encoding dominated the cost
+            fig.savefig(frame_file, dpi=dpi, facecolor='#0a0a0a', pil_kwargs={"compress_level": 1})
+            written.append(frame_file)
+        return written
+    
+    def _beat_frames(self, start: int, stop: int, trail_beats: int,
+                     dpi: int) -> Iterator[Tuple[int, plt.Figure]]:
+        """Draw beats start..stop-1 on one reused figure, yielding (beat, figure) after each.
+
+        The mesh is a density raster drawn once; per beat only the node
+        scatter's face colors and the title are updated. Replay starts
+        trail_beats early so a run of frames fades exactly like a full pass.
+        """
+        nodes = self.wolfy.nodes
+        history = self.wolfy.participation_history
+        bounds = (-5.0, -5.0, self.wolfy.arena_size[0] + 5.0, self.wolfy.arena_size[1] + 5.0)
+        
+        fig, ax = plt.subplots(figsize=(10, 10))
+        fig.patch.set_facecolor('#0a0a0a')
+        ax.set_facecolor('#0a0a0a')
+        try:
+            meters_per_pixel = (bounds[2] - bounds[0]) / (fig.get_figwidth() * dpi * 0.8)
+            mesh = render_crowd(bounds, meters_per_pixel, nodes.positions, np.zeros(3),
+                                self._sampled_edges(np.arange(len(nodes))), glow_sigma_px=0.0)
+            ax.imshow(mesh.to_rgb(1.5), extent=mesh.extent, origin='lower',
+                      interpolation='nearest', zorder=0)
+            
+            colors = np.zeros((len(nodes), 4))
+            size = float(np.clip(4e4 / max(len(nodes), 1), 1.0, 20.0))
+            scatter = ax.scatter(nodes.positions[:, 0], nodes.positions[:, 1], c=colors, s=size,
+                                 edgecolors='none', zorder=2)
+            ax.set_xlim(bounds[0], bounds[2])
+            ax.set_ylim(bounds[1], bounds[3])
+            ax.set_xlabel('X Position (meters)', color='white', fontsize=12)
+            ax.set_ylabel('Y Position (meters)', color='white', fontsize=12)
+            ax.tick_params(colors='white')
+            title = ax.set_title("", color='white', fontsize=14, fontweight='bold')
+            plt.tight_layout()
+            
+            last_seen = np.full(len(nodes), -trail_beats - 1, dtype=np.int64)
+            for beat, ids, scores in history.replay(max(0, start - trail_beats), stop):
+                last_seen[ids] = beat
+                if beat < start:
+                    continue
+                glow = np.clip(1.0 - (beat - last_seen) / trail_beats, 0.0, 1.0)
+                colors = plt.cm.plasma(np.minimum(scores / 20.0, 1.0))
+                colors[:, 3] = 0.08 + 0.92 * glow
+                scatter.set_facecolors(colors)
+                title.set_text(f"Beat {beat + 1}/{len(history)} | {len(ids):,} nodes active")
+                yield beat, fig
+        finally:
+            plt.close(fig)
+    
+    def generate_all_visualizations(self, parallel: bool = False,
+                                    max_workers: Optional[int] = None) -> Dict[str, float]:
+        """Generate all visualizations at once; returns seconds per figure.
+        
+        With parallel=True the orchestrator state is captured once into a
+        shared VisualizationSnapshot and each figure is drawn in its own
+        worker process (Agg backend). That only pays off with spare cores:
+        worker start-up and matplotlib imports cost more than the figures
+        on a single core, so the default stays serial.
+        """
         print("\n🎨 GENERATING ALL VISUALIZATIONS 🎨\n")
-        self.create_network_snapshot()
-        self.create_participation_heatmap()
-        self.create_gateway_network_diagram()
-        self.create_statistics_dashboard()
+        start = time.perf_counter()
+        timings: Dict[str, float] = {}
+        if parallel:
+            shared, spec = VisualizationSnapshot.capture(self.wolfy).share()
+            workers = pool_workers(max_workers, len(ALL_FIGURES))
+            print(f"   Snapshot: {shared.nbytes / 1e6:.1f} MB shared, {len(pickle.dumps(spec)) / 1e3:.1f} kB per task, "
+                  f"{workers} worker processes")
+            with shared, ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_figure, spec, figure) for figure in ALL_FIGURES]
+                timings.update(future.result() for future in futures)
+        else:
+            for figure in ALL_FIGURES:
+                figure_start = time.perf_counter()
+                getattr(self, figure)()
+                timings[figure] = time.perf_counter() - figure_start
+        wall = time.perf_counter() - start
+        
+        print("\n⏱️  Render timings:")
+        for figure, seconds in timings.items():
+            print(f"   {figure:<32} {seconds:7.2f}s")
+        print(f"   {'wall clock':<32} {wall:7.2f}s")
         print("\n✨ All visualizations complete! ✨\n")
+        return timings
 
 
 if __name__ == "__main__":